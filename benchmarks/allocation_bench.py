@@ -0,0 +1,87 @@
+"""
+Көп қоймалы қалдық бенчмаркы: батчтық қолжетімділік және жөнелтімдерді жоспарлау.
+
+    python benchmarks/allocation_bench.py --lines 300 --warehouses 40 --carts 100
+
+Салыстыру: жол × қойма бойынша жеке сұраныстар мен бір батчтық availability(),
+таза Python мен numpy жоспарлаушысы, және әр жолды бірінші табылған қоймадан алатын
+қарапайым тәсілмен салыстырғандағы жөнелтімдер саны.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markstore.warehouses import StockLedger, Warehouse, _greedy_numpy, _greedy_python
+
+def synthetic_ledger(products: int, warehouses: int, rng: random.Random) -> StockLedger:
+    ledger = StockLedger([Warehouse(i + 1, f"WH-{i + 1}", f"Қала {i + 1}") for i in range(warehouses)])
+    rows = {}
+    for pid in range(1, products + 1):
+        row = [0] * warehouses
+        for w in rng.sample(range(warehouses), rng.randint(1, min(8, warehouses))):
+            row[w] = rng.randint(5, 60)
+        rows[pid] = row
+    ledger._rows = rows
+    return ledger
+
+def first_fit_shipments(need, available) -> int:
+    """Қарапайым тәсіл: әр жол кезекпен, бірінші қалдығы бар қоймадан"""
+    used = set()
+    for q, row in zip(need, available):
+        for w, a in enumerate(row):
+            if q <= 0:
+                break
+            if a > 0:
+                used.add(w)
+                q -= min(a, q)
+    return len(used)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--warehouses", type=int, default=40)
+    parser.add_argument("--lines", type=int, default=300, help="себеттегі жолдар саны")
+    parser.add_argument("--carts", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    ledger = synthetic_ledger(args.products, args.warehouses, rng)
+    carts = [[{"product_id": pid, "quantity": rng.randint(1, 5)}
+              for pid in rng.sample(range(1, args.products + 1), args.lines)] for _ in range(args.carts)]
+    print(f"{args.products:,} өнім, {args.warehouses} қойма, {args.carts} себет × {args.lines} жол")
+
+    ids = [[i["product_id"] for i in cart] for cart in carts]
+    t0 = time.perf_counter()
+    for cart in ids:
+        [[ledger.quantities(pid)[w.id] for w in ledger.warehouses] for pid in cart]
+    naive = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    matrices = [ledger.availability(cart) for cart in ids]
+    batched = time.perf_counter() - t0
+    print(f"қолжетімділік: жеке сұраныстар {1000 * naive / args.carts:8.2f} ms/себет, "
+          f"батч {1000 * batched / args.carts:6.2f} ms/себет")
+
+    needs = [[i["quantity"] for i in cart] for cart in carts]
+    results = {}
+    for label, greedy in (("таза Python", _greedy_python), ("numpy", _greedy_numpy)):
+        t0 = time.perf_counter()
+        results[label] = [greedy(list(need), matrix, args.warehouses) for need, matrix in zip(needs, matrices)]
+        print(f"жоспарлаушы ({label}): {1000 * (time.perf_counter() - t0) / args.carts:8.2f} ms/себет")
+    assert results["numpy"] == results["таза Python"], "жоспарлар сәйкес келмеді"
+
+    t0 = time.perf_counter()
+    plans = [ledger.plan(cart) for cart in carts]
+    print(f"StockLedger.plan толық жолы: {1000 * (time.perf_counter() - t0) / args.carts:8.2f} ms/себет")
+    greedy_counts = [len(p.shipments) for p in plans]
+    first_fit = [first_fit_shipments(need, matrix) for need, matrix in zip(needs, matrices)]
+    print(f"жөнелтімдер (орташа): жоспарлаушы {statistics.mean(greedy_counts):.1f}, "
+          f"бірінші табылған қойма {statistics.mean(first_fit):.1f}; "
+          f"толық орындалмаған себеттер: {sum(not p.is_complete for p in plans)}")
+
+if __name__ == "__main__":
+    main()
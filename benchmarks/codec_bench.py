@@ -0,0 +1,79 @@
+"""
+Бинарлы кодек бенчмаркы: markstore.codec vs pickle vs JSON (өлшем және жылдамдық).
+JSON декодтау тек dict-тер қайтарады (dataclass құрылмайды), сондықтан оның decode уақыты тікелей салыстырмалы емес.
+
+    python benchmarks/codec_bench.py --orders 100000 --products 5000
+"""
+import argparse
+import json
+import os
+import pickle
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synthetic_data import synthetic_products, synthetic_orders
+from markstore import codec
+from markstore.models import Order
+
+def to_json(records) -> bytes:
+    return json.dumps([codec.order_to_record(o) if isinstance(o, Order) else o.__dict__ for o in records],
+                      default=str, ensure_ascii=False).encode("utf-8")
+
+def timed(fn, repeats: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+def compare(label: str, records, repeats: int) -> None:
+    print(f"\n{label}: {len(records):,} жазба")
+    print(f"{'format':<10}{'size MB':>10}{'encode ms':>12}{'decode ms':>12}")
+    formats = {
+        "codec": (lambda: codec.encode_batch(records), codec.decode_batch),
+        "pickle": (lambda: pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "json": (lambda: to_json(records), json.loads),
+    }
+    for name, (encode, decode) in formats.items():
+        enc, data = timed(encode, repeats)
+        dec, decoded = timed(lambda: decode(data), repeats)
+        print(f"{name:<10}{len(data) / 2 ** 20:>10.2f}{1000 * enc:>12.1f}{1000 * dec:>12.1f}")
+        if name == "codec":
+            assert decoded == records, "codec round-trip сәйкес емес"
+            reader = codec.BatchReader(data)
+            t0 = time.perf_counter()
+            step = max(1, len(reader) // 1000)
+            for i in range(0, len(reader), step):
+                reader[i]
+            full = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for i in range(0, len(reader), step):
+                reader.fixed_fields(i)
+            fixed = time.perf_counter() - t0
+            sampled = len(range(0, len(reader), step))
+            print(f"{'':<10}кездейсоқ оқу (memoryview): толық {1e6 * full / sampled:.2f} µs, "
+                  f"тұрақты өрістер {1e6 * fixed / sampled:.2f} µs/жазба")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--products", type=int, default=5_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    product_rows = list(synthetic_products(args.products, rng))
+    orders = [codec.order_from_record(o) for o in synthetic_orders(args.orders, product_rows, list(range(1, 1000)), rng)]
+    products = [codec.product_from_record(p) for p in product_rows]
+    compare("Order", orders, args.repeats)
+    compare("Product", products, args.repeats)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Жүктеме сынағы: ai.py-ды headless режимде N параллель сатып алушымен жүргізу.
+
+    python benchmarks/load_test.py --users 20 --products 2000 --orders 50000 --report /tmp/load.json
+    python benchmarks/load_test.py --users 20 --report /tmp/after.json --compare /tmp/load.json
+
+Әр виртуалды пайдаланушы streamlit.testing AppTest арқылы жеке сессия ашады да, нақты сценарийді
+орындайды: кіру → іздеу → санат сүзгісі → себетке қосу → себет → checkout → тапсырыстарым.
+Әр --admin-every-ші пайдаланушы оның орнына админ ретінде кіріп, админ панелін ашады.
+Барлық сессиялар бір процесте, бір ортақ SharedStore-мен жұмыс істейді (нақты сервердегідей).
+AppTest әр орындалуда глобалды Runtime данасын ауыстырады, сондықтан rerun-дар құлыппен кезекпен
+орындалады. Скрипт бәрібір GIL-мен шектелген, яғни бұл бір сервер процесіне жақын модель:
+"latency" кезекте күтуді қоса есептейді, "service" — тек скрипттің өз уақыты.
+
+Есеп (JSON): өткізу қабілеті (rerun/с, сессия/с), rerun латенттілігінің p50/p95/p99
+(жалпы және әр қадам бойынша), RSS жадының өсуі және қателер. --compare алдыңғы есеппен салыстырады.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Барлық виртуалды пайдаланушылар бір клиенттен (бір IP) кіреді, сондықтан клиент шегін көтереміз
+os.environ.setdefault("MARKSTORE_LOGIN_CLIENT_BURST", "1000000")
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from synthetic_data import SHOPPER_PASSWORD, synthetic_store
+from markstore.store import install_store
+
+SCRIPT = os.path.join(ROOT, "ai.py")
+ADMIN_USER, ADMIN_PASSWORD = "admin", "Admin123"
+_RUN_LOCK = threading.Lock()
+
+# ---------------------------
+# Өлшеу көмекшілері
+# ---------------------------
+def percentile(sorted_samples: List[float], q: float) -> float:
+    """Nearest-rank перцентилі (сұрыпталған тізім үшін)"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, int(round(q / 100 * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[rank]
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50": round(1000 * percentile(ordered, 50), 2),
+        "p95": round(1000 * percentile(ordered, 95), 2),
+        "p99": round(1000 * percentile(ordered, 99), 2),
+        "max": round(1000 * ordered[-1], 2) if ordered else 0.0,
+    }
+
+def rss_mb() -> float:
+    """Процестің ағымдағы RSS жады (Linux: /proc, басқа жүйелерде ru_maxrss)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+class MemorySampler(threading.Thread):
+    def __init__(self, interval: float = 0.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = rss_mb()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, rss_mb())
+
+    def stop(self) -> float:
+        self._stop_event.set()
+        self.join()
+        return max(self.peak, rss_mb())
+
+# ---------------------------
+# Виртуалды пайдаланушы
+# ---------------------------
+class VirtualUser:
+    """Бір браузер сессиясы: әр rerun-ның уақыты қадам атымен жазылады"""
+    def __init__(self, index: int, products, timeout: float, think_ms: float, seed: int):
+        from streamlit.testing.v1 import AppTest
+        self.index = index
+        self.products = products
+        self.think_ms = think_ms
+        self.rng = random.Random(seed + index)
+        self.at = AppTest.from_file(SCRIPT, default_timeout=timeout)
+        self.samples: List[tuple] = []
+        self.errors: List[Dict] = []
+
+    def step(self, name: str, action=None) -> bool:
+        """action виджетті өзгертеді; содан кейін бір rerun өлшенеді"""
+        if self.think_ms:
+            time.sleep(self.rng.uniform(0, 2 * self.think_ms) / 1000)
+        try:
+            requested = time.perf_counter()
+            with _RUN_LOCK:
+                started = time.perf_counter()
+                if action is not None:
+                    action(self.at)
+                self.at.run()
+            finished = time.perf_counter()
+            self.samples.append((name, finished - requested, finished - started))
+        except Exception as exc:  # timeout және сценарий қателері есепке жазылады
+            self.errors.append({"user": self.index, "step": name, "error": repr(exc)[:300]})
+            return False
+        if self.at.exception:
+            self.errors.append({"user": self.index, "step": name, "error": self.at.exception[0].value[:300]})
+            return False
+        return True
+
+    def _login(self, username: str, password: str) -> bool:
+        def fill(at):
+            at.sidebar.text_input(key="login_user").set_value(username)
+            at.sidebar.text_input(key="login_pass").set_value(password)
+            next(b for b in at.sidebar.button if "Кіру" in str(b.label)).click()
+        return self.step("login", fill) and self.at.session_state["me"] is not None
+
+    def _navigate(self, name: str, page: str) -> bool:
+        return self.step(name, lambda at: next(b for b in at.sidebar.button if b.label == page).click())
+
+    def shop(self) -> None:
+        if not (self.step("open") and self._login(f"shopper{self.index + 1}", SHOPPER_PASSWORD)):
+            return
+        target = self.rng.choice(self.products)
+        query = target["name"].split()[0].lower()
+        if not self.step("search", lambda at: next(t for t in at.text_input if "іздеу" in t.label).set_value(query)):
+            return
+
+        def filter_category(at):
+            next(t for t in at.text_input if "іздеу" in t.label).set_value("")
+            next(s for s in at.selectbox if "Санат" in s.label).set_value(target["category"])
+        if not self.step("category_filter", filter_category):
+            return
+        if not self.step("add_to_cart", lambda at: at.button(key=f"add_{target['id']}").click()):
+            return
+        if not self._navigate("cart", "🛒 Себет"):
+            return
+        if not self.step("checkout", lambda at: next(b for b in at.button if "Тапсырыс беру" in b.label).click()):
+            return
+        self._navigate("my_orders", "📦 Тапсырыстарым")
+
+    def administer(self) -> None:
+        if self.step("open") and self._login(ADMIN_USER, ADMIN_PASSWORD):
+            self._navigate("admin_dashboard", "⚙️ Админ панелі")
+
+def run_user(user: VirtualUser, admin: bool) -> VirtualUser:
+    if admin:
+        user.administer()
+    else:
+        user.shop()
+    return user
+
+# ---------------------------
+# Есеп
+# ---------------------------
+def build_report(args, users: List[VirtualUser], wall: float, memory: Dict[str, float], data_seconds: float) -> Dict:
+    all_samples = [s for u in users for s in u.samples]
+    by_step: Dict[str, List[float]] = {}
+    for name, elapsed, _ in all_samples:
+        by_step.setdefault(name, []).append(elapsed)
+    completed = sum(1 for u in users if not u.errors)
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": {k: getattr(args, k) for k in ("users", "admin_every", "products", "shoppers", "orders",
+                                                  "think_ms", "timeout", "seed")},
+        "data_generation_s": round(data_seconds, 2),
+        "wall_s": round(wall, 2),
+        "throughput": {
+            "reruns_per_s": round(len(all_samples) / wall, 2) if wall else 0.0,
+            "sessions_per_s": round(completed / wall, 3) if wall else 0.0,
+            "sessions_completed": completed,
+            "sessions_failed": len(users) - completed,
+        },
+        "latency_ms": {"overall": summarize([e for _, e, _ in all_samples]),
+                       "by_step": {name: summarize(v) for name, v in by_step.items()}},
+        "service_ms": summarize([s for _, _, s in all_samples]),
+        "memory_mb": memory,
+        "errors": [e for u in users for e in u.errors][:50],
+    }
+
+def print_report(report: Dict, baseline: Optional[Dict] = None) -> None:
+    def delta(new: float, old: Optional[float]) -> str:
+        if old in (None, 0):
+            return ""
+        return f"  ({100 * (new - old) / old:+.1f}%)"
+
+    base_steps = baseline["latency_ms"]["by_step"] if baseline else {}
+    t, bt = report["throughput"], baseline["throughput"] if baseline else {}
+    print(f"wall {report['wall_s']} s, sessions ok/failed: {t['sessions_completed']}/{t['sessions_failed']}")
+    print(f"throughput: {t['reruns_per_s']} reruns/s{delta(t['reruns_per_s'], bt.get('reruns_per_s'))}, "
+          f"{t['sessions_per_s']} sessions/s{delta(t['sessions_per_s'], bt.get('sessions_per_s'))}")
+    print(f"{'step':<18}{'n':>6}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+    rows = [("overall", report["latency_ms"]["overall"],
+             baseline["latency_ms"]["overall"] if baseline else None)]
+    rows += [(name, s, base_steps.get(name)) for name, s in report["latency_ms"]["by_step"].items()]
+    for name, s, b in rows:
+        line = f"{name:<18}{s['count']:>6}{s['p50']:>12.1f}{s['p95']:>12.1f}{s['p99']:>12.1f}"
+        if b:
+            line += f"   p95{delta(s['p95'], b['p95'])}"
+        print(line)
+    s, b = report["service_ms"], baseline["service_ms"] if baseline else None
+    print(f"{'service':<18}{s['count']:>6}{s['p50']:>12.1f}{s['p95']:>12.1f}{s['p99']:>12.1f}"
+          + (f"   p95{delta(s['p95'], b['p95'])}" if b else ""))
+    m = report["memory_mb"]
+    print(f"memory MB: start {m['start']}, end {m['end']}, peak {m['peak']}, growth {m['growth']}"
+          + (delta(m["growth"], baseline["memory_mb"]["growth"]) if baseline else ""))
+    for error in report["errors"][:5]:
+        print("error:", error)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10, help="параллель виртуалды пайдаланушылар")
+    parser.add_argument("--admin-every", type=int, default=10, help="әр n-ші пайдаланушы админ (0 — админсіз)")
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--shoppers", type=int, default=10_000, help="дерекқордағы тіркелген сатып алушылар")
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--think-ms", type=float, default=0.0, help="қадамдар арасындағы орташа кідіріс")
+    parser.add_argument("--timeout", type=float, default=120.0, help="бір rerun үшін шек (секунд)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--report", help="JSON есеп файлы")
+    parser.add_argument("--compare", help="салыстыру үшін алдыңғы JSON есеп")
+    args = parser.parse_args()
+    args.shoppers = max(args.shoppers, args.users)
+
+    t0 = time.perf_counter()
+    store = synthetic_store(args.products, args.shoppers, args.orders, args.seed)
+    install_store(store)
+    data_seconds = time.perf_counter() - t0
+    products = list(store.products())
+
+    # Импорттар мен кэштерді бір сессиямен қыздыру, сонда өлшенетін тек тұрақты жүктеме болады
+    VirtualUser(-1, products, args.timeout, 0, args.seed).step("warmup")
+
+    users = [VirtualUser(i, products, args.timeout, args.think_ms, args.seed) for i in range(args.users)]
+    sampler = MemorySampler()
+    start_mb = rss_mb()
+    sampler.start()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        futures = [pool.submit(run_user, u, args.admin_every > 0 and (i + 1) % args.admin_every == 0)
+                   for i, u in enumerate(users)]
+        users = [f.result() for f in futures]
+    wall = time.perf_counter() - t0
+    peak_mb = sampler.stop()
+    end_mb = rss_mb()
+    memory = {"start": round(start_mb, 1), "end": round(end_mb, 1), "peak": round(peak_mb, 1),
+              "growth": round(end_mb - start_mb, 1)}
+
+    report = build_report(args, users, wall, memory, data_seconds)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print("report:", args.report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Хабарлама конвейерінің fan-out бенчмаркы жергілікті SMTP "debugging" серверіне қарсы.
+
+    python benchmarks/notify_fanout.py --orders 10000
+
+Сервер ретінде ішкі минималды SMTP sink қолданылады (хаттарды тек санайды).
+Сыртқы серверді тексеру үшін: python -m aiosmtpd -n -l localhost:1025
+және --external localhost:1025 параметрін беріңіз.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markstore.notifications import NotificationPipeline, SmtpConfig, order_notification
+
+class SmtpSink:
+    """Хаттарды қабылдап, тек санайтын жергілікті SMTP сервері"""
+    def __init__(self):
+        self.messages = 0
+        self.port = None
+        self._ready = threading.Event()
+
+    async def _handle(self, reader, writer):
+        writer.write(b"220 markstore-sink ESMTP\r\n")
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line[:4].upper()
+            if command in (b"EHLO", b"HELO"):
+                writer.write(b"250 markstore-sink\r\n")
+            elif command == b"DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                await reader.readuntil(b"\r\n.\r\n")
+                self.messages += 1
+                writer.write(b"250 OK\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        writer.close()
+
+    def serve_in_background(self):
+        def run():
+            loop = asyncio.new_event_loop()
+            server = loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0))
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            loop.run_forever()
+        threading.Thread(target=run, daemon=True).start()
+        self._ready.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--external", help="host:port сыртқы SMTP сервері")
+    args = parser.parse_args()
+
+    sink = None
+    if args.external:
+        host, port = args.external.rsplit(":", 1)
+        config = SmtpConfig(host=host, port=int(port))
+    else:
+        sink = SmtpSink()
+        sink.serve_in_background()
+        config = SmtpConfig(host="127.0.0.1", port=sink.port)
+
+    pipeline = NotificationPipeline(config, workers=args.workers, batch_size=args.batch_size)
+    pipeline.start()
+    user = {"email": "buyer@example.com", "full_name": "Load Test"}
+    submit_times = []
+    t0 = time.perf_counter()
+    for order_id in range(1, args.orders + 1):
+        notification = order_notification("placed", {"id": order_id, "total": 4990}, user)
+        s0 = time.perf_counter()
+        pipeline.submit(notification)
+        submit_times.append(time.perf_counter() - s0)
+    submitted = time.perf_counter() - t0
+    drained = pipeline.drain(timeout=300)
+    total = time.perf_counter() - t0
+
+    submit_times.sort()
+    p99 = submit_times[int(0.99 * (len(submit_times) - 1))]
+    print(f"orders:            {args.orders}")
+    print(f"submit p50 / p99:  {1e6 * statistics.median(submit_times):.1f} µs / {1e6 * p99:.1f} µs")
+    print(f"submit loop:       {submitted:.3f} s")
+    print(f"drained:           {drained} in {total:.3f} s ({args.orders / total:,.0f} msg/s, {60 * args.orders / total:,.0f} msg/min)")
+    print(f"pipeline stats:    {pipeline.stats}")
+    if sink is not None:
+        print(f"sink received:     {sink.messages}")
+
+if __name__ == "__main__":
+    main()
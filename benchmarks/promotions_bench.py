@@ -0,0 +1,105 @@
+"""
+Акциялар бенчмаркы: ережелер тізімін әр жолға тексеру мен компиляцияланған индекстерді салыстыру.
+
+    python benchmarks/promotions_bench.py --rules 2000 --lines 200 --carts 200
+
+Сценарийлер: аңғал бағалау (әр жол × әр ереже), price_lines (индекстер, бір өту),
+PromotionEngine.price_cart салқын және ыстық кэшпен, және calculate_total.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markstore.models import CartItem, Product
+from markstore.promotions import PromotionEngine, price_lines
+from markstore.services import calculate_total
+from markstore.store import SharedStore, install_store
+from synthetic_data import CATEGORIES, synthetic_products
+
+def naive_price(lines, rules, now) -> int:
+    """Салыстыру үшін: әр жолға бүкіл ережелер тізімін қарап шығу (бірдей семантика)"""
+    quantities = {}
+    for pid, _, _, qty in lines:
+        quantities[pid] = quantities.get(pid, 0) + qty
+    active = [r for r in rules if r.active_at(now)]
+    bundled, used = {}, {}
+    for promo in sorted((r for r in active if r.kind == "bundle"), key=lambda p: -p.percent):
+        sets = min(quantities.get(pid, 0) - used.get(pid, 0) for pid in promo.product_ids)
+        if sets > 0:
+            for pid in promo.product_ids:
+                used[pid] = used.get(pid, 0) + sets
+                bundled.setdefault(pid, []).append((sets, promo.percent))
+    total = 0
+    for pid, category, price, qty in lines:
+        best = max([r.percent for r in active if (r.kind == "category" and r.category == category)
+                    or (r.kind == "product" and pid in r.product_ids)], default=0)
+        discount, remaining = 0, qty
+        for units, percent in bundled.pop(pid, ()):
+            units = min(units, remaining)
+            remaining -= units
+            discount += units * price * max(percent, best) // 100
+        discount += remaining * price * best // 100
+        total += price * qty - discount
+    return total
+
+def per_cart_ms(fn, carts) -> float:
+    t0 = time.perf_counter()
+    for cart in carts:
+        fn(cart)
+    return 1000 * (time.perf_counter() - t0) / len(carts)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=20_000)
+    parser.add_argument("--rules", type=int, default=2_000)
+    parser.add_argument("--lines", type=int, default=200, help="себеттегі жолдар саны")
+    parser.add_argument("--carts", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    products = list(synthetic_products(args.products, rng))
+    install_store(SharedStore(products=products))
+    now = datetime.now()
+    engine = PromotionEngine()
+    for i in range(args.rules):
+        kind = rng.choice(("category", "product", "product", "bundle"))
+        window = {}
+        if rng.random() < 0.3:
+            start = now + timedelta(days=rng.randint(-10, 5))
+            window = dict(starts=start, ends=start + timedelta(days=rng.randint(1, 10)))
+        engine.add(f"Акция {i}", kind, rng.randint(5, 40), category=rng.choice(CATEGORIES),
+                   product_ids=rng.sample(range(1, args.products + 1), 2 if kind == "bundle" else rng.randint(1, 20)),
+                   **window)
+    rules = engine.promotions()
+
+    by_id = {p["id"]: p for p in products}
+    carts = [[{"product_id": pid, "quantity": rng.randint(1, 3)}
+              for pid in rng.sample(range(1, args.products + 1), args.lines)] for _ in range(args.carts)]
+    line_sets = [[(i["product_id"], by_id[i["product_id"]]["category"], by_id[i["product_id"]]["price"], i["quantity"])
+                  for i in cart] for cart in carts]
+    print(f"{len(rules):,} ереже, {args.products:,} өнім, {args.carts} себет × {args.lines} жол")
+
+    t0 = time.perf_counter()
+    compiled = engine.compiled(now)
+    print(f"компиляция:                        {1000 * (time.perf_counter() - t0):8.2f} ms")
+    naive_ms = per_cart_ms(lambda lines: naive_price(lines, rules, now), line_sets)
+    print(f"аңғал (жол × ереже):              {naive_ms:8.2f} ms/себет")
+    compiled_ms = per_cart_ms(lambda lines: price_lines(lines, compiled), line_sets)
+    print(f"price_lines (индекстер):          {compiled_ms:8.3f} ms/себет  (×{naive_ms / compiled_ms:.0f})")
+    assert all(naive_price(lines, rules, now) == price_lines(lines, compiled).total for lines in line_sets[:20])
+
+    print(f"price_cart (салқын кэш):          {per_cart_ms(lambda c: engine.price_cart(c, now), carts):8.3f} ms/себет")
+    print(f"price_cart (ыстық кэш):           {per_cart_ms(lambda c: engine.price_cart(c, now), carts):8.3f} ms/себет")
+
+    models = [Product(p["id"], p["name"], p["price"], p["stock"], p["description"], p["image"], p["category"], p["rating"])
+              for p in products]
+    items = [[CartItem(i["product_id"], i["quantity"]) for i in cart] for cart in carts[:20]]
+    print(f"calculate_total (акциялармен):    {per_cart_ms(lambda c: calculate_total(c, models, engine, now), items):8.2f} ms/себет")
+
+if __name__ == "__main__":
+    main()
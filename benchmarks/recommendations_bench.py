@@ -0,0 +1,55 @@
+"""
+"Жиі бірге алынады" моделін құру бенчмаркы.
+
+    python benchmarks/recommendations_bench.py --orders 1000000 --products 5000
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markstore.recommendations import build_model
+
+def synthetic_orders(n_orders: int, n_products: int, max_items: int, seed: int = 42):
+    """Танымалдылығы біркелкі емес (Zipf тәрізді) синтетикалық тапсырыстар"""
+    rng = random.Random(seed)
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(n_products)))
+    population = list(range(1, n_products + 1))
+    return [rng.choices(population, cum_weights=cum_weights, k=rng.randint(1, max_items)) for _ in range(n_orders)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--products", type=int, default=5_000)
+    parser.add_argument("--max-items", type=int, default=5)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    orders = synthetic_orders(args.orders, args.products, args.max_items)
+    print(f"generate {args.orders:,} orders:  {time.perf_counter() - t0:.2f} s")
+
+    t0 = time.perf_counter()
+    model = build_model(orders)
+    print(f"batch build:               {time.perf_counter() - t0:.2f} s")
+
+    t0 = time.perf_counter()
+    for items in orders[:10_000]:
+        model.add_order(items)
+    print(f"incremental add_order:     {1e6 * (time.perf_counter() - t0) / 10_000:.1f} µs/order")
+
+    t0 = time.perf_counter()
+    for pid in range(1, args.products + 1):
+        model.neighbors(pid)
+    cold = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for pid in range(1, args.products + 1):
+        model.neighbors(pid)
+    warm = time.perf_counter() - t0
+    print(f"neighbors cold / cached:   {1e6 * cold / args.products:.2f} / {1e6 * warm / args.products:.2f} µs/product")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Рендеринг микро-бенчмаркы: баға пішімдеу және өнім карточкаларының HTML-і.
+
+    python benchmarks/render_bench.py --rows 200000 --products 5000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markstore.rendering import PRODUCT_CARDS, format_price_column, price_text, product_card_html, render_product_card
+from markstore.services import format_price
+
+def timed(label: str, fn, n: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<38}{1000 * elapsed:9.1f} ms  ({1e9 * elapsed / n:7.0f} ns/элемент)")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--products", type=int, default=5_000)
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    rng = random.Random(42)
+    prices = [rng.randrange(990, 900_000, 10) for _ in range(args.products)]
+    column = pd.Series([rng.choice(prices) for _ in range(args.rows)])
+
+    print(f"Баға бағаны: {args.rows:,} жол, {column.nunique():,} бірегей мән")
+    timed("Series.apply(format_price)", lambda: column.apply(format_price), args.rows)
+    timed("Series.apply(price_text)", lambda: column.apply(price_text), args.rows)
+    price_text.cache_clear()
+    timed("format_price_column (cold)", lambda: format_price_column(column), args.rows)
+    timed("format_price_column (warm)", lambda: format_price_column(column), args.rows)
+
+    values = column.tolist()
+    print(f"\nСкаляр шақырулар: {len(values):,}")
+    timed("format_price", lambda: [format_price(v) for v in values], len(values))
+    timed("price_text (lru_cache)", lambda: [price_text(v) for v in values], len(values))
+
+    products = [{"id": i + 1, "name": f"Product {i + 1}", "price": prices[i], "stock": rng.randint(0, 100),
+                 "description": "Синтетикалық өнім", "image": f"https://via.placeholder.com/600x400?text=P{i + 1}",
+                 "category": f"Санат {i % 20}", "rating": round(rng.uniform(3, 5), 1)} for i in range(args.products)]
+    print(f"\nКаталог беті: {args.products:,} карточка")
+    timed("render_product_card (кэшсіз)", lambda: [render_product_card(p) for p in products], args.products)
+    PRODUCT_CARDS.clear()
+    timed("product_card_html (cold)", lambda: [product_card_html(p, 0) for p in products], args.products)
+    timed("product_card_html (warm)", lambda: [product_card_html(p, 0) for p in products], args.products)
+    changed = {p["id"] for p in rng.sample(products, max(1, args.products // 100))}
+    timed("product_card_html (1% өзгерген)",
+          lambda: [product_card_html(p, 1 if p["id"] in changed else 0) for p in products], args.products)
+
+if __name__ == "__main__":
+    main()
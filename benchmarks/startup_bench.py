@@ -0,0 +1,71 @@
+"""
+Cold-start және rerun латенттілігінің бенчмаркы.
+
+Мысал (бастапқы монолитті нұсқамен салыстыру):
+    git show ee7ce68:ai.py > /tmp/ai_monolith.py
+    python benchmarks/startup_bench.py ai.py /tmp/ai_monolith.py
+
+Cold start әр өлшем үшін жаңа Python процесінде өлшенеді (импорттар + бірінші орындалу),
+rerun латенттілігі бір процесс ішінде streamlit.testing AppTest арқылы өлшенеді.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COLD_START_SNIPPET = """
+import sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({script!r}, default_timeout=30)
+at.run()
+elapsed = time.perf_counter() - t0
+print(elapsed, int("pandas" in sys.modules))
+"""
+
+def cold_start(script: str, repeats: int):
+    """Жаңа процестегі бірінші орындалу уақыты (секунд) және pandas жүктелді ме"""
+    samples, pandas_loaded = [], False
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", COLD_START_SNIPPET.format(script=script)],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+        elapsed, loaded = out.stdout.strip().splitlines()[-1].split()
+        samples.append(float(elapsed))
+        pandas_loaded = pandas_loaded or loaded == "1"
+    return samples, pandas_loaded
+
+def rerun_latency(script: str, reruns: int):
+    """Бір процесс ішіндегі қайта орындалу уақыттары (секунд)"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(script, default_timeout=30)
+    at.run()
+    samples = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scripts", nargs="*", default=["ai.py"])
+    parser.add_argument("--cold-repeats", type=int, default=5)
+    parser.add_argument("--reruns", type=int, default=50)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    print(f"{'script':<32} {'cold p50 ms':>12} {'cold min ms':>12} {'rerun p50 ms':>13} {'rerun p95 ms':>13} {'pandas@start':>13}")
+    for script in args.scripts:
+        path = os.path.abspath(script)
+        cold, pandas_loaded = cold_start(path, args.cold_repeats)
+        warm = sorted(rerun_latency(path, args.reruns))
+        p95 = warm[min(len(warm) - 1, int(0.95 * len(warm)))]
+        print(f"{os.path.basename(script):<32} {1000 * statistics.median(cold):>12.1f} {1000 * min(cold):>12.1f} "
+              f"{1000 * statistics.median(warm):>13.2f} {1000 * p95:>13.2f} {'yes' if pandas_loaded else 'no':>13}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Өндірістік көлемдегі синтетикалық деректер: өнімдер, пайдаланушылар, тапсырыстар.
+
+    python benchmarks/synthetic_data.py --products 5000 --users 20000 --orders 200000
+
+Жүктеме сынағы (load_test.py) осы генератор құрған SharedStore-ды install_store() арқылы орнатады.
+Барлық синтетикалық сатып алушылардың құпия сөзі бірдей: SHOPPER_PASSWORD.
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markstore.store import SEED_USERS, SharedStore
+
+SHOPPER_PASSWORD = "Shopper123"
+
+CATEGORIES = [
+    "Ақпараттық техника", "Телефондар", "Ноутбуктер", "Планшеттер", "Аудио", "Фото және видео",
+    "Ойын консольдері", "Смарт сағаттар", "Тұрмыстық техника", "Ас үй", "Спорт", "Кітаптар",
+    "Балалар тауарлары", "Киім", "Аяқ киім", "Сұлулық", "Денсаулық", "Бақ және саяжай",
+    "Автотауарлар", "Кеңсе тауарлары",
+]
+BRANDS = ["Apple", "Samsung", "Xiaomi", "Sony", "Lenovo", "Asus", "Philips", "Bosch", "Huawei", "LG",
+          "Dell", "HP", "Canon", "Nikon", "JBL", "Adidas", "Nike", "Logitech", "Redmi", "Tefal"]
+KINDS = ["Pro", "Max", "Lite", "Ultra", "Mini", "Plus", "Air", "Neo", "Edge", "Prime"]
+STATUSES = ["pending", "shipped", "completed"]
+STATUS_WEIGHTS = [0.1, 0.2, 0.7]
+
+def synthetic_products(n: int, rng: random.Random):
+    for pid in range(1, n + 1):
+        name = f"{rng.choice(BRANDS)} {rng.choice(KINDS)} {pid}"
+        yield {
+            "id": pid, "name": name, "price": rng.randrange(990, 900_000, 10),
+            "stock": rng.randint(1_000, 100_000), "description": f"{name} — синтетикалық өнім",
+            "image": f"https://via.placeholder.com/600x400/cccccc/000000?text=P{pid}",
+            "category": CATEGORIES[pid % len(CATEGORIES)], "rating": round(rng.uniform(3.0, 5.0), 1),
+        }
+
+def synthetic_users(n: int):
+    """SEED_USERS (admin, ali, bobo) + shopper1..shopperN"""
+    yield from SEED_USERS
+    first = max(u["id"] for u in SEED_USERS) + 1
+    for i in range(1, n + 1):
+        yield {"id": first + i - 1, "username": f"shopper{i}", "password": SHOPPER_PASSWORD, "is_admin": False,
+               "full_name": f"Shopper {i}", "email": f"shopper{i}@example.com", "phone": "+7 700 000 0000"}
+
+def synthetic_orders(n: int, products, user_ids, rng: random.Random, max_items: int = 5):
+    """Өнім танымалдылығы Zipf тәрізді, тапсырыстар соңғы бір жылға таралған"""
+    prices = [p["price"] for p in products]
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(products))))
+    population = list(range(len(products)))
+    now = datetime.now()
+    for oid in range(1, n + 1):
+        picked = set(rng.choices(population, cum_weights=cum_weights, k=rng.randint(1, max_items)))
+        items = [{"product_id": products[i]["id"], "quantity": rng.randint(1, 3)} for i in sorted(picked)]
+        created_at = now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+        yield {
+            "id": oid, "user_id": rng.choice(user_ids), "items": items, "created_at": created_at,
+            "status": rng.choices(STATUSES, STATUS_WEIGHTS)[0],
+            "total": sum(prices[i] * item["quantity"] for i, item in zip(sorted(picked), items)),
+            "address": "Алматы, Абай көшесі 1", "delivery_date": (created_at + timedelta(days=3)).date(),
+        }
+
+def synthetic_store(products: int = 5_000, users: int = 20_000, orders: int = 200_000, seed: int = 42) -> SharedStore:
+    rng = random.Random(seed)
+    product_rows = list(synthetic_products(products, rng))
+    user_rows = list(synthetic_users(users))
+    user_ids = [u["id"] for u in user_rows if not u["is_admin"]]
+    return SharedStore(user_rows, product_rows, synthetic_orders(orders, product_rows, user_ids, rng))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=5_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    store = synthetic_store(args.products, args.users, args.orders, args.seed)
+    print(f"generate: {time.perf_counter() - t0:.2f} s")
+    print(f"products: {len(store.products()):,}  users: {len(store.users()):,}  orders: {len(store.orders()):,}")
+
+if __name__ == "__main__":
+    main()
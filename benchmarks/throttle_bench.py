@@ -0,0 +1,55 @@
+"""
+Кіруді шектеу (token bucket) бенчмаркы: бір тексерудің құны.
+
+    python benchmarks/throttle_bench.py --checks 1000000 --keys 200000
+
+Сценарийлер: аз ыстық кілттер (бір аккаунтқа шабуыл), көп бірегей кілттер
+(credential stuffing, max_keys ығыстыруымен) және LoginThrottle.check толық жолы.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markstore.throttle import TokenBucketLimiter, LoginThrottle
+
+def per_check_ns(fn, keys, clock) -> float:
+    t0 = time.perf_counter()
+    for key, now in zip(keys, clock):
+        fn(key, now)
+    return 1e9 * (time.perf_counter() - t0) / len(keys)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checks", type=int, default=1_000_000)
+    parser.add_argument("--keys", type=int, default=200_000, help="бірегей кілттер саны")
+    parser.add_argument("--max-keys", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    clock = [i * 1e-4 for i in range(args.checks)]  # 10k тексеру/с
+    hot = [f"user{rng.randrange(10)}" for _ in range(args.checks)]
+    unique = [f"user{rng.randrange(args.keys)}" for _ in range(args.checks)]
+
+    limiter = TokenBucketLimiter(capacity=5, refill_per_sec=1 / 30, max_keys=args.max_keys)
+    print(f"hot keys (10):            {per_check_ns(limiter.consume, hot, clock):7.0f} ns/check")
+
+    limiter = TokenBucketLimiter(capacity=5, refill_per_sec=1 / 30, max_keys=args.max_keys)
+    ns = per_check_ns(limiter.consume, unique, clock)
+    print(f"unique keys ({args.keys:,}):  {ns:7.0f} ns/check, кілттер жадта: {len(limiter):,} (шек {args.max_keys:,})")
+
+    throttle = LoginThrottle(TokenBucketLimiter(5, 1 / 30, max_keys=args.max_keys),
+                             TokenBucketLimiter(20, 1 / 3, max_keys=args.max_keys))
+    clients = [f"10.0.{rng.randrange(256)}.{rng.randrange(256)}" for _ in range(args.checks)]
+    t0 = time.perf_counter()
+    for username, client, now in zip(unique, clients, clock):
+        throttle.check(username, client, now)
+    elapsed = time.perf_counter() - t0
+    print(f"LoginThrottle.check:      {1e9 * elapsed / args.checks:7.0f} ns/check, "
+          f"бас тартылды: {throttle.rejected:,} / {args.checks:,}")
+
+if __name__ == "__main__":
+    main()
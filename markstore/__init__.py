@@ -0,0 +1,6 @@
+"""
+MarkStore ядросы: деректер моделі, Option/Either және таза сервис функциялары.
+Бұл пакет streamlit пен pandas-ты импорттамайды; беттер markstore.views ішінде.
+"""
+from markstore.models import User, Product, CartItem, Order
+from markstore.monads import Option, Either
@@ -0,0 +1,272 @@
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta, time as dtime
+from typing import List, Dict, Any, Callable, Iterable, Mapping, Optional, Tuple
+
+from markstore.codec import BatchReader, CodecError, encode_batch, order_from_record, order_to_record
+from markstore.store import get_store
+
+# ---------------------------
+# Тапсырыстар мұрағаты: ескі аяқталған тапсырыстар үшін суық қойма
+# ---------------------------
+# Каталог құрылымы (айлар бойынша бөлімдер):
+#   <root>/2024-03/orders-<бірінші id>-<соңғы id>.msz   — codec топтамасы, zlib-пен сығылған
+#   <root>/2024-03/orders-<бірінші id>-<соңғы id>.json  — манифест: күн аралығы, пайдаланушы/өнім қорытындылары
+# Манифест деректер файлынан кейін жазылады, сондықтан манифесі бар сегмент әрқашан толық.
+# Қорытындылар (саны, сомасы, сатылған дана) сегментті ашпай-ақ аналитикаға жетеді;
+# сегмент тек сұралған күн аралығы немесе пайдаланушы оған түссе ғана оқылады.
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _micros(moment: datetime) -> int:
+    return (moment - _EPOCH) // _MICROSECOND
+
+def _day_bounds(date_from: Optional[date], date_to: Optional[date]) -> Tuple[int, int]:
+    """Күн аралығы created_at микросекундтарымен (шеттері қоса)"""
+    lo = _micros(datetime.combine(date_from, dtime.min)) if date_from else -1 << 63
+    hi = _micros(datetime.combine(date_to, dtime.max)) if date_to else 1 << 63
+    return lo, hi
+
+@dataclass(frozen=True)
+class Segment:
+    path: str
+    month: str
+    count: int
+    first: datetime                              # ең ерте created_at
+    last: datetime                               # ең кеш created_at
+    max_order_id: int
+    users: Mapping[int, Tuple[int, int]]         # user_id -> (тапсырыс саны, сомасы)
+    quantities: Mapping[int, int]                # product_id -> сатылған дана
+    revenues: Optional[Mapping[int, int]] = None # product_id -> төленген сома (ескі манифестерде жоқ)
+
+    @property
+    def revenue(self) -> int:
+        return sum(total for _, total in self.users.values())
+
+    def overlaps(self, lo: int, hi: int) -> bool:
+        return _micros(self.first) <= hi and _micros(self.last) >= lo
+
+    def to_manifest(self) -> Dict[str, Any]:
+        return {
+            "month": self.month, "count": self.count,
+            "first": self.first.isoformat(), "last": self.last.isoformat(), "max_order_id": self.max_order_id,
+            "users": {str(uid): list(v) for uid, v in self.users.items()},
+            "quantities": {str(pid): q for pid, q in self.quantities.items()},
+            **({"revenues": {str(pid): r for pid, r in self.revenues.items()}} if self.revenues is not None else {}),
+        }
+
+    @classmethod
+    def from_manifest(cls, path: str, data: Mapping[str, Any]) -> "Segment":
+        return cls(path, data["month"], data["count"],
+                   datetime.fromisoformat(data["first"]), datetime.fromisoformat(data["last"]),
+                   data["max_order_id"],
+                   {int(uid): tuple(v) for uid, v in data["users"].items()},
+                   {int(pid): q for pid, q in data["quantities"].items()},
+                   {int(pid): r for pid, r in data["revenues"].items()} if "revenues" in data else None)
+
+class OrderArchive:
+    """
+    max_age_days-тен ескі аяқталған тапсырыстарды ыстық store-дан айлық сегменттерге көшіреді.
+    Барлық сегменттердің манифестері жадта (кішкентай), ал сығылған деректер тек сұраныс
+    аралығына түскенде ашылады; соңғы ашылған cache_size сегмент LRU кэште тұрады.
+    """
+    def __init__(self, root: str, max_age_days: int = 90, cache_size: int = 8):
+        self.root = root
+        self.max_age_days = max_age_days
+        self.cache_size = cache_size
+        self.segments_read = 0
+        self.damaged: Dict[str, str] = {}      # оқылмаған сегмент жолы -> қате мәтіні
+        self._damaged_max_order_id = 0
+        self._segments: List[Segment] = []
+        self._readers: "OrderedDict[str, BatchReader]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._scan()
+
+    def _scan(self) -> None:
+        if not os.path.isdir(self.root):
+            return
+        for month in sorted(os.listdir(self.root)):
+            folder = os.path.join(self.root, month)
+            if not os.path.isdir(folder):
+                continue
+            for name in sorted(os.listdir(folder)):
+                if name.endswith(".json"):
+                    path = os.path.join(folder, name[:-5] + ".msz")
+                    # Бүлінген манифест қосымшаның іске қосылуын тоқтатпайды: сегмент damaged-ке жазылып өткізіледі
+                    try:
+                        with open(os.path.join(folder, name), encoding="utf-8") as fh:
+                            self._segments.append(Segment.from_manifest(path, json.load(fh)))
+                    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+                        self.damaged[path] = f"манифест: {exc}"
+                        # Соңғы тапсырыс id-сы файл атауында да бар (orders-<бірінші>-<соңғы>): ол қайта берілмейді
+                        last = name[:-5].rsplit("-", 1)[-1]
+                        if last.isdigit():
+                            self._damaged_max_order_id = max(self._damaged_max_order_id, int(last))
+        self._segments.sort(key=lambda s: s.first)
+
+    # ---- жазу
+    def cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()) - timedelta(days=self.max_age_days)
+
+    def archive(self, store=None, now: Optional[datetime] = None) -> int:
+        """Ескі аяқталған тапсырыстарды мұрағаттау; көшірілген тапсырыстар санын қайтарады"""
+        store = store or get_store()
+        return store.archive_orders(self.cutoff(now), self.write)
+
+    def write(self, orders: Iterable[Mapping]) -> List[Segment]:
+        """Тапсырыстарды айлар бойынша топтап, әр айға бір жаңа сегмент жазу"""
+        by_month: Dict[str, List[Mapping]] = {}
+        for order in orders:
+            by_month.setdefault(order["created_at"].strftime("%Y-%m"), []).append(order)
+        written = []
+        for month, batch in sorted(by_month.items()):
+            batch.sort(key=lambda o: (o["created_at"], o["id"]))
+            written.append(self._write_segment(month, batch))
+        with self._lock:
+            self._segments.extend(written)
+            self._segments.sort(key=lambda s: s.first)
+        return written
+
+    def _write_segment(self, month: str, batch: List[Mapping]) -> Segment:
+        users: Dict[int, Tuple[int, int]] = {}
+        quantities: Dict[int, int] = {}
+        revenues: Dict[int, int] = {}
+        for order in batch:
+            count, total = users.get(order["user_id"], (0, 0))
+            users[order["user_id"]] = (count + 1, total + order["total"])
+            for item in order["items"]:
+                quantities[item["product_id"]] = quantities.get(item["product_id"], 0) + item["quantity"]
+                revenues[item["product_id"]] = revenues.get(item["product_id"], 0) + item.get("line_total", 0)
+        ids = [o["id"] for o in batch]
+        folder = os.path.join(self.root, month)
+        os.makedirs(folder, exist_ok=True)
+        base = os.path.join(folder, f"orders-{min(ids)}-{max(ids)}")
+        segment = Segment(base + ".msz", month, len(batch), batch[0]["created_at"], batch[-1]["created_at"],
+                          max(ids), users, quantities, revenues)
+        payload = zlib.compress(encode_batch([order_from_record(o) for o in batch]), 6)
+        _write_atomic(segment.path, payload)
+        _write_atomic(base + ".json", json.dumps(segment.to_manifest(), ensure_ascii=False).encode("utf-8"))
+        return segment
+
+    # ---- оқу
+    def __len__(self) -> int:
+        return sum(s.count for s in self._segments)
+
+    @property
+    def segments(self) -> Tuple[Segment, ...]:
+        with self._lock:
+            return tuple(self._segments)
+
+    @property
+    def revenue(self) -> int:
+        return sum(s.revenue for s in self.segments)
+
+    @property
+    def max_order_id(self) -> int:
+        return max([s.max_order_id for s in self.segments] + [self._damaged_max_order_id])
+
+    @property
+    def max_user_id(self) -> int:
+        return max((uid for s in self.segments for uid in s.users), default=0)
+
+    @property
+    def max_product_id(self) -> int:
+        return max((pid for s in self.segments for pid in s.quantities), default=0)
+
+    def user_summary(self, user_id: int) -> Tuple[int, int]:
+        """Пайдаланушының мұрағаттағы (тапсырыс саны, сомасы) — тек манифестерден"""
+        count = total = 0
+        for segment in self.segments:
+            c, t = segment.users.get(user_id, (0, 0))
+            count += c
+            total += t
+        return count, total
+
+    def product_sales(self, prices: Mapping[int, int]) -> Dict[int, Tuple[int, int]]:
+        """
+        Мұрағаттағы әр өнімнің (сатылған данасы, төленген сомасы) — тек манифестерден.
+        prices (ағымдағы тізімдік баға) тек revenues өрісі жоқ ескі сегменттер үшін қолданылады.
+        """
+        sales: Dict[int, Tuple[int, int]] = {}
+        for segment in self.segments:
+            for pid, qty in segment.quantities.items():
+                revenue = segment.revenues.get(pid, 0) if segment.revenues is not None else qty * prices.get(pid, 0)
+                count, total = sales.get(pid, (0, 0))
+                sales[pid] = (count + qty, total + revenue)
+        return sales
+
+    def _reader(self, segment: Segment) -> BatchReader:
+        with self._lock:
+            reader = self._readers.get(segment.path)
+            if reader is not None:
+                self._readers.move_to_end(segment.path)
+                return reader
+        try:
+            with open(segment.path, "rb") as fh:
+                reader = BatchReader(zlib.decompress(fh.read()))
+        except (OSError, zlib.error) as exc:
+            raise CodecError(f"{segment.path}: {exc}") from exc
+        with self._lock:
+            self.segments_read += 1
+            self._readers[segment.path] = reader
+            if len(self._readers) > self.cache_size:
+                self._readers.popitem(last=False)
+        return reader
+
+    def _select(self, lo: int, hi: int, user_id: Optional[int],
+                keep: Callable[[tuple], bool]) -> List[Dict[str, Any]]:
+        found = []
+        for segment in self.segments:
+            if not segment.overlaps(lo, hi) or (user_id is not None and user_id not in segment.users):
+                continue
+            # Сүзгі тұрақты өрістер бойынша: тек сәйкес жазбалар толық декодталады.
+            # Бүлінген/үзілген сегмент өткізіліп жіберіледі (damaged-ке жазылады), қалғандары оқылады
+            try:
+                reader = self._reader(segment)
+                matched = [order_to_record(reader[i]) for i in range(len(reader)) if keep(reader.fixed_fields(i))]
+            except CodecError as exc:
+                with self._lock:
+                    self.damaged[segment.path] = str(exc)
+                continue
+            found.extend(matched)
+        return found
+
+    def orders_for_user(self, user_id: int, date_from: Optional[date] = None,
+                        date_to: Optional[date] = None) -> List[Dict[str, Any]]:
+        return self.orders_between(date_from, date_to, user_id)
+
+    def orders_between(self, date_from: Optional[date] = None, date_to: Optional[date] = None,
+                       user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        lo, hi = _day_bounds(date_from, date_to)
+        if user_id is not None:
+            return self._select(lo, hi, user_id, lambda f: f[1] == user_id and lo <= f[2] <= hi)
+        return self._select(lo, hi, None, lambda f: lo <= f[2] <= hi)
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+_archive: Optional[OrderArchive] = None
+_archive_lock = threading.Lock()
+
+def get_order_archive() -> OrderArchive:
+    """
+    Процесс деңгейіндегі мұрағат. Баптаулар: MARKSTORE_ARCHIVE_DIR (әдепкі ./archive),
+    MARKSTORE_ARCHIVE_AGE_DAYS (әдепкі 90).
+    Store құрылғанда (get_store/install_store) мұрағаттағы user/order id-лары резервтеледі.
+    """
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            env = os.environ.get
+            _archive = OrderArchive(env("MARKSTORE_ARCHIVE_DIR", "archive"),
+                                    max_age_days=int(env("MARKSTORE_ARCHIVE_AGE_DAYS", "90")))
+        return _archive
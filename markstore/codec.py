@@ -0,0 +1,280 @@
+import struct
+import sys
+from array import array
+from datetime import datetime, date, timedelta
+from typing import List, Iterator, Mapping, Union
+
+from markstore.models import Product, CartItem, Order, Shipment
+
+# ---------------------------
+# Ықшам бинарлы формат: Product / CartItem / Order
+# ---------------------------
+# Топтама (batch) құрылымы:
+#   MAGIC(2) | VERSION(1) | KIND(1) | COUNT(u32) | OFFSETS(u32 × (COUNT + 1)) | жазбалар
+# Офсеттер кестесі кез келген жазбаны басқаларын декодтамай оқуға мүмкіндік береді.
+# Жазбалар ішінде: тұрақты өрістер struct арқылы (little-endian), жолдар — varint ұзындық + UTF-8,
+# тапсырыс элементтері — varint саны + (varint product_id, varint quantity, varint line_total + 1) үштіктері
+# (0 — сома белгісіз), содан кейін жөнелтімдер: varint саны + (varint warehouse_id, varint саны + жұптар).
+# 1-нұсқада line_total мен жөнелтімдер жоқ; ондай топтамалар әлі де оқылады.
+MAGIC = b"MS"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+KIND_PRODUCT, KIND_CART_ITEM, KIND_ORDER = 1, 2, 3
+
+ORDER_STATUSES = ("pending", "shipped", "completed")
+_CUSTOM_STATUS = 255
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_HEADER = struct.Struct("<2sBBI")
+_PRODUCT = struct.Struct("<Iqid")    # id, price, stock, rating
+_ORDER = struct.Struct("<IIqqiB")    # id, user_id, created_at (µs), total, delivery_date (ordinal), status
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+class CodecError(ValueError):
+    pass
+
+# ---- varint (unsigned LEB128)
+def write_varint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise CodecError(f"varint теріс бола алмайды: {value}")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def read_varint(buf: memoryview, pos: int) -> tuple:
+    """(мән, келесі позиция)"""
+    result = shift = 0
+    end = len(buf)
+    while True:
+        if pos >= end:
+            raise CodecError("Varint буфер соңында үзілген")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+def _write_str(out: bytearray, text: str) -> None:
+    data = text.encode("utf-8")
+    write_varint(out, len(data))
+    out += data
+
+def _read_str(buf: memoryview, pos: int) -> tuple:
+    size, pos = read_varint(buf, pos)
+    if pos + size > len(buf):
+        raise CodecError("Жол буфер шегінен шығып тұр")
+    try:
+        return str(buf[pos:pos + size], "utf-8"), pos + size
+    except UnicodeDecodeError as exc:
+        raise CodecError(f"UTF-8 жол бүлінген: {exc}") from exc
+
+# ---- жеке жазбалар
+def _encode_product(out: bytearray, p: Product) -> None:
+    out += _PRODUCT.pack(p.id, p.price, p.stock, p.rating)
+    for text in (p.name, p.description, p.image, p.category):
+        _write_str(out, text)
+
+def _decode_product(buf: memoryview, pos: int) -> Product:
+    pid, price, stock, rating = _PRODUCT.unpack_from(buf, pos)
+    pos += _PRODUCT.size
+    name, pos = _read_str(buf, pos)
+    description, pos = _read_str(buf, pos)
+    image, pos = _read_str(buf, pos)
+    category, pos = _read_str(buf, pos)
+    return Product(pid, name, price, stock, description, image, category, rating)
+
+def _encode_cart_item(out: bytearray, item: CartItem) -> None:
+    write_varint(out, item.product_id)
+    write_varint(out, item.quantity)
+
+def _decode_cart_item(buf: memoryview, pos: int) -> CartItem:
+    product_id, pos = read_varint(buf, pos)
+    quantity, _ = read_varint(buf, pos)
+    return CartItem(product_id, quantity)
+
+def _encode_order(out: bytearray, o: Order) -> None:
+    status = ORDER_STATUSES.index(o.status) if o.status in ORDER_STATUSES else _CUSTOM_STATUS
+    created = (o.created_at - _EPOCH) // _MICROSECOND
+    out += _ORDER.pack(o.id, o.user_id, created, o.total, o.delivery_date.toordinal(), status)
+    if status == _CUSTOM_STATUS:
+        _write_str(out, o.status)
+    _write_str(out, o.address)
+    write_varint(out, len(o.items))
+    for item in o.items:
+        write_varint(out, item.product_id)
+        write_varint(out, item.quantity)
+        write_varint(out, 0 if item.line_total is None else item.line_total + 1)
+    write_varint(out, len(o.shipments))
+    for shipment in o.shipments:
+        write_varint(out, shipment.warehouse_id)
+        write_varint(out, len(shipment.items))
+        for product_id, quantity in shipment.items:
+            write_varint(out, product_id)
+            write_varint(out, quantity)
+
+def _decode_order(buf: memoryview, pos: int, version: int = VERSION) -> Order:
+    oid, user_id, created, total, delivery, status_code = _ORDER.unpack_from(buf, pos)
+    pos += _ORDER.size
+    if status_code == _CUSTOM_STATUS:
+        status, pos = _read_str(buf, pos)
+    else:
+        status = ORDER_STATUSES[status_code]
+    address, pos = _read_str(buf, pos)
+    count, pos = read_varint(buf, pos)
+    items = []
+    for _ in range(count):
+        product_id, pos = read_varint(buf, pos)
+        quantity, pos = read_varint(buf, pos)
+        line_total = None
+        if version >= 2:
+            stored, pos = read_varint(buf, pos)
+            line_total = stored - 1 if stored else None
+        items.append(CartItem(product_id, quantity, line_total))
+    shipments = []
+    if version >= 2:
+        count, pos = read_varint(buf, pos)
+        for _ in range(count):
+            warehouse_id, pos = read_varint(buf, pos)
+            lines, pos = read_varint(buf, pos)
+            taken = []
+            for _ in range(lines):
+                product_id, pos = read_varint(buf, pos)
+                quantity, pos = read_varint(buf, pos)
+                taken.append((product_id, quantity))
+            shipments.append(Shipment(warehouse_id, tuple(taken)))
+    return Order(oid, user_id, tuple(items), _EPOCH + created * _MICROSECOND, status, total, address,
+                 date.fromordinal(delivery), tuple(shipments))
+
+def _decode_order_v1(buf: memoryview, pos: int) -> Order:
+    return _decode_order(buf, pos, version=1)
+
+_CODECS = {
+    Product: (KIND_PRODUCT, _encode_product),
+    CartItem: (KIND_CART_ITEM, _encode_cart_item),
+    Order: (KIND_ORDER, _encode_order),
+}
+_DECODERS = {KIND_PRODUCT: _decode_product, KIND_CART_ITEM: _decode_cart_item, KIND_ORDER: _decode_order}
+_LEGACY_DECODERS = {(1, KIND_ORDER): _decode_order_v1}   # ескі нұсқада құрылымы өзгерген жазбалар
+_FIXED = {KIND_PRODUCT: _PRODUCT, KIND_ORDER: _ORDER}
+
+# ---- топтамалар
+def encode_batch(records: List) -> bytes:
+    """Бір типтегі жазбалар тізімін бір буферге кодтау"""
+    if not records:
+        raise CodecError("Бос топтаманың типі белгісіз")
+    kind, encode = _CODECS[type(records[0])]
+    payload = bytearray()
+    offsets = array("I", [0])
+    for record in records:
+        encode(payload, record)
+        offsets.append(len(payload))
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    return _HEADER.pack(MAGIC, VERSION, kind, len(records)) + offsets.tobytes() + payload
+
+class BatchReader:
+    """
+    Топтаманы көшірмей оқу: барлық кесінділер memoryview, жазба тек сұралғанда декодталады.
+    reader[i] — i-ші жазба, reader.raw(i) — оның байттарының көрінісі.
+    """
+    def __init__(self, data: Buffer):
+        self.buffer = memoryview(data).cast("B")
+        if len(self.buffer) < _HEADER.size:
+            raise CodecError("Буфер тым қысқа")
+        magic, version, self.kind, self.count = _HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise CodecError("MarkStore форматы емес")
+        if version not in SUPPORTED_VERSIONS:
+            raise CodecError(f"Қолдау көрсетілмейтін нұсқа: {version}")
+        if self.kind not in _DECODERS:
+            raise CodecError(f"Белгісіз жазба типі: {self.kind}")
+        table_end = _HEADER.size + 4 * (self.count + 1)
+        if table_end > len(self.buffer):
+            raise CodecError(f"Офсеттер кестесі үзілген: {self.count} жазба жарияланған")
+        self._offsets = self.buffer[_HEADER.size:table_end].cast("I")
+        if sys.byteorder == "big":
+            self._offsets = array("I", self._offsets)
+            self._offsets.byteswap()
+        self._payload = self.buffer[table_end:]
+        # Офсеттер 0-ден басталып, кемімей өсіп, дәл payload соңында аяқталуы керек (үзілген файл осында ұсталады)
+        offsets = self._offsets
+        if offsets[0] != 0 or offsets[self.count] != len(self._payload) or \
+                any(offsets[i] > offsets[i + 1] for i in range(self.count)):
+            raise CodecError("Офсеттер кестесі деректерге сәйкес емес")
+        self.version = version
+        self._decode = _LEGACY_DECODERS.get((version, self.kind), _DECODERS[self.kind])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def raw(self, i: int) -> memoryview:
+        return self._payload[self._offsets[i]:self._offsets[i + 1]]
+
+    def fixed_fields(self, i: int) -> tuple:
+        """
+        Жазбаның тұрақты өрістері, объект құрмай және жолдарды декодтамай (сүзгілеу үшін).
+        Order: (id, user_id, created_at µs, total, delivery_date ordinal, status коды);
+        Product: (id, price, stock, rating).
+        """
+        layout = _FIXED.get(self.kind)
+        if layout is None:
+            raise CodecError("Бұл жазба типінде тұрақты өрістер жоқ")
+        if self._offsets[i + 1] - self._offsets[i] < layout.size:
+            raise CodecError(f"Жазба {i} тұрақты өрістерден қысқа")
+        return layout.unpack_from(self._payload, self._offsets[i])
+
+    def _record(self, i: int):
+        """Жазба өз кесіндісі ішінде декодталады: бүлінген жазба көршісіне өтпейді"""
+        try:
+            return self._decode(self.raw(i), 0)
+        except CodecError:
+            raise
+        except (struct.error, IndexError, ValueError, OverflowError) as exc:
+            raise CodecError(f"Жазба {i} бүлінген: {exc}") from exc
+
+    def __getitem__(self, i: int):
+        if not -self.count <= i < self.count:
+            raise IndexError(i)
+        return self._record(i % self.count)
+
+    def __iter__(self) -> Iterator:
+        for i in range(self.count):
+            yield self._record(i)
+
+def decode_batch(data: Buffer) -> List:
+    return list(BatchReader(data))
+
+def encode(record) -> bytes:
+    return encode_batch([record])
+
+def decode(data: Buffer):
+    reader = BatchReader(data)
+    if reader.count != 1:
+        raise CodecError(f"Бір жазба күтілді, табылды: {reader.count}")
+    return reader[0]
+
+# ---- ортақ қойма жазбаларымен (dict) түрлендіру
+def order_from_record(record: Mapping) -> Order:
+    return Order(record["id"], record["user_id"],
+                 tuple(CartItem(i["product_id"], i["quantity"], i.get("line_total")) for i in record["items"]),
+                 record["created_at"], record["status"], record["total"], record["address"],
+                 record["delivery_date"],
+                 tuple(Shipment(s.warehouse_id, tuple(s.items)) for s in record.get("shipments", ())))
+
+def order_to_record(order: Order) -> dict:
+    """line_total тек белгілі болса қосылады (1-нұсқадағы мұрағатта жоқ)"""
+    return {
+        "id": order.id, "user_id": order.user_id,
+        "items": [{"product_id": i.product_id, "quantity": i.quantity,
+                   **({"line_total": i.line_total} if i.line_total is not None else {})} for i in order.items],
+        "created_at": order.created_at, "status": order.status, "total": order.total,
+        "address": order.address, "delivery_date": order.delivery_date, "shipments": order.shipments,
+    }
+
+def product_from_record(record: Mapping) -> Product:
+    return Product(record["id"], record["name"], record["price"], record["stock"], record["description"],
+                   record["image"], record["category"], float(record.get("rating", 0.0)))
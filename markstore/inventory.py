@@ -0,0 +1,199 @@
+import heapq
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Dict, Deque, Iterable, Mapping, Optional, Set, Tuple
+
+from markstore.store import get_store
+
+# ---------------------------
+# Қойма: сату жылдамдығы, қайта тапсырыс нүктесі, аз қалдық ескертулері
+# ---------------------------
+@dataclass(frozen=True)
+class StockStatus:
+    product_id: int
+    stock: int
+    velocity: float        # күніне сатылатын орташа дана (соңғы window_days бойынша)
+    reorder_point: int
+    days_of_cover: float   # қалдық қанша күнге жетеді (сатылым болмаса — inf)
+
+    @property
+    def is_low(self) -> bool:
+        return self.stock <= self.reorder_point
+
+def reorder_point(velocity: float, lead_time_days: int, safety_days: int, min_stock: int) -> int:
+    """Таза функция: жеткізу мерзімі + қауіпсіздік қоры кезеңіндегі күтілетін сұраныс"""
+    return max(min_stock, math.ceil(velocity * (lead_time_days + safety_days)))
+
+def days_of_cover(stock: int, velocity: float) -> float:
+    if stock <= 0:
+        return 0.0
+    return stock / velocity if velocity > 0 else math.inf
+
+class InventoryMonitor:
+    """
+    Қалдықтың min-heap индексі: кілт — (жеткілікті күн, қалдық).
+    Өзгерген өнім үшін жаңа жазба қосылады, ескісі нұсқа (version) арқылы жалқау өшіріледі,
+    сондықтан әр жаңарту O(log n), ал top_at_risk(k) бүкіл каталогты қарамай O(k log n).
+    Сату жылдамдығы әр өнім бойынша күндік бакеттерден (соңғы window_days) есептеледі;
+    күн ауысқанда ескі бакеттері терезеден шыққан өнімдер қайта кілттеледі (оқиғасы болмаса да).
+    """
+    def __init__(self, lead_time_days: int = 7, safety_days: int = 3, window_days: int = 30,
+                 min_stock: int = 3, alert_capacity: int = 200):
+        self.lead_time_days = lead_time_days
+        self.safety_days = safety_days
+        self.window_days = window_days
+        self.min_stock = min_stock
+        self.alerts: Deque[Tuple[datetime, StockStatus]] = deque(maxlen=alert_capacity)
+        self._status: Dict[int, StockStatus] = {}
+        self._version: Dict[int, int] = {}
+        self._sales: Dict[int, Deque[List[int]]] = {}  # {pid: deque([[күн ordinal, дана], ...])}
+        self._heap: List[Tuple[float, int, int, int]] = []  # (жеткілікті күн, қалдық, pid, нұсқа)
+        self._low: Set[int] = set()
+        self._day = date.today().toordinal()   # соңғы ескіру өтуі жасалған күн
+        self._lock = threading.Lock()
+
+    # ---- сату жылдамдығы
+    def _record_sale(self, pid: int, day: int, quantity: int) -> None:
+        buckets = self._sales.setdefault(pid, deque())
+        if buckets and buckets[-1][0] == day:
+            buckets[-1][1] += quantity
+        else:
+            buckets.append([day, quantity])
+
+    def _velocity(self, pid: int, today: int) -> float:
+        buckets = self._sales.get(pid)
+        if not buckets:
+            return 0.0
+        while buckets and buckets[0][0] <= today - self.window_days:
+            buckets.popleft()
+        if not buckets:
+            del self._sales[pid]
+            return 0.0
+        return sum(q for _, q in buckets) / self.window_days
+
+    def _decay(self, today: int) -> None:
+        """
+        Күнде бір рет: ең ескі бакеті терезеден шыққан өнімдердің жылдамдығы мен heap кілтін жаңарту.
+        Әйтпесе сатылымы тоқтаған өнім келесі оқиғасына дейін ескі жылдамдықпен «қауіпті» болып тұрады.
+        """
+        if today == self._day:
+            return
+        self._day = today
+        expired = [pid for pid, buckets in self._sales.items() if buckets[0][0] <= today - self.window_days]
+        for pid in expired:
+            current = self._status.get(pid)
+            if current is None:
+                self._sales.pop(pid, None)
+            else:
+                self._update(pid, current.stock, today)
+
+    # ---- heap индексі
+    def _update(self, pid: int, stock: int, today: int, alert: bool = True) -> StockStatus:
+        velocity = self._velocity(pid, today)
+        status = StockStatus(pid, stock, velocity,
+                             reorder_point(velocity, self.lead_time_days, self.safety_days, self.min_stock),
+                             days_of_cover(stock, velocity))
+        version = self._version.get(pid, 0) + 1
+        self._version[pid] = version
+        self._status[pid] = status
+        heapq.heappush(self._heap, (status.days_of_cover, stock, pid, version))
+        if status.is_low and pid not in self._low:
+            self._low.add(pid)
+            if alert:
+                self.alerts.append((datetime.now(), status))
+        elif not status.is_low:
+            self._low.discard(pid)
+        if len(self._heap) > 2 * len(self._status) + 64:
+            self._compact()
+        return status
+
+    def _remove(self, pid: int) -> None:
+        self._status.pop(pid, None)
+        self._version.pop(pid, None)
+        self._sales.pop(pid, None)
+        self._low.discard(pid)
+
+    def _compact(self) -> None:
+        self._heap = [e for e in self._heap if self._version.get(e[2]) == e[3]]
+        heapq.heapify(self._heap)
+
+    def load(self, products: Iterable[Mapping], orders: Iterable[Mapping], today: Optional[date] = None) -> None:
+        """Тапсырыс тарихынан жылдамдықты және барлық өнімдердің индексін бір рет құру"""
+        today_ordinal = (today or date.today()).toordinal()
+        with self._lock:
+            self._day = today_ordinal
+            self._status.clear()
+            self._version.clear()
+            self._sales.clear()
+            self._low.clear()
+            self._heap = []
+            for order in sorted(orders, key=lambda o: o["created_at"]):
+                day = order["created_at"].date().toordinal()
+                if day > today_ordinal - self.window_days:
+                    for item in order["items"]:
+                        self._record_sale(item["product_id"], day, item["quantity"])
+            for product in products:
+                self._update(product["id"], product["stock"], today_ordinal, alert=False)
+
+    # ---- store оқиғалары (checkout кезінде инкременталды)
+    def on_store_event(self, event: str, record: Mapping) -> None:
+        today = date.today().toordinal()
+        with self._lock:
+            self._decay(today)
+            if event == "order_placed":
+                for item in record["items"]:
+                    self._record_sale(item["product_id"], today, item["quantity"])
+                for item in record["items"]:
+                    current = self._status.get(item["product_id"])
+                    if current is not None:
+                        self._update(current.product_id, current.stock, today)
+            elif event in ("product_added", "product_updated", "product_stock"):
+                self._update(record["id"], record["stock"], today)
+            elif event == "product_deleted":
+                self._remove(record["id"])
+
+    # ---- оқу
+    def status(self, pid: int) -> Optional[StockStatus]:
+        with self._lock:
+            self._decay(date.today().toordinal())
+            return self._status.get(pid)
+
+    def low_stock_count(self) -> int:
+        with self._lock:
+            self._decay(date.today().toordinal())
+            return len(self._low)
+
+    def top_at_risk(self, k: int = 10) -> List[StockStatus]:
+        """
+        Heap массивінен ең кіші k тірі жазба: түбірден бастап кандидаттар кезегі арқылы
+        тек қажетті тармақтар ашылады (heap өзі өзгермейді).
+        """
+        result: List[StockStatus] = []
+        with self._lock:
+            self._decay(date.today().toordinal())
+            heap = self._heap
+            frontier = [(heap[0], 0)] if heap else []
+            while frontier and len(result) < k:
+                (_, _, pid, version), i = heapq.heappop(frontier)
+                if self._version.get(pid) == version:
+                    result.append(self._status[pid])
+                for child in (2 * i + 1, 2 * i + 2):
+                    if child < len(heap):
+                        heapq.heappush(frontier, (heap[child], child))
+        return result
+
+_monitor: Optional[InventoryMonitor] = None
+_monitor_lock = threading.Lock()
+
+def get_inventory() -> InventoryMonitor:
+    """Процесс деңгейіндегі монитор: бір рет құрылады, кейін store оқиғаларымен жаңартылады"""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            store = get_store()
+            _monitor = InventoryMonitor()
+            store.subscribe(_monitor.on_store_event, snapshot=lambda s: _monitor.load(s.products(), s.orders()))
+        return _monitor
@@ -0,0 +1,54 @@
+from datetime import datetime, date
+from typing import Optional, Tuple
+from dataclasses import dataclass
+
+# ---------------------------
+# Лабораториялық жұмыс #1: Өзгермейтін деректер құрылымдары
+# ---------------------------
+@dataclass(frozen=True)
+class User:
+    id: int
+    username: str
+    password: str
+    is_admin: bool
+    full_name: str
+    email: str
+    phone: str
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    name: str
+    price: int
+    stock: int
+    description: str
+    image: str
+    category: str
+    rating: float
+
+@dataclass(frozen=True)
+class CartItem:
+    product_id: int
+    quantity: int
+    line_total: Optional[int] = None     # тапсырыста: акциялармен төленген жол сомасы
+
+@dataclass(frozen=True)
+class Shipment:
+    warehouse_id: int
+    items: Tuple[Tuple[int, int], ...]   # (product_id, дана)
+
+    @property
+    def units(self) -> int:
+        return sum(q for _, q in self.items)
+
+@dataclass(frozen=True)
+class Order:
+    id: int
+    user_id: int
+    items: Tuple[CartItem, ...]
+    created_at: datetime
+    status: str
+    total: int
+    address: str
+    delivery_date: date
+    shipments: Tuple[Shipment, ...] = ()
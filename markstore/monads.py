@@ -0,0 +1,54 @@
+# ---------------------------
+# Лабораториялық жұмыс #4: Функционалдық үлгілер (Option/Either)
+# ---------------------------
+class Option:
+    def __init__(self, value=None, is_some=True):
+        self.value = value
+        self.is_some = is_some
+    
+    @staticmethod
+    def some(value):
+        return Option(value, True)
+    
+    @staticmethod
+    def none():
+        return Option(None, False)
+    
+    def map(self, func):
+        if self.is_some:
+            return Option.some(func(self.value))
+        return Option.none()
+    
+    def get_or_else(self, default):
+        return self.value if self.is_some else default
+    
+    def __str__(self):
+        return f"Some({self.value})" if self.is_some else "None"
+
+class Either:
+    def __init__(self, value=None, is_right=True, error=None):
+        self.value = value
+        self.is_right = is_right
+        self.error = error
+    
+    @staticmethod
+    def right(value):
+        return Either(value, True)
+    
+    @staticmethod
+    def left(error):
+        return Either(None, False, error)
+    
+    def map(self, func):
+        if self.is_right:
+            try:
+                return Either.right(func(self.value))
+            except Exception as e:
+                return Either.left(str(e))
+        return Either.left(self.error)
+    
+    def get_or_else(self, default):
+        return self.value if self.is_right else default
+    
+    def __str__(self):
+        return f"Right({self.value})" if self.is_right else f"Left({self.error})"
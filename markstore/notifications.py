@@ -0,0 +1,246 @@
+import asyncio
+import os
+import random
+import smtplib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from typing import List, Dict, Optional
+from dataclasses import dataclass
+
+# ---------------------------
+# Тапсырыс хабарламалары: asyncio негізіндегі фондық конвейер
+# ---------------------------
+@dataclass(frozen=True)
+class Notification:
+    event: str
+    order_id: int
+    email: str
+    full_name: str
+    total: int
+
+NOTIFICATION_SUBJECTS = {
+    "placed": "MarkStore: тапсырыс №{order_id} қабылданды",
+    "shipped": "MarkStore: тапсырыс №{order_id} жолға шықты",
+    "completed": "MarkStore: тапсырыс №{order_id} аяқталды",
+}
+
+@dataclass(frozen=True)
+class SmtpConfig:
+    host: str = "localhost"
+    port: int = 1025
+    sender: str = "noreply@markstore.kz"
+    timeout: float = 10.0
+
+    @staticmethod
+    def from_env() -> "SmtpConfig":
+        """Баптаулар: MARKSTORE_SMTP_HOST / MARKSTORE_SMTP_PORT / MARKSTORE_SMTP_SENDER"""
+        return SmtpConfig(
+            host=os.environ.get("MARKSTORE_SMTP_HOST", "localhost"),
+            port=int(os.environ.get("MARKSTORE_SMTP_PORT", "1025")),
+            sender=os.environ.get("MARKSTORE_SMTP_SENDER", "noreply@markstore.kz"),
+        )
+
+def order_notification(event: str, order: Dict, user: Optional[Dict]) -> Optional[Notification]:
+    """Таза функция: тапсырыс пен пайдаланушыдан хабарлама жасау (email жоқ болса None)"""
+    if event not in NOTIFICATION_SUBJECTS or not user or not user.get("email"):
+        return None
+    return Notification(event, order["id"], user["email"], user.get("full_name", ""), order["total"])
+
+def build_message(notification: Notification, sender: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = notification.email
+    message["Subject"] = NOTIFICATION_SUBJECTS[notification.event].format(order_id=notification.order_id)
+    message.set_content(
+        f"Сәлеметсіз бе, {notification.full_name}!\n\n"
+        f"Тапсырыс №{notification.order_id}, сомасы {notification.total:,} ₸.\n"
+        f"{message['Subject']}.\n\nMarkStore"
+    )
+    return message
+
+class NotificationPipeline:
+    """
+    Фондық ағында жұмыс істейтін asyncio конвейері.
+    submit() тек шектеулі кезекке қояды және ешқашан блоктамайды (кезек толса хабарлама тасталады).
+    Жұмысшылар хабарламаларды топтап (batch) жібереді, әрқайсысының тұрақты SMTP қосылымы бар,
+    қате болса экспоненциалды кідіріспен қайталайды.
+    """
+    def __init__(self, config: SmtpConfig, queue_size: int = 50_000, workers: int = 4,
+                 batch_size: int = 100, batch_linger: float = 0.05,
+                 max_retries: int = 5, backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.config = config
+        self.queue_size = queue_size
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_linger = batch_linger
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = {"submitted": 0, "dropped": 0, "sent": 0, "failed": 0, "retries": 0, "batches": 0}
+        self.dead_letters = deque(maxlen=1000)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="markstore-smtp")
+        self._started = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    # ---- Streamlit ағынынан шақырылатын бөлік
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run_loop, name="markstore-notifications", daemon=True)
+            self._thread.start()
+        self._started.wait()
+
+    def submit(self, notification: Optional[Notification]) -> bool:
+        """O(1), блоктамайды: хабарламаны event loop-қа береді"""
+        if notification is None:
+            return False
+        if self._loop is None:
+            self.start()
+        self._bump("submitted")
+        self._loop.call_soon_threadsafe(self._enqueue, notification)
+        return True
+
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def drain(self, timeout: float = 30.0) -> bool:
+        """Кезек босағанша күту (тесттер мен бенчмарк үшін)"""
+        if self._loop is None:
+            return True
+        future = asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop)
+        try:
+            future.result(timeout)
+            return True
+        except Exception:
+            future.cancel()
+            return False
+
+    # ---- event loop ішіндегі бөлік
+    def _run_loop(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        for i in range(self.workers):
+            self._loop.create_task(self._worker(i))
+        self._started.set()
+        self._loop.run_forever()
+
+    def _enqueue(self, notification: Notification) -> None:
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self._bump("dropped")
+
+    async def _next_batch(self) -> List[Notification]:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.batch_linger
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _worker(self, index: int) -> None:
+        connection: List[Optional[smtplib.SMTP]] = [None]  # жұмысшының тұрақты қосылымы
+        while True:
+            batch = await self._next_batch()
+            size = len(batch)
+            self._bump("batches")
+            # Әрекеттер әр хат бойынша саналады: үзіліс кезінде тек жіберіліп жатқан хат (қалғанның басы)
+            # әрекет жасады деп есептеледі, қосылым мүлде орнамаса — топтағы әр хат
+            attempts: Dict[int, int] = {}   # id(хабарлама) -> сәтсіз әрекеттер саны
+            try:
+                while batch:
+                    try:
+                        remaining = await self._loop.run_in_executor(self._executor, self._send_batch, connection, batch)
+                        tried = remaining[:1]
+                    except (smtplib.SMTPException, OSError):
+                        remaining = tried = batch  # қосылым орнамады, төменде қайталаймыз
+                    batch = remaining
+                    if not batch:
+                        break
+                    for notification in tried:
+                        attempts[id(notification)] = attempts.get(id(notification), 0) + 1
+                    exhausted = [n for n in batch if attempts.get(id(n), 0) > self.max_retries]
+                    if exhausted:
+                        self._bump("failed", len(exhausted))
+                        self.dead_letters.extend(exhausted)
+                        batch = [n for n in batch if attempts.get(id(n), 0) <= self.max_retries]
+                        if not batch:
+                            break
+                    self._bump("retries")
+                    attempt = max(attempts.get(id(n), 0) for n in batch)
+                    delay = min(self.backoff_max, self.backoff_base * 2 ** max(attempt - 1, 0))
+                    await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            finally:
+                for _ in range(size):
+                    self._queue.task_done()
+
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += n
+
+    # ---- executor ағынындағы бөлік (блоктайтын smtplib)
+    def _send_batch(self, connection: List[Optional[smtplib.SMTP]], batch: List[Notification]) -> List[Notification]:
+        """Бір SMTP сессиясы арқылы топты жібереді; жіберілмей қалғандарын қайтарады"""
+        if connection[0] is None:
+            connection[0] = smtplib.SMTP(self.config.host, self.config.port, timeout=self.config.timeout)
+        smtp = connection[0]
+        for i, notification in enumerate(batch):
+            try:
+                smtp.send_message(build_message(notification, self.config.sender))
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                self._close(connection)
+                return batch[i:]
+            except (smtplib.SMTPException, ValueError):
+                # Тек осы хатқа қатысты қате (адрес, SMTPUTF8, жіберуші, мазмұн): қосылым жарамды,
+                # хат dead letter-ге, топтың қалғаны жіберіле береді
+                self._bump("failed")
+                self.dead_letters.append(notification)
+            except OSError:
+                self._close(connection)
+                return batch[i:]
+            else:
+                self._bump("sent")
+        return []
+
+    @staticmethod
+    def _close(connection: List[Optional[smtplib.SMTP]]) -> None:
+        smtp, connection[0] = connection[0], None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+_pipeline: Optional[NotificationPipeline] = None
+_pipeline_lock = threading.Lock()
+
+def get_notification_pipeline() -> NotificationPipeline:
+    """Процесс деңгейіндегі жалғыз конвейер (алғаш қолданғанда іске қосылады)"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = NotificationPipeline(SmtpConfig.from_env())
+        return _pipeline
+
+def notify_order_event(event: str, order: Dict, user: Optional[Dict]) -> bool:
+    """Checkout/статус жаңарту кезінде шақырылады: тек кезекке қояды"""
+    notification = order_notification(event, order, user)
+    if notification is None:
+        return False
+    return get_notification_pipeline().submit(notification)
@@ -0,0 +1,216 @@
+import bisect
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, date, time as dtime
+from typing import List, Dict, Any, Iterable, Mapping, Optional, Tuple
+
+from markstore.services import order_row
+from markstore.store import get_store
+
+# ---------------------------
+# Админ тапсырыстар кестесінің материалдандырылған көрінісі
+# ---------------------------
+SORT_KEYS = ("date", "total", "user")
+_Key = Tuple[datetime, int]  # (created_at, order_id) — барлық индекстер осы ретпен сұрыпталған
+
+@dataclass
+class OrderEntry:
+    order: Mapping            # store-дағы жазбаның көрінісі
+    user: Optional[Mapping]
+    key: _Key
+    status: str
+    row: Optional[Dict[str, Any]] = None  # пішімделген жол: алғаш оқылғанда құрылады, өзгерісте тазаланады
+
+    @property
+    def user_name(self) -> str:
+        return self.user["full_name"] if self.user else "Белгісіз"
+
+@dataclass(frozen=True)
+class OrdersPage:
+    rows: Tuple[Dict[str, Any], ...]
+    matched: int
+    page: int
+    pages: int
+
+    @property
+    def order_ids(self) -> List[int]:
+        return [r["Тапсырыс ID"] for r in self.rows]
+
+class OrdersView:
+    """
+    Пайдаланушымен біріктірілген және пішімделген жолдар: {order_id: OrderEntry}.
+    Индекстер (барлығы / статус / пайдаланушы) (created_at, id) бойынша сұрыпталған тізімдер,
+    сондықтан күн бойынша сұрыптау мен күн аралығы — bisect, ал бет — тек page_size жол.
+    Басқа сұрыптаулар (сома, пайдаланушы) сүзгі бойынша бір рет сұрыпталып, нұсқа өзгергенше кэште тұрады.
+    Store оқиғалары тек өзгерген тапсырыстарды жаңартады.
+    """
+    def __init__(self, sort_cache_size: int = 16):
+        self._sort_cache_size = sort_cache_size
+        self._lock = threading.RLock()
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.revenue = 0
+        self.status_counts: Dict[str, int] = {}
+        self._entries: Dict[int, OrderEntry] = {}
+        self._all: List[_Key] = []
+        self._by_status: Dict[str, List[_Key]] = {}
+        self._by_user: Dict[int, List[_Key]] = {}
+        self._sorted: "OrderedDict[tuple, Tuple[int, List[int]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---- инкременталды жаңарту
+    def _add(self, order: Mapping, user: Optional[Mapping]) -> None:
+        key = (order["created_at"], order["id"])
+        entry = OrderEntry(order, user, key, order["status"])
+        self._entries[order["id"]] = entry
+        bisect.insort(self._all, key)
+        bisect.insort(self._by_status.setdefault(entry.status, []), key)
+        bisect.insort(self._by_user.setdefault(order["user_id"], []), key)
+        self.revenue += order["total"]
+        self.status_counts[entry.status] = self.status_counts.get(entry.status, 0) + 1
+
+    def _set_status(self, order: Mapping) -> None:
+        entry = self._entries.get(order["id"])
+        if entry is None or entry.status == order["status"]:
+            return
+        old = self._by_status[entry.status]
+        del old[bisect.bisect_left(old, entry.key)]
+        self.status_counts[entry.status] -= 1
+        entry.status = order["status"]
+        bisect.insort(self._by_status.setdefault(entry.status, []), entry.key)
+        self.status_counts[entry.status] = self.status_counts.get(entry.status, 0) + 1
+        entry.row = None
+
+    def _remove(self, order_ids: Iterable[int]) -> None:
+        """Мұрағатталған тапсырыстар: көрініс тек ыстық жиынды көрсетеді, индекстер бір өтуде сүзіледі"""
+        removed = set()
+        for order_id in order_ids:
+            entry = self._entries.pop(order_id, None)
+            if entry is None:
+                continue
+            removed.add(order_id)
+            self.revenue -= entry.order["total"]
+            self.status_counts[entry.status] -= 1
+        if not removed:
+            return
+        keep = lambda keys: [k for k in keys if k[1] not in removed]
+        self._all = keep(self._all)
+        self._by_status = {s: keep(keys) for s, keys in self._by_status.items()}
+        self._by_user = {u: keep(keys) for u, keys in self._by_user.items()}
+
+    def _refresh_user(self, user_id: int, user: Optional[Mapping]) -> None:
+        """Пайдаланушы аты өзгерсе немесе өшірілсе, тек соның тапсырыстарының жолдары"""
+        for _, order_id in self._by_user.get(user_id, ()):
+            entry = self._entries[order_id]
+            entry.user = user
+            entry.row = None
+
+    def _row(self, order_id: int) -> Dict[str, Any]:
+        entry = self._entries[order_id]
+        if entry.row is None:
+            entry.row = order_row(entry.order, entry.user)
+        return entry.row
+
+    def load(self, orders: Iterable[Mapping], users: Iterable[Mapping]) -> None:
+        by_id = {u["id"]: u for u in users}
+        with self._lock:
+            self._reset()
+            self.version += 1
+            for order in sorted(orders, key=lambda o: (o["created_at"], o["id"])):
+                key = (order["created_at"], order["id"])
+                entry = OrderEntry(order, by_id.get(order["user_id"]), key, order["status"])
+                self._entries[order["id"]] = entry
+                # Кілттер өсу ретімен келеді, сондықтан append жеткілікті
+                self._all.append(key)
+                self._by_status.setdefault(entry.status, []).append(key)
+                self._by_user.setdefault(order["user_id"], []).append(key)
+                self.revenue += order["total"]
+                self.status_counts[entry.status] = self.status_counts.get(entry.status, 0) + 1
+
+    def on_store_event(self, event: str, record: Mapping) -> None:
+        with self._lock:
+            if event == "order_placed":
+                self._add(record, get_store().get_user(record["user_id"]))
+            elif event == "order_status":
+                self._set_status(record)
+            elif event == "orders_archived":
+                self._remove(record["ids"])
+            elif event == "user_updated":
+                self._refresh_user(record["id"], record)
+            elif event == "user_deleted":
+                self._refresh_user(record["id"], None)
+            else:
+                return
+            self.version += 1
+
+    # ---- сұраныс
+    def _base(self, status: Optional[str], user_id: Optional[int]) -> List[_Key]:
+        if user_id is not None:
+            keys = self._by_user.get(user_id, [])
+            if status is not None:
+                keys = [k for k in keys if self._entries[k[1]].status == status]
+            return keys
+        if status is not None:
+            return self._by_status.get(status, [])
+        return self._all
+
+    def query(self, status: Optional[str] = None, user_id: Optional[int] = None,
+              date_from: Optional[date] = None, date_to: Optional[date] = None,
+              sort: str = "date", descending: bool = True, page: int = 0, page_size: int = 50) -> OrdersPage:
+        """Сүзгі + сұрыптау + бет: күн бойынша O(log n + page_size)"""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Белгісіз сұрыптау: {sort}")
+        with self._lock:
+            keys = self._base(status, user_id)
+            lo = bisect.bisect_left(keys, (datetime.combine(date_from, dtime.min), -1)) if date_from else 0
+            hi = bisect.bisect_left(keys, (datetime.combine(date_to, dtime.max), float("inf"))) if date_to else len(keys)
+            matched = max(0, hi - lo)
+            pages = max(1, -(-matched // page_size))
+            page = min(max(page, 0), pages - 1)
+            start = page * page_size
+            stop = min(start + page_size, matched)
+            if sort == "date":
+                if descending:
+                    ids = [keys[hi - 1 - i][1] for i in range(start, stop)]
+                else:
+                    ids = [keys[lo + i][1] for i in range(start, stop)]
+            else:
+                ordered = self._sorted_ids(keys, lo, hi, status, user_id, date_from, date_to, sort, descending)
+                ids = ordered[start:stop]
+            rows = tuple(self._row(i) for i in ids)
+        return OrdersPage(rows, matched, page, pages)
+
+    def _sorted_ids(self, keys: List[_Key], lo: int, hi: int, *cache_key) -> List[int]:
+        cached = self._sorted.get(cache_key)
+        if cached is not None and cached[0] == self.version:
+            self._sorted.move_to_end(cache_key)
+            return cached[1]
+        sort, descending = cache_key[-2], cache_key[-1]
+        entries = self._entries
+        if sort == "total":
+            sort_key = lambda k: (entries[k[1]].order["total"], k)
+        else:
+            sort_key = lambda k: (entries[k[1]].user_name, k)
+        ids = [k[1] for k in sorted(keys[lo:hi], key=sort_key, reverse=descending)]
+        self._sorted[cache_key] = (self.version, ids)
+        if len(self._sorted) > self._sort_cache_size:
+            self._sorted.popitem(last=False)
+        return ids
+
+_view: Optional[OrdersView] = None
+_view_lock = threading.Lock()
+
+def get_orders_view() -> OrdersView:
+    """Процесс деңгейіндегі көрініс: бір рет құрылады, кейін store оқиғаларымен жаңартылады"""
+    global _view
+    with _view_lock:
+        if _view is None:
+            store = get_store()
+            _view = OrdersView()
+            store.subscribe(_view.on_store_event, snapshot=lambda s: _view.load(s.orders(), s.users()))
+        return _view
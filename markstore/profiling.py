@@ -0,0 +1,198 @@
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Callable
+from dataclasses import dataclass, field
+from functools import wraps
+
+# ---------------------------
+# Өнімділікті өлшеу: уақыт аралықтары (span) және санауыштар
+# ---------------------------
+@dataclass
+class RerunProfile:
+    label: str
+    started_at: datetime
+    wall_start: float
+    cpu_start: float
+    wall: float = 0.0
+    cpu: float = 0.0
+    alloc_peak: Optional[int] = None
+    interrupted: bool = False
+    spans: Dict[str, List[float]] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    stack: List[str] = field(default_factory=list)
+
+class Profiler:
+    """
+    Процесс деңгейіндегі профильдеуші.
+    Әр rerun үшін wall/CPU уақытын, span-дарды (flame-graph үшін "a;b;c" жолдары),
+    санауыштарды және tracemalloc арқылы іріктелген жады шыңын жинайды.
+    Ағымдағы rerun thread-local түрінде сақталады, өйткені әр сессия өз ағынында орындалады.
+    """
+    def __init__(self, history: int = 50, alloc_sample_every: int = 10):
+        self.history = deque(maxlen=history)
+        self.alloc_sample_every = alloc_sample_every
+        self.caches: Dict[str, Callable] = {}
+        self.span_totals: Dict[str, List[float]] = {}
+        self.counter_totals: Dict[str, int] = {}
+        self.reruns_total = 0
+        self.wall_total = 0.0
+        self.cpu_total = 0.0
+        self._started = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def current(self) -> Optional[RerunProfile]:
+        return getattr(self._local, "record", None)
+
+    def begin_rerun(self, label: str) -> None:
+        # Аяқталмай қалған алдыңғы жазбаны жабамыз
+        if self.current() is not None:
+            self.end_rerun(interrupted=True)
+        with self._lock:
+            self._started += 1
+            sample_alloc = self._started % self.alloc_sample_every == 1 and not tracemalloc.is_tracing()
+            if sample_alloc:
+                tracemalloc.start()
+        self._local.record = RerunProfile(label, datetime.now(), time.perf_counter(), time.thread_time(),
+                                          alloc_peak=0 if sample_alloc else None)
+
+    @contextmanager
+    def rerun(self, label: str):
+        """Бүкіл скрипт орындалуын қамтиды; st.rerun() үзген rerun да жабылады"""
+        self.begin_rerun(label)
+        try:
+            yield
+        except BaseException:
+            self.end_rerun(interrupted=True)
+            raise
+        self.end_rerun()
+
+    def relabel(self, label: str) -> None:
+        record = self.current()
+        if record is not None:
+            record.label = label
+
+    def end_rerun(self, interrupted: bool = False) -> None:
+        record = self.current()
+        if record is None:
+            return
+        self._local.record = None
+        record.wall = time.perf_counter() - record.wall_start
+        record.cpu = time.thread_time() - record.cpu_start
+        record.interrupted = interrupted
+        record.stack = []
+        with self._lock:
+            if record.alloc_peak is not None:
+                record.alloc_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.history.append(record)
+            self.reruns_total += 1
+            self.wall_total += record.wall
+            self.cpu_total += record.cpu
+            for path, (calls, wall, cpu) in record.spans.items():
+                total = self.span_totals.setdefault(path, [0, 0.0, 0.0])
+                total[0] += calls
+                total[1] += wall
+                total[2] += cpu
+            for name, n in record.counters.items():
+                self.counter_totals[name] = self.counter_totals.get(name, 0) + n
+
+    @contextmanager
+    def span(self, name: str):
+        record = self.current()
+        if record is None:
+            yield
+            return
+        record.stack.append(name)
+        path = ";".join(record.stack)
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            stat = record.spans.setdefault(path, [0, 0.0, 0.0])
+            stat[0] += 1
+            stat[1] += time.perf_counter() - wall0
+            stat[2] += time.thread_time() - cpu0
+            if record.stack:
+                record.stack.pop()
+
+    def count(self, name: str, n: int = 1) -> None:
+        record = self.current()
+        if record is not None:
+            record.counters[name] = record.counters.get(name, 0) + n
+
+    def register_cache(self, name: str, cached_func: Callable) -> None:
+        self.caches[name] = cached_func
+
+    def cache_hit_rates(self) -> Dict[str, Tuple[int, int, float]]:
+        """lru_cache.cache_info() негізінде (hits, misses, hit rate)"""
+        rates = {}
+        for name, func in self.caches.items():
+            info = func.cache_info()
+            lookups = info.hits + info.misses
+            rates[name] = (info.hits, info.misses, info.hits / lookups if lookups else 0.0)
+        return rates
+
+    def flame_breakdown(self) -> List[Tuple[str, int, float, float]]:
+        """Соңғы N rerun бойынша (жол, тереңдік, wall секунд, rerun-ға үлесі) тізімі"""
+        with self._lock:
+            records = list(self.history)
+        if not records:
+            return []
+        merged: Dict[str, float] = {}
+        for record in records:
+            for path, (_, wall, _) in record.spans.items():
+                merged[path] = merged.get(path, 0.0) + wall
+        total_wall = sum(r.wall for r in records) or 1.0
+        return [(path, path.count(";"), wall, wall / total_wall) for path, wall in sorted(merged.items())]
+
+    def prometheus_text(self) -> str:
+        """Prometheus text exposition форматындағы метрикалар"""
+        def esc(value: str) -> str:
+            return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        with self._lock:
+            lines = [
+                "# HELP markstore_reruns_total Profiled script reruns.",
+                "# TYPE markstore_reruns_total counter",
+                f"markstore_reruns_total {self.reruns_total}",
+                "# TYPE markstore_rerun_wall_seconds_total counter",
+                f"markstore_rerun_wall_seconds_total {self.wall_total:.6f}",
+                "# TYPE markstore_rerun_cpu_seconds_total counter",
+                f"markstore_rerun_cpu_seconds_total {self.cpu_total:.6f}",
+                "# TYPE markstore_span_calls_total counter",
+            ]
+            spans = sorted(self.span_totals.items())
+            lines += [f'markstore_span_calls_total{{span="{esc(p)}"}} {int(s[0])}' for p, s in spans]
+            lines.append("# TYPE markstore_span_wall_seconds_total counter")
+            lines += [f'markstore_span_wall_seconds_total{{span="{esc(p)}"}} {s[1]:.6f}' for p, s in spans]
+            lines.append("# TYPE markstore_span_cpu_seconds_total counter")
+            lines += [f'markstore_span_cpu_seconds_total{{span="{esc(p)}"}} {s[2]:.6f}' for p, s in spans]
+            lines.append("# TYPE markstore_events_total counter")
+            lines += [f'markstore_events_total{{name="{esc(n)}"}} {v}' for n, v in sorted(self.counter_totals.items())]
+            sampled = [r.alloc_peak for r in self.history if r.alloc_peak is not None]
+        lines.append("# TYPE markstore_cache_hit_ratio gauge")
+        lines += [f'markstore_cache_hit_ratio{{cache="{esc(n)}"}} {rate:.4f}' for n, (_, _, rate) in self.cache_hit_rates().items()]
+        if sampled:
+            lines.append("# TYPE markstore_rerun_alloc_peak_bytes gauge")
+            lines.append(f"markstore_rerun_alloc_peak_bytes {sampled[-1]}")
+        return "\n".join(lines) + "\n"
+
+# Модуль бір рет импортталады, сондықтан профильдеуші барлық сессияларға ортақ
+PROFILER = Profiler()
+
+def instrumented(name: str) -> Callable:
+    """Декоратор: функция шақыруын ағымдағы rerun-ның span-ы ретінде тіркейді"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if PROFILER.current() is None:
+                return func(*args, **kwargs)
+            with PROFILER.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,250 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from markstore.monads import Either
+from markstore.profiling import PROFILER
+from markstore.store import get_store
+
+# ---------------------------
+# Акциялар: санат/өнім жеңілдіктері, жиынтық (bundle) ұсыныстар, уақыт терезелері
+# ---------------------------
+PROMOTION_KINDS = ("category", "product", "bundle")
+
+@dataclass(frozen=True)
+class Promotion:
+    id: int
+    name: str
+    kind: str                                # "category" | "product" | "bundle"
+    percent: int
+    category: str = ""                       # kind == "category"
+    product_ids: Tuple[int, ...] = ()        # "product": кез келгені; "bundle": бәрі бірге алынса
+    starts: Optional[datetime] = None
+    ends: Optional[datetime] = None          # қоса емес
+
+    def active_at(self, now: datetime) -> bool:
+        return (self.starts is None or self.starts <= now) and (self.ends is None or now < self.ends)
+
+@dataclass(frozen=True)
+class PricedLine:
+    product_id: int
+    quantity: int
+    unit_price: int
+    subtotal: int
+    discount: int
+    promotions: Tuple[str, ...] = ()
+
+    @property
+    def total(self) -> int:
+        return self.subtotal - self.discount
+
+@dataclass(frozen=True)
+class CartPricing:
+    lines: Tuple[PricedLine, ...]
+    subtotal: int
+    discount: int
+
+    @property
+    def total(self) -> int:
+        return self.subtotal - self.discount
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """
+    Белгілі бір уақыт аралығында белсенді ережелердің индекстері.
+    [valid_from, valid_until) ішінде қайта компиляция қажет емес.
+    """
+    revision: int
+    by_product: Mapping[int, Tuple[int, str]]          # product_id -> (ең үлкен %, акция аты)
+    by_category: Mapping[str, Tuple[int, str]]         # санат -> (ең үлкен %, акция аты)
+    bundles: Mapping[int, Tuple[Promotion, ...]]       # product_id -> оны қамтитын жиынтықтар
+    valid_from: Optional[datetime] = None
+    valid_until: Optional[datetime] = None
+
+    def covers(self, now: datetime) -> bool:
+        return (self.valid_from is None or self.valid_from <= now) and (self.valid_until is None or now < self.valid_until)
+
+def compile_rules(promotions: Iterable[Promotion], now: datetime, revision: int) -> CompiledRules:
+    """Таза функция: now сәтінде белсенді ережелерді өнім/санат бойынша индекстеу"""
+    promotions = list(promotions)
+    by_product: Dict[int, Tuple[int, str]] = {}
+    by_category: Dict[str, Tuple[int, str]] = {}
+    bundles: Dict[int, List[Promotion]] = {}
+    for promo in promotions:
+        if not promo.active_at(now):
+            continue
+        if promo.kind == "category":
+            if promo.percent > by_category.get(promo.category, (0, ""))[0]:
+                by_category[promo.category] = (promo.percent, promo.name)
+        elif promo.kind == "product":
+            for pid in promo.product_ids:
+                if promo.percent > by_product.get(pid, (0, ""))[0]:
+                    by_product[pid] = (promo.percent, promo.name)
+        elif promo.kind == "bundle":
+            for pid in set(promo.product_ids):
+                bundles.setdefault(pid, []).append(promo)
+    # Келесі шекараға дейін (кез келген ереже басталатын/аяқталатын сәт) индекстер өзгермейді
+    bounds = [b for p in promotions for b in (p.starts, p.ends) if b is not None]
+    return CompiledRules(
+        revision, by_product, by_category,
+        {pid: tuple(sorted(ps, key=lambda p: -p.percent)) for pid, ps in bundles.items()},
+        valid_from=max((b for b in bounds if b <= now), default=None),
+        valid_until=min((b for b in bounds if b > now), default=None),
+    )
+
+def price_lines(lines: Sequence[Tuple[int, str, int, int]], rules: CompiledRules) -> CartPricing:
+    """
+    Таза функция: бүкіл себетті бір өтуде бағалау. lines — (product_id, санат, бірлік бағасы, саны).
+    Әр бірлікке ең үлкен бір жеңілдік қолданылады (қосылмайды): өнім/санат ережесі немесе,
+    бірлік жиынтыққа кірсе, жиынтық ережесі. Жиынтықтар пайызы кему ретімен бірліктерді жинайды.
+    """
+    quantities: Dict[int, int] = {}
+    for pid, _, _, qty in lines:
+        quantities[pid] = quantities.get(pid, 0) + qty
+
+    # Жиынтықтар: тек себеттегі өнімдердің индексі қаралады
+    bundled: Dict[int, List[Tuple[int, int, str]]] = {}   # pid -> [(бірлік, %, аты)]
+    used: Dict[int, int] = {}
+    candidates = {promo.id: promo for pid in quantities for promo in rules.bundles.get(pid, ())}
+    for promo in sorted(candidates.values(), key=lambda p: -p.percent):
+        sets = min(quantities.get(pid, 0) - used.get(pid, 0) for pid in promo.product_ids)
+        if sets <= 0:
+            continue
+        for pid in promo.product_ids:
+            used[pid] = used.get(pid, 0) + sets
+            bundled.setdefault(pid, []).append((sets, promo.percent, promo.name))
+
+    priced = []
+    subtotal = discount = 0
+    for pid, category, price, qty in lines:
+        best, name = max(rules.by_product.get(pid, (0, "")), rules.by_category.get(category, (0, "")))
+        line_discount, names = 0, []
+        remaining = qty
+        used_best = False   # өнім/санат ережесі кем дегенде бір бірлікке қолданылды ма
+        for units, percent, bundle_name in bundled.pop(pid, ()):
+            units = min(units, remaining)
+            remaining -= units
+            if percent > best:
+                line_discount += units * price * percent // 100
+                names.append(bundle_name)
+            elif units:
+                line_discount += units * price * best // 100
+                used_best = True
+        line_discount += remaining * price * best // 100
+        if best and (used_best or remaining > 0):
+            names.insert(0, name)
+        line_subtotal = price * qty
+        priced.append(PricedLine(pid, qty, price, line_subtotal, line_discount, tuple(dict.fromkeys(names))))
+        subtotal += line_subtotal
+        discount += line_discount
+    return CartPricing(tuple(priced), subtotal, discount)
+
+class PromotionEngine:
+    """
+    Ережелер тізімі + компиляцияланған индекстер + себет бағаларының LRU кэші.
+    Кэш кілті — (себет жолдары, ережелер ревизиясы): жолдар өнім id, санат, баға және санынан
+    құралады, яғни тек бағаға әсер ететін өрістерден. Баға/санат өзгерсе ескі нәтиже қолданылмайды,
+    ал checkout-тағы қалдық өзгерісі кэшті ескіртпейді.
+    Ереже қосылса/өшірілсе немесе уақыт терезесінің шекарасы өтсе, ревизия өседі.
+    """
+    def __init__(self, promotions: Iterable[Promotion] = (), cache_size: int = 4096):
+        self._promotions: Dict[int, Promotion] = {p.id: p for p in promotions}
+        self._compiled: Optional[CompiledRules] = None
+        self._compiles = 0
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[tuple, CartPricing]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---- ережелер
+    def promotions(self) -> Tuple[Promotion, ...]:
+        with self._lock:
+            return tuple(self._promotions.values())
+
+    def add(self, name: str, kind: str, percent: int, category: str = "", product_ids: Iterable[int] = (),
+            starts: Optional[datetime] = None, ends: Optional[datetime] = None) -> Either:
+        if kind not in PROMOTION_KINDS:
+            return Either.left(f"Белгісіз акция түрі: {kind}")
+        if not 0 < percent < 100:
+            return Either.left("Жеңілдік 1–99% аралығында болуы керек")
+        product_ids = tuple(product_ids)
+        if kind == "category" and not category:
+            return Either.left("Санат таңдалмады")
+        if kind == "product" and not product_ids:
+            return Either.left("Өнім таңдалмады")
+        if kind == "bundle" and len(set(product_ids)) < 2:
+            return Either.left("Жиынтыққа кемінде екі өнім керек")
+        if starts and ends and ends <= starts:
+            return Either.left("Аяқталу уақыты басталудан кейін болуы керек")
+        with self._lock:
+            promo = Promotion(max(self._promotions, default=0) + 1, name.strip() or f"Акция {kind}", kind, percent,
+                              category, tuple(dict.fromkeys(product_ids)), starts, ends)
+            self._promotions[promo.id] = promo
+            self._compiled = None
+        return Either.right(promo)
+
+    def remove(self, promo_id: int) -> None:
+        with self._lock:
+            if self._promotions.pop(promo_id, None) is not None:
+                self._compiled = None
+
+    def compiled(self, now: Optional[datetime] = None) -> CompiledRules:
+        now = now or datetime.now()
+        with self._lock:
+            compiled = self._compiled
+            if compiled is None or not compiled.covers(now):
+                self._compiles += 1
+                # Ревизия ереже өзгерісін де, уақыт шекарасын да қамтиды: ескі кэш жазбалары жай сәйкес келмейді
+                compiled = self._compiled = compile_rules(self._promotions.values(), now, self._compiles)
+            return compiled
+
+    # ---- бағалау
+    def price(self, lines: Sequence[Tuple[int, str, int, int]], now: Optional[datetime] = None) -> CartPricing:
+        """Кэшсіз: (product_id, санат, бірлік бағасы, саны) жолдары"""
+        return price_lines(lines, self.compiled(now))
+
+    def price_cart(self, items: Iterable[Mapping], now: Optional[datetime] = None) -> Either:
+        """Себетті ортақ store бағаларымен бағалау; нәтиже (себет кілті, ревизия) бойынша кэштеледі"""
+        store = get_store()
+        rules = self.compiled(now)
+        lines = []
+        for item in items:
+            product = store.get_product(item["product_id"])
+            if product is None:
+                return Either.left(f"Өнім {item['product_id']} табылмады")
+            lines.append((product["id"], product["category"], product["price"], item["quantity"]))
+        key = (tuple(sorted(lines)), rules.revision)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return Either.right(cached)
+        pricing = price_lines(lines, rules)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = pricing
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return Either.right(pricing)
+
+    def cache_info(self) -> SimpleNamespace:
+        """PROFILER.register_cache үшін lru_cache-пен үйлесімді"""
+        return SimpleNamespace(hits=self.hits, misses=self.misses, maxsize=self.cache_size,
+                               currsize=len(self._cache))
+
+_engine: Optional[PromotionEngine] = None
+_engine_lock = threading.Lock()
+
+def get_promotions() -> PromotionEngine:
+    """Процесс деңгейіндегі акциялар қозғалтқышы (ережелер админ панелінен қосылады)"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = PromotionEngine()
+            PROFILER.register_cache("cart_pricing", _engine)
+        return _engine
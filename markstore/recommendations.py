@@ -0,0 +1,144 @@
+import heapq
+import threading
+from typing import List, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from markstore.store import get_store
+
+# ---------------------------
+# "Жиі бірге алынады": тапсырыстардағы бірге кездесу (co-occurrence) моделі
+# ---------------------------
+class CoOccurrenceModel:
+    """
+    Өнім–өнім бірге кездесуінің сирек матрицасы: {product_id: {neighbor_id: count}}.
+    Әр жолдағы көршілер саны capacity-мен шектеледі (Space-Saving: толса ең аз санды
+    көрші ығыстырылады), сондықтан жады O(өнімдер × capacity).
+    Top-k тізімі кэштеледі және тек жол өзгергенде қайта есептеледі, сондықтан оқу O(k).
+    """
+    def __init__(self, k: int = 4, capacity: int = 64):
+        self.k = k
+        self.capacity = capacity
+        self.orders_seen = 0
+        self._rows: Dict[int, Dict[int, int]] = {}
+        self._top: Dict[int, Tuple[int, ...]] = {}
+        self._lock = threading.Lock()
+
+    def _bump(self, a: int, b: int, n: int) -> None:
+        row = self._rows.setdefault(a, {})
+        if b in row:
+            row[b] += n
+        elif len(row) < self.capacity:
+            row[b] = n
+        else:
+            victim = min(row, key=row.get)
+            row[b] = row.pop(victim) + n
+        self._top.pop(a, None)
+
+    def add_order(self, product_ids: Iterable[int]) -> None:
+        """Checkout кезінде инкременталды жаңарту: O(m²) мұндағы m — тапсырыстағы әртүрлі өнімдер"""
+        ids = sorted(set(product_ids))
+        with self._lock:
+            self.orders_seen += 1
+            for a in ids:
+                for b in ids:
+                    if a != b:
+                        self._bump(a, b, 1)
+
+    def neighbors(self, product_id: int) -> Tuple[int, ...]:
+        """Жиі бірге алынатын top-k өнім id-лері"""
+        top = self._top.get(product_id)
+        if top is not None:
+            return top
+        with self._lock:
+            row = self._rows.get(product_id, {})
+            top = tuple(b for b, _ in heapq.nlargest(self.k, row.items(), key=lambda kv: (kv[1], -kv[0])))
+            self._top[product_id] = top
+        return top
+
+    def suggestions_for(self, product_ids: Iterable[int]) -> List[int]:
+        """Себет үшін: себеттегі өнімдердің көршілерін жинау (себетте барларын алып тастап)"""
+        in_cart = set(product_ids)
+        scores: Dict[int, int] = {}
+        for pid in in_cart:
+            for rank, other in enumerate(self.neighbors(pid)):
+                if other not in in_cart:
+                    scores[other] = scores.get(other, 0) + self.k - rank
+        return sorted(scores, key=lambda pid: (-scores[pid], pid))[:self.k]
+
+    def load(self, orders_items: Sequence[Sequence[int]]) -> None:
+        """
+        Тапсырыс тарихынан толық қайта құру.
+        numpy бар болса векторланған жол қолданылады, жоқ болса таза Python.
+        """
+        try:
+            import numpy  # noqa: F401  (pandas арқылы әдетте орнатылған)
+        except ImportError:
+            self.load_counts(())
+            for items in orders_items:
+                self.add_order(items)
+            return
+        self.load_counts(_vectorized_pairs(orders_items, self.capacity), orders_seen=len(orders_items))
+
+    def on_store_event(self, event: str, record: Mapping) -> None:
+        if event == "order_placed":
+            self.add_order(it["product_id"] for it in record["items"])
+
+    def load_counts(self, pairs: Iterable[Tuple[int, int, int]], orders_seen: int = 0) -> None:
+        """Топтық құрылымнан (a, b, count) үштіктерін жүктеу"""
+        with self._lock:
+            self._rows.clear()
+            self._top.clear()
+            self.orders_seen = orders_seen
+            for a, b, n in pairs:
+                self._bump(a, b, n)
+
+def build_model(orders_items: Sequence[Sequence[int]], k: int = 4, capacity: int = 64) -> CoOccurrenceModel:
+    """Тапсырыс тарихынан модельді бір рет құру (CoOccurrenceModel.load)"""
+    model = CoOccurrenceModel(k=k, capacity=capacity)
+    model.load(orders_items)
+    return model
+
+def _vectorized_pairs(orders_items: Sequence[Sequence[int]], capacity: int) -> List[Tuple[int, int, int]]:
+    """Барлық жұптарды numpy арқылы санау және әр жол үшін ең үлкен capacity санын қалдыру"""
+    import numpy as np
+
+    sizes = np.fromiter((len(set(items)) for items in orders_items), dtype=np.int64, count=len(orders_items))
+    if sizes.sum() == 0:
+        return []
+    items = np.fromiter((pid for order in orders_items for pid in sorted(set(order))), dtype=np.int64, count=int(sizes.sum()))
+    product_ids, codes = np.unique(items, return_inverse=True)
+    n = len(product_ids)
+
+    # Әр элементті өз тапсырысындағы барлық элементтермен жұптау
+    starts = np.cumsum(sizes) - sizes
+    elem_size = np.repeat(sizes, sizes)
+    elem_start = np.repeat(starts, sizes)
+    left = np.repeat(codes, elem_size)
+    offsets = np.arange(int(elem_size.sum())) - np.repeat(np.cumsum(elem_size) - elem_size, elem_size)
+    right = codes[np.repeat(elem_start, elem_size) + offsets]
+    mask = left != right
+    keys, counts = np.unique(left[mask] * n + right[mask], return_counts=True)
+
+    # Әр жол ішінде санның кемуі бойынша сұрыптап, алғашқы capacity жазбаны қалдыру
+    rows, cols = keys // n, keys % n
+    order = np.lexsort((cols, -counts, rows))
+    rows, cols, counts = rows[order], cols[order], counts[order]
+    row_start = np.searchsorted(rows, rows, side="left")
+    keep = (np.arange(len(rows)) - row_start) < capacity
+    return list(zip(product_ids[rows[keep]].tolist(), product_ids[cols[keep]].tolist(), counts[keep].tolist()))
+
+_model: Optional[CoOccurrenceModel] = None
+_model_lock = threading.Lock()
+
+def get_recommender() -> CoOccurrenceModel:
+    """
+    Процесс деңгейіндегі модель: бірінші шақыруда ортақ тапсырыс тарихынан құрылады,
+    кейін әр "order_placed" оқиғасында инкременталды жаңартылады.
+    """
+    global _model
+    with _model_lock:
+        if _model is None:
+            store = get_store()
+            _model = CoOccurrenceModel()
+            store.subscribe(_model.on_store_event,
+                            snapshot=lambda s: _model.load([[it["product_id"] for it in o["items"]] for o in s.orders()]))
+        return _model
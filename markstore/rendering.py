@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Callable, Mapping
+
+from markstore.profiling import PROFILER
+from markstore.services import format_price
+
+# ---------------------------
+# Рендеринг кэштері: баға пішімдеу және өнім карточкаларының HTML-і
+# ---------------------------
+@lru_cache(maxsize=8192)
+def price_text(num: int | float) -> str:
+    """format_price-тің шектелген мемоизацияланған нұсқасы (бағалар жиі қайталанады)"""
+    return format_price(num)
+
+PROFILER.register_cache("price_text", price_text)
+
+def format_price_column(values: Any) -> Any:
+    """
+    Баға бағанын векторлы пішімдеу: pandas.factorize арқылы әр бірегей мән бір рет қана
+    пішімделеді, нәтиже кодтар бойынша numpy take арқылы таратылады.
+    pandas Series берілсе Series, әйтпесе тізім қайтарады.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    formatted = np.array([price_text(u) for u in uniques.tolist()] + [""], dtype=object)
+    result = formatted[codes]  # -1 (NaN) соңғы бос жолға түседі
+    if isinstance(values, pd.Series):
+        return pd.Series(result, index=values.index, name=values.name)
+    return result.tolist()
+
+@lru_cache(maxsize=64)
+def rating_stars(rating: float) -> str:
+    full_stars = int(rating)
+    return "⭐" * full_stars + ("☆" if rating - full_stars >= 0.5 else "")
+
+class FragmentCache:
+    """
+    (кілт, нұсқа) бойынша дайын HTML үзінділері, LRU бойынша maxsize-пен шектелген.
+    Нұсқа өзгерсе (мысалы, өнім жаңартылса) үзінді қайта құрылады.
+    """
+    def __init__(self, render: Callable[[Mapping], str], maxsize: int = 10_000):
+        self.render = render
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._fragments: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, version: int, record: Mapping) -> str:
+        with self._lock:
+            cached = self._fragments.get(key)
+            if cached is not None and cached[0] == version:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+        html = self.render(record)
+        with self._lock:
+            self.misses += 1
+            self._fragments[key] = (version, html)
+            self._fragments.move_to_end(key)
+            if len(self._fragments) > self.maxsize:
+                self._fragments.popitem(last=False)
+        return html
+
+    def cache_info(self) -> SimpleNamespace:
+        """PROFILER.register_cache үшін lru_cache-пен үйлесімді"""
+        return SimpleNamespace(hits=self.hits, misses=self.misses, maxsize=self.maxsize,
+                               currsize=len(self._fragments))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+
+def render_product_card(p: Mapping) -> str:
+    rating = float(p.get("rating", 4))
+    return f"""
+                    <div class="product-card">
+                        <h3>{p['name']}</h3>
+                        <img src='{p['image']}' width='100%' style='border-radius: 12px; margin: 10px auto; object-fit:cover;'>
+                        <p style='font-size:14px; color:#000000; min-height: 40px;'>{p['description']}</p>
+                        <div style="margin:10px 0; color:#000000;">{rating_stars(rating)} ({p.get('rating', 4)})</div>
+                        <span class="price-badge">{price_text(p['price'])}</span>
+                        <p style="color:#000000;">📦 Қалдық: {p['stock']} дана</p>
+                        <p style="color:#000000;">📂 {p['category']}</p>
+                    </div>
+                    """
+
+PRODUCT_CARDS = FragmentCache(render_product_card)
+PROFILER.register_cache("product_cards", PRODUCT_CARDS)
+
+def product_card_html(p: Mapping, revision: int) -> str:
+    """Өнім нұсқасы (SharedStore.product_revision_of) өзгермесе, дайын HTML қайтарылады"""
+    return PRODUCT_CARDS.get(p["id"], revision, p)
@@ -0,0 +1,164 @@
+import re
+import threading
+import time
+import unicodedata
+from typing import List, Dict, Set, Tuple, Container, Iterable, Optional
+
+# ---------------------------
+# Қатеге төзімді іздеу: транслитерация, триграм индексі, edit distance
+# ---------------------------
+# Қазақ кирилл әліпбиі → латын (2021 ж. нұсқасы), кейін диакритика алынып тасталады
+CYRILLIC_TO_LATIN = {
+    "а": "a", "ә": "ä", "б": "b", "в": "v", "г": "g", "ғ": "ğ", "д": "d", "е": "e", "ё": "io",
+    "ж": "j", "з": "z", "и": "i", "й": "i", "к": "k", "қ": "q", "л": "l", "м": "m", "н": "n",
+    "ң": "ñ", "о": "o", "ө": "ö", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ұ": "ū",
+    "ү": "ü", "ф": "f", "х": "h", "һ": "h", "ц": "ts", "ч": "ch", "ш": "ş", "щ": "şş", "ъ": "",
+    "ы": "y", "і": "ı", "ь": "", "э": "e", "ю": "iu", "я": "ia",
+}
+_TRANSLIT_TABLE = str.maketrans(CYRILLIC_TO_LATIN)
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+def normalize(text: str) -> str:
+    """Таза функция: кіші әріп, кирилл→латын, диакритикасыз ASCII, тек әріп/сан сөздері"""
+    text = text.lower().translate(_TRANSLIT_TABLE).replace("ı", "i")
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _NON_WORD.sub(" ", text).strip()
+
+def trigrams(word: str) -> Set[str]:
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """Levenshtein қашықтығы; limit-тен асса limit + 1 қайтарады (ерте тоқтау)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            current.append(value)
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+def typo_budget(token: str) -> int:
+    """Сөз ұзындығына қарай рұқсат етілген қате саны"""
+    return 0 if len(token) <= 2 else 1 if len(token) <= 5 else 2
+
+def token_distance(query_token: str, words: Iterable[str]) -> int:
+    """Сұраныс сөзінің өнім сөздеріне ең жақын қашықтығы (префикс сәйкестігі 0)"""
+    limit = typo_budget(query_token)
+    best = limit + 1
+    for word in words:
+        if word.startswith(query_token) or query_token in word:
+            return 0
+        best = min(best, bounded_levenshtein(query_token, word[:len(query_token) + limit], limit))
+        if best == 0:
+            break
+    return best
+
+def fuzzy_match(query: str, text: str) -> bool:
+    """Таза функция: әр сұраныс сөзі мәтіндегі бір сөзге рұқсат етілген қатемен сәйкес келе ме"""
+    words = normalize(text).split()
+    return all(token_distance(token, words) <= typo_budget(token) for token in normalize(query).split())
+
+class TrigramIndex:
+    """
+    Өнім атаулары мен санаттарының триграм индексі: {триграм: {product_id, ...}}.
+    Сұраныс кезінде тек ортақ триграмдары бар кандидаттар қаралады,
+    содан кейін олар edit distance бойынша қайта реттеледі.
+    """
+    def __init__(self, products: Iterable[Dict]):
+        self.postings: Dict[str, Set[int]] = {}
+        self.words: Dict[int, Tuple[str, ...]] = {}
+        self.gram_counts: Dict[int, int] = {}
+        for p in products:
+            words = tuple(normalize(f"{p['name']} {p['category']}").split())
+            grams = set().union(*(trigrams(w) for w in words)) if words else set()
+            self.words[p["id"]] = words
+            self.gram_counts[p["id"]] = len(grams)
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(p["id"])
+
+    def search(self, query: str, limit: int = 200, budget_ms: float = 25.0, max_candidates: int = 500,
+               allowed: Optional[Container[int]] = None) -> List[int]:
+        """
+        Релеванттылық бойынша сұрыпталған product_id тізімі.
+        allowed (мысалы, таңдалған санаттың id-лары) кандидаттарды limit пен max_candidates-тен бұрын шектейді.
+        """
+        tokens = normalize(query).split()
+        if not tokens:
+            return [pid for pid in self.words if allowed is None or pid in allowed]
+        # 1–2 таңбалы сөздердің пайдалы триграмы жоқ: олар кандидат таңдауға қатыспайды
+        long_tokens = [t for t in tokens if len(t) >= 3]
+        if not long_tokens:
+            return self._scan_short(tokens, allowed)[:limit]
+        deadline = time.perf_counter() + budget_ms / 1000
+        query_grams = set().union(*(trigrams(t) for t in long_tokens))
+
+        # 1) Триграм бойынша кандидаттар (Dice коэффициенті)
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for pid in self.postings.get(gram, ()):
+                shared[pid] = shared.get(pid, 0) + 1
+        if allowed is not None:
+            shared = {pid: n for pid, n in shared.items() if pid in allowed}
+        candidates = sorted(shared, key=lambda pid: -2 * shared[pid] / (len(query_grams) + self.gram_counts[pid]))
+        candidates = candidates[:max_candidates]
+
+        # 2) Edit distance бойынша қайта реттеу (уақыт бюджеті біткенше).
+        # Бюджет біткенде тексерілмеген кандидаттар тасталады: ортақ бір триграм сәйкестік емес
+        scored: List[Tuple[int, float, int]] = []
+        for rank, pid in enumerate(candidates):
+            if time.perf_counter() > deadline:
+                break
+            distances = [token_distance(t, self.words[pid]) for t in tokens]
+            if all(d <= typo_budget(t) for d, t in zip(distances, tokens)):
+                scored.append((sum(distances), rank, pid))
+        scored.sort()
+        return [pid for _, _, pid in scored[:limit]]
+
+    def _scan_short(self, tokens: List[str], allowed: Optional[Container[int]]) -> List[int]:
+        """
+        Тек қысқа сөздер үшін: барлық (рұқсат етілген) өнімдерді ішкі жол бойынша қарау,
+        бұрынғы сүзгідегідей. Сөз басымен сәйкестер алдымен шығады.
+        """
+        scored: List[Tuple[int, int]] = []
+        for pid, words in self.words.items():
+            if allowed is not None and pid not in allowed:
+                continue
+            score = 0
+            for token in tokens:
+                if any(w.startswith(token) for w in words):
+                    continue
+                if not any(token in w for w in words):
+                    break
+                score += 1
+            else:
+                scored.append((score, pid))
+        scored.sort(key=lambda s: s[0])
+        return [pid for _, pid in scored]
+
+_index_cache: Dict[str, Tuple[int, TrigramIndex]] = {}
+_index_lock = threading.Lock()
+
+def get_search_index(products: Iterable[Dict], key: str = "catalog", revision: Optional[int] = None) -> TrigramIndex:
+    """
+    Өнімдер өзгермесе, бұрынғы индексті қайта қолдану.
+    revision берілсе (SharedStore.search_revision), каталогты қайта хэштеудің қажеті жоқ.
+    """
+    if revision is None:
+        products = list(products)
+        signature = hash(tuple((p["id"], p["name"], p["category"]) for p in products))
+    else:
+        signature = revision
+    with _index_lock:
+        cached: Optional[Tuple[int, TrigramIndex]] = _index_cache.get(key)
+        if cached is None or cached[0] != signature:
+            cached = (signature, TrigramIndex(products))
+            _index_cache[key] = cached
+        return cached[1]
@@ -0,0 +1,179 @@
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Callable, Mapping, Optional, Tuple
+from functools import lru_cache, reduce
+
+from markstore.models import Product, CartItem
+from markstore.monads import Option, Either
+from markstore.profiling import PROFILER, instrumented
+from markstore.search import normalize, fuzzy_match
+
+# ---------------------------
+# Лабораториялық жұмыс #1: Таза функциялар және жоғары ретті функциялар
+# ---------------------------
+def format_price(num: int | float) -> str:
+    """Таза функция: бағаны пішімдеу"""
+    try:
+        return f"{int(num):,} ₸"
+    except Exception:
+        return f"{num} ₸"
+
+@instrumented("get_product")
+def get_product(products: List[Product], pid: int) -> Option:
+    """Таза функция: Option типімен өнімді іздеу"""
+    for p in products:
+        if p.id == pid:
+            return Option.some(p)
+    return Option.none()
+
+@instrumented("calculate_total")
+def calculate_total(items: List[CartItem], products: List[Product], promotions: Any = None,
+                    now: Optional[datetime] = None) -> Either:
+    """
+    Таза функция: Either типімен қателерді өңдеу.
+    Өнімдер бір рет индекстеледі, себет бір өтуде бағаланады; promotions (PromotionEngine) берілсе —
+    акциялар ескеріледі.
+    """
+    try:
+        by_id = {p.id: p for p in products}
+        lines = []
+        for item in items:
+            product = by_id.get(item.product_id)
+            if product is None:
+                return Either.left(f"Өнім {item.product_id} табылмады")
+            lines.append((product.id, product.category, product.price, item.quantity))
+        if promotions is not None:
+            return Either.right(promotions.price(lines, now).total)
+        return Either.right(sum(price * qty for _, _, price, qty in lines))
+    except Exception as e:
+        return Either.left(f"Есептеу қатесі: {str(e)}")
+
+def filter_products(products: List[Product], predicate: Callable[[Product], bool]) -> List[Product]:
+    """Жоғары ретті функция: сүзгілеу"""
+    return list(filter(predicate, products))
+
+def map_products(products: List[Product], mapper: Callable[[Product], Any]) -> List[Any]:
+    """Жоғары ретті функция: карталау"""
+    return list(map(mapper, products))
+
+def reduce_products(products: List[Product], reducer: Callable[[Any, Product], Any], initial: Any) -> Any:
+    """Жоғары ретті функция: азайту"""
+    return reduce(reducer, products, initial)
+
+# ---------------------------
+# Лабораториялық жұмыс #2: Конфигуратор-closure функциялары
+# ---------------------------
+def create_category_filter(category: str) -> Callable[[Product], bool]:
+    """Closure: категория бойынша сүзгі жасау"""
+    def filter_by_category(product: Product) -> bool:
+        return product.category == category
+    return filter_by_category
+
+def create_price_range_filter(min_price: int, max_price: int) -> Callable[[Product], bool]:
+    """Closure: баға диапазоны бойынша сүзгі жасау"""
+    def filter_by_price(product: Product) -> bool:
+        return min_price <= product.price <= max_price
+    return filter_by_price
+
+def create_search_filter(search_query: str) -> Callable[[Product], bool]:
+    """Closure: іздеу сүзгісін жасау (кирилл/латын транслитерациясы және қатеге төзімділік)"""
+    normalized_query = normalize(search_query)
+    def filter_by_search(product: Product) -> bool:
+        return (fuzzy_match(search_query, f"{product.name} {product.category}")
+                or normalized_query in normalize(product.description))
+    return filter_by_search
+
+# ---------------------------
+# Лабораториялық жұмыс #2: Рекурсивті алгоритмдер
+# ---------------------------
+@instrumented("recursive_category_tree")
+def recursive_category_tree(products: List[Product], current_level: int = 0) -> List[str]:
+    """Рекурсивті функция: категория ағашының құрылымы"""
+    if not products:
+        return []
+    
+    categories = set(p.category for p in products)
+    result = []
+    
+    for category in sorted(categories):
+        result.append("  " * current_level + f"📂 {category}")
+        category_products = filter_products(products, lambda p: p.category == category)
+        for product in category_products:
+            result.append("  " * (current_level + 1) + f"📦 {product.name} - {format_price(product.price)}")
+    
+    return result
+
+def recursive_total_value(products: List[Product], index: int = 0, total: int = 0) -> int:
+    """Рекурсивті функция: жалпы инвентарлық құнды есептеу"""
+    if index >= len(products):
+        return total
+    
+    product = products[index]
+    product_value = product.price * product.stock
+    return recursive_total_value(products, index + 1, total + product_value)
+
+# ---------------------------
+# Лабораториялық жұмыс #3: Мемоизация
+# ---------------------------
+@lru_cache(maxsize=128)
+def expensive_product_analysis(products_data: tuple) -> Dict[str, Any]:
+    """
+    Қымбатты есептеу функциясы: мемоизациямен
+    products_data параметрі tuple түрінде берілуі керек (өйткені lru_cache hashable параметрлерді қажет етеді)
+    """
+    # Өнімдерді қайта құру
+    products = [Product(*p) for p in products_data]
+    
+    # Қымбат есептеуді имитациялау
+    time.sleep(0.5)  # Өңдеу уақытын имитациялау
+    
+    # Күрделі талдау
+    total_products = len(products)
+    total_value = recursive_total_value(products)
+    total_stock = sum(p.stock for p in products)
+    avg_price = total_value / total_stock if total_stock > 0 else 0
+    categories = len(set(p.category for p in products))
+    
+    return {
+        "total_products": total_products,
+        "total_inventory_value": total_value,
+        "average_price": avg_price,
+        "unique_categories": categories,
+        "analysis_time": datetime.now()
+    }
+
+PROFILER.register_cache("expensive_product_analysis", expensive_product_analysis)
+
+# ---------------------------
+# Админ агрегациялары
+# ---------------------------
+ORDER_STATUS_LABELS = {"pending": "Күтуде", "completed": "Аяқталды", "shipped": "Жолға шықты"}
+
+def order_row(o: Dict, user: Dict | None) -> Dict[str, Any]:
+    """Таза функция: админ кестесінің бір жолы (пайдаланушымен біріктірілген, пішімделген)"""
+    return {
+        "Тапсырыс ID": o["id"],
+        "Пайдаланушы": user["full_name"] if user else "Белгісіз",
+        "Зат саны": sum(i["quantity"] for i in o["items"]),
+        "Жалпы": format_price(o["total"]),
+        "Статус": ORDER_STATUS_LABELS.get(o["status"], o["status"]),
+        "Күні": o["created_at"].strftime("%Y-%m-%d %H:%M")
+    }
+
+@instrumented("admin.aggregate_sales")
+def aggregate_sales(products: List[Dict], orders: List[Dict],
+                    archived: Optional[Mapping[int, Tuple[int, int]]] = None) -> List[Dict[str, Any]]:
+    """
+    Әр өнім бойынша сатылым саны мен табысы; archived — мұрағаттағы {product_id: (дана, сома)}.
+    Табыс тапсырыста сақталған жол сомаларынан (жеңілдікпен) алынады, сондықтан «Жалпы табыспен» сәйкес.
+    """
+    archived = archived or {}
+    sales = []
+    for p in products:
+        lines = [it for o in orders for it in o["items"] if it["product_id"] == p["id"]]
+        archived_qty, archived_revenue = archived.get(p["id"], (0, 0))
+        total_qty = sum(it["quantity"] for it in lines) + archived_qty
+        revenue = sum(it.get("line_total", it["quantity"] * p["price"]) for it in lines) + archived_revenue
+        sales.append({"Өнім": p["name"], "Сатылым саны": total_qty, "Табыс": revenue})
+    PROFILER.count("admin.sales_order_scans", len(products) * len(orders))
+    return sales
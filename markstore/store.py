@@ -0,0 +1,346 @@
+import threading
+from datetime import datetime, date
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Callable, Mapping, Iterable
+
+from markstore.monads import Either
+
+# ---------------------------
+# Процесс деңгейіндегі ортақ деректер қызметі
+# ---------------------------
+SEED_USERS = [
+    {"id":1,"username":"admin","password":"Admin123","is_admin":True,"full_name":"Admin User", "email":"admin@markstore.kz", "phone":"+7 777 123 4567"},
+    {"id":2,"username":"ali","password":"Ali123","is_admin":False,"full_name":"Ali Orinbasar", "email":"ali@mail.kz", "phone":"+7 707 765 4321"},
+    {"id":3,"username":"bobo","password":"Bobo123","is_admin":False,"full_name":"Bobo User", "email":"bobo@example.com", "phone":"+7 705 123 4567"},
+]
+
+SEED_PRODUCTS = [
+    {"id":1,"name":"AirPods Pro","price":4990,"stock":10,"description":"Wireless earbuds with great sound","image":"https://via.placeholder.com/600x400/4b6cb7/ffffff?text=AirPods+Pro","category":"Ақпараттық техника", "rating":4.8},
+    {"id":2,"name":"AirPods 3","price":4490,"stock":8,"description":"True wireless earbuds","image":"https://via.placeholder.com/600x400/182848/ffffff?text=AirPods+3","category":"Ақпараттық техника", "rating":4.5},
+    {"id":3,"name":"AirPods 4","price":7990,"stock":5,"description":"Next-gen AirPods","image":"https://via.placeholder.com/600x400/36d1dc/ffffff?text=AirPods+4","category":"Ақпараттық техника", "rating":4.9},
+    {"id":4,"name":"iPhone 14","price":399990,"stock":7,"description":"Latest iPhone","image":"https://via.placeholder.com/600x400/5b86e5/ffffff?text=iPhone+14","category":"Телефондар", "rating":4.7},
+    {"id":5,"name":"Samsung Galaxy","price":299990,"stock":12,"description":"Android flagship","image":"https://via.placeholder.com/600x400/2c3e50/ffffff?text=Galaxy","category":"Телефондар", "rating":4.6},
+    {"id":6,"name":"MacBook Pro","price":699990,"stock":6,"description":"Powerful laptop for professionals","image":"https://via.placeholder.com/600x400/667eea/ffffff?text=MacBook+Pro","category":"Ноутбуктер", "rating":4.9},
+]
+
+Listener = Callable[[str, Mapping], None]
+
+# Іздеу индексі тек осы өрістерге тәуелді (қалдық/баға өзгерісі индексті ескіртпейді)
+SEARCH_FIELDS = ("name", "category")
+
+class SharedStore:
+    """
+    Пайдаланушылар, өнімдер және тапсырыстардың жалғыз (authoritative) көшірмесі.
+    Сессиялар деректерді тек оқу үшін MappingProxyType көріністері арқылы алады,
+    ал барлық өзгерістер осы класс әдістері арқылы өтеді және тыңдаушыларға хабарланады
+    (оқиға аты, өзгерген жазба көрінісі).
+    """
+    def __init__(self, users: Iterable[Dict] = (), products: Iterable[Dict] = (), orders: Iterable[Dict] = ()):
+        self._lock = threading.RLock()
+        self._users: Dict[int, Dict] = {}
+        self._usernames: Dict[str, int] = {}
+        self._products: Dict[int, Dict] = {}
+        self._orders: Dict[int, Dict] = {}
+        self._next_user_id = 1
+        self._next_order_id = 1
+        self._next_product_id = 1
+        self._listeners: List[Listener] = []
+        self._snapshots: Dict[str, Tuple[int, Tuple[Mapping, ...]]] = {}
+        self.revision = 0
+        self.revisions = {"users": 0, "products": 0, "orders": 0}
+        self._product_revisions: Dict[int, int] = {}
+        self.search_revision = 0
+        for user in users:
+            self._insert_user(dict(user))
+        for product in products:
+            self._products[product["id"]] = dict(product)
+        for order in orders:
+            order = dict(order, items=[self._priced_item(i) for i in order["items"]])
+            self._orders[order["id"]] = self._freeze_items(order)
+        self._next_user_id = max(self._users, default=0) + 1
+        self._next_order_id = max(self._orders, default=0) + 1
+        self._next_product_id = max(self._products, default=0) + 1
+
+    # ---- тыңдаушылар
+    def subscribe(self, listener: Listener, snapshot: Optional[Callable[["SharedStore"], Any]] = None) -> Any:
+        """
+        snapshot(store) берілсе, ол тыңдаушы тіркелетін lock астында шақырылады: бастапқы жүктеу
+        мен жазылудың арасында оқиға жоғалмайды да, екі рет те келмейді. snapshot нәтижесі қайтарылады.
+        """
+        with self._lock:
+            result = snapshot(self) if snapshot is not None else None
+            self._listeners.append(listener)
+            return result
+
+    @property
+    def product_revision(self) -> int:
+        return self.revisions["products"]
+
+    def product_revision_of(self, pid: int) -> int:
+        """Жеке өнімнің соңғы өзгеріс нөмірі (өзгермеген өнім үшін 0)"""
+        return self._product_revisions.get(pid, 0)
+
+    def _touch_search(self, product: Mapping, changes: Mapping[str, Any]) -> None:
+        """Өнім қосылса/өшірілсе немесе аты/санаты өзгерсе ғана іздеу ревизиясы өседі"""
+        if any(field in changes and changes[field] != product.get(field) for field in SEARCH_FIELDS):
+            self.search_revision += 1
+
+    def _changed(self, event: str, record: Dict, collection: str) -> Mapping:
+        self.revision += 1
+        self.revisions[collection] += 1
+        if collection == "products":
+            self._product_revisions[record["id"]] = self.revision
+        view = MappingProxyType(record)
+        for listener in list(self._listeners):
+            listener(event, view)
+        return view
+
+    # ---- оқу (тек оқуға арналған көріністер)
+    def _snapshot(self, name: str, records: Dict[int, Dict]) -> Tuple[Mapping, ...]:
+        cached = self._snapshots.get(name)
+        if cached is None or cached[0] != self.revisions[name]:
+            cached = (self.revisions[name], tuple(MappingProxyType(r) for r in records.values()))
+            self._snapshots[name] = cached
+        return cached[1]
+
+    def users(self) -> Tuple[Mapping, ...]:
+        with self._lock:
+            return self._snapshot("users", self._users)
+
+    def products(self) -> Tuple[Mapping, ...]:
+        with self._lock:
+            return self._snapshot("products", self._products)
+
+    def search_snapshot(self) -> Tuple[int, Tuple[Mapping, ...]]:
+        """(search_revision, products()) бір lock астында: іздеу индексі дәл осы өнімдермен кілттеледі"""
+        with self._lock:
+            return self.search_revision, self._snapshot("products", self._products)
+
+    def orders(self) -> Tuple[Mapping, ...]:
+        with self._lock:
+            return self._snapshot("orders", self._orders)
+
+    def get_user(self, uid: int) -> Optional[Mapping]:
+        user = self._users.get(uid)
+        return MappingProxyType(user) if user is not None else None
+
+    def find_user(self, username: str) -> Optional[Mapping]:
+        uid = self._usernames.get(username)
+        return self.get_user(uid) if uid is not None else None
+
+    def get_product(self, pid: int) -> Optional[Mapping]:
+        product = self._products.get(pid)
+        return MappingProxyType(product) if product is not None else None
+
+    def get_order(self, order_id: int) -> Optional[Mapping]:
+        order = self._orders.get(order_id)
+        return MappingProxyType(order) if order is not None else None
+
+    def orders_for_user(self, uid: int) -> List[Mapping]:
+        return [o for o in self.orders() if o["user_id"] == uid]
+
+    # ---- пайдаланушылар
+    def _insert_user(self, user: Dict) -> None:
+        self._users[user["id"]] = user
+        self._usernames[user["username"]] = user["id"]
+
+    def add_user(self, username: str, password: str, full_name: str, email: str = "", phone: str = "",
+                 is_admin: bool = False) -> Either:
+        with self._lock:
+            if username in self._usernames:
+                return Either.left("Бұл пайдаланушы аты бос емес")
+            uid = self._next_user_id
+            self._next_user_id += 1
+            user = {"id": uid, "username": username, "password": password, "is_admin": is_admin,
+                    "full_name": full_name, "email": email, "phone": phone}
+            self._insert_user(user)
+            return Either.right(self._changed("user_added", user, "users"))
+
+    def update_user(self, uid: int, **changes: Any) -> Optional[Mapping]:
+        with self._lock:
+            user = self._users.get(uid)
+            if user is None:
+                return None
+            if "username" in changes and changes["username"] != user["username"]:
+                del self._usernames[user["username"]]
+                self._usernames[changes["username"]] = uid
+            user.update(changes)
+            return self._changed("user_updated", user, "users")
+
+    def delete_user(self, uid: int) -> None:
+        with self._lock:
+            user = self._users.pop(uid, None)
+            if user is not None:
+                del self._usernames[user["username"]]
+                self._changed("user_deleted", user, "users")
+
+    # ---- өнімдер
+    def add_product(self, **fields: Any) -> Mapping:
+        with self._lock:
+            # Өшірілген өнімнің id-сы қайта берілмейді: мұрағат оның сатылымын id бойынша сақтайды
+            product = dict(fields, id=self._next_product_id)
+            self._next_product_id += 1
+            self._products[product["id"]] = product
+            self.search_revision += 1
+            return self._changed("product_added", product, "products")
+
+    def update_product(self, pid: int, **changes: Any) -> Optional[Mapping]:
+        with self._lock:
+            product = self._products.get(pid)
+            if product is None:
+                return None
+            self._touch_search(product, changes)
+            product.update(changes)
+            return self._changed("product_updated", product, "products")
+
+    def update_products(self, changes: Mapping[int, Mapping[str, Any]], deletes: Iterable[int] = (),
+                        stock_deltas: Mapping[int, int] = MappingProxyType({})) -> List[Mapping]:
+        """
+        Топтамалы жаңарту (админ кестесі): барлық өзгерістер бір lock астында қолданылады,
+        содан кейін ғана оқиғалар жіберіледі. Снапшот пен іздеу индексі келесі оқуда бір рет қайта құрылады.
+        stock_deltas қалдыққа ағымдағы мәнге қосылады (нөлден төмен түспейді), сондықтан
+        кестені ашқаннан бері басқа сессиялар алған дана қайта жазылмайды.
+        """
+        with self._lock:
+            updated = []
+            for pid in changes.keys() | stock_deltas.keys():
+                product = self._products.get(pid)
+                if product is not None:
+                    fields = changes.get(pid, {})
+                    self._touch_search(product, fields)
+                    product.update(fields)
+                    if pid in stock_deltas:
+                        product["stock"] = max(0, product["stock"] + stock_deltas[pid])
+                    updated.append(product)
+            deleted = [p for p in (self._products.pop(pid, None) for pid in deletes) if p is not None]
+            if deleted:
+                self.search_revision += 1
+            views = [self._changed("product_updated", product, "products") for product in updated]
+            for product in deleted:
+                self._changed("product_deleted", product, "products")
+            return views
+
+    def delete_product(self, pid: int) -> None:
+        with self._lock:
+            product = self._products.pop(pid, None)
+            if product is not None:
+                self.search_revision += 1
+                self._changed("product_deleted", product, "products")
+
+    # ---- тапсырыстар
+    @staticmethod
+    def _freeze_items(order: Dict) -> Dict:
+        order["items"] = tuple(MappingProxyType(dict(i)) for i in order["items"])
+        return order
+
+    def _priced_item(self, item: Mapping) -> Dict:
+        """line_total (жеңілдікпен төленген сома) берілмесе — тізімдік баға × саны"""
+        item = dict(item)
+        if "line_total" not in item:
+            product = self._products.get(item["product_id"])
+            item["line_total"] = product["price"] * item["quantity"] if product else 0
+        return item
+
+    def place_order(self, user_id: int, items: Iterable[Mapping], total: int, address: str,
+                    delivery_date: date, allocate: Optional[Callable[[List[Dict]], Either]] = None) -> Either:
+        """
+        Қалдықты тексеріп, азайтып, тапсырысты бір атомдық қадаммен тіркейді.
+        allocate (мысалы, StockLedger.reserve) lock ішінде шақырылады: Either.left тапсырысты тоқтатады,
+        Either.right мәні тапсырыстың "shipments" өрісіне жазылады.
+        Элементтердің line_total өрісі (акциялармен бағаланған жол сомасы) тапсырыспен бірге сақталады.
+        """
+        with self._lock:
+            items = [dict(i) for i in items]
+            for item in items:
+                product = self._products.get(item["product_id"])
+                if product is None:
+                    return Either.left(f"Өнім {item['product_id']} табылмады")
+                if product["stock"] < item["quantity"]:
+                    return Either.left(f"«{product['name']}» қалдығы жеткіліксіз (қолжетімді: {product['stock']})")
+            shipments = ()
+            if allocate is not None:
+                allocation = allocate(items)
+                if not allocation.is_right:
+                    return allocation
+                shipments = allocation.value
+            items = [self._priced_item(i) for i in items]
+            for item in items:
+                product = self._products[item["product_id"]]
+                product["stock"] -= item["quantity"]
+                self._changed("product_stock", product, "products")
+            order = self._freeze_items({
+                "id": self._next_order_id,
+                "user_id": user_id,
+                "items": items,
+                "created_at": datetime.now(),
+                "status": "pending",
+                "total": total,
+                "address": address,
+                "delivery_date": delivery_date,
+                "shipments": shipments,
+            })
+            self._next_order_id += 1
+            self._orders[order["id"]] = order
+            return Either.right(self._changed("order_placed", order, "orders"))
+
+    def set_order_status(self, order_id: int, status: str) -> Optional[Mapping]:
+        """Статус шынымен өзгерсе ғана жаңартылған тапсырысты қайтарады"""
+        with self._lock:
+            order = self._orders.get(order_id)
+            if order is None or order["status"] == status:
+                return None
+            order["status"] = status
+            return self._changed("order_status", order, "orders")
+
+    def reserve_ids(self, last_user_id: int = 0, last_order_id: int = 0, last_product_id: int = 0) -> None:
+        """
+        Жаңа пайдаланушы/тапсырыс/өнім нөмірлері берілген мәндерден кейін басталады: мұрағаттағы
+        тапсырыстар user_id және product_id бойынша ізделеді, сондықтан нөмір басқа жазбаға қайта берілмеуі керек.
+        """
+        with self._lock:
+            self._next_user_id = max(self._next_user_id, last_user_id + 1)
+            self._next_order_id = max(self._next_order_id, last_order_id + 1)
+            self._next_product_id = max(self._next_product_id, last_product_id + 1)
+
+    def archive_orders(self, cutoff: datetime, sink: Callable[[List[Mapping]], Any]) -> int:
+        """
+        cutoff-тан ескі аяқталған тапсырыстарды sink-ке (суық қойма) беріп, ыстық жиыннан алып тастайды.
+        sink lock ішінде шақырылады: ол ерекшелік лақтырса, тапсырыстар орнында қалады.
+        Тыңдаушылар бір "orders_archived" оқиғасын алады: {"ids": (...), "cutoff": cutoff}.
+        """
+        with self._lock:
+            cold = [o for o in self._orders.values() if o["status"] == "completed" and o["created_at"] < cutoff]
+            if not cold:
+                return 0
+            sink([MappingProxyType(o) for o in cold])
+            ids = tuple(o["id"] for o in cold)
+            for order_id in ids:
+                del self._orders[order_id]
+            self._changed("orders_archived", {"ids": ids, "cutoff": cutoff}, "orders")
+            return len(ids)
+
+_store: Optional[SharedStore] = None
+_store_lock = threading.Lock()
+
+def get_store() -> SharedStore:
+    """Барлық сессияларға ортақ жалғыз дана (модуль процесте бір рет импортталады)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            store = SharedStore(SEED_USERS, SEED_PRODUCTS)
+            _reserve_archived_ids(store)
+            _store = store
+        return _store
+
+def install_store(store: SharedStore) -> None:
+    """Ортақ дананы алмастыру (жүктеме сынағы синтетикалық деректерді осылай береді)"""
+    global _store
+    _reserve_archived_ids(store)
+    with _store_lock:
+        _store = store
+
+def _reserve_archived_ids(store: SharedStore) -> None:
+    """Мұрағат дискіде процесстен ұзақ өмір сүреді: оның id-лары жаңа жазбаларға берілмейді"""
+    from markstore.archive import get_order_archive  # archive модулі store-ды импорттайды
+    archive = get_order_archive()
+    store.reserve_ids(archive.max_user_id, archive.max_order_id, archive.max_product_id)
@@ -0,0 +1,124 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from markstore.monads import Either
+
+# ---------------------------
+# Кіруді шектеу: token bucket (жалқау толтыру) + TTL/LRU шектелген кілттер
+# ---------------------------
+class TokenBucketLimiter:
+    """
+    Әр кілтке [токендер, соңғы уақыт] жұбы. Токендер таймерсіз, тек тексеру кезінде
+    өткен уақытқа қарай толтырылады, сондықтан тексеру O(1).
+    Кілттер OrderedDict-те соңғы қолданылу ретімен тұрады: ttl бойы қолданылмағандары және
+    max_keys-тен асқандары басынан ығыстырылады (әр кілт бір рет қана, яғни амортизацияланған O(1)).
+    """
+    def __init__(self, capacity: float, refill_per_sec: float, max_keys: int = 100_000,
+                 ttl: Optional[float] = None):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.max_keys = max_keys
+        # Толық толған bucket-ті сақтаудың мәні жоқ: ttl әдепкіде толу уақытына тең
+        self.ttl = ttl if ttl is not None else capacity / refill_per_sec
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _evict(self, now: float) -> None:
+        """Жаңа кілт қосылғанда ғана шақырылады: ескі және артық кілттерді басынан алып тастау"""
+        buckets = self._buckets
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if len(buckets) < self.max_keys and now - oldest[1] < self.ttl:
+                break
+            buckets.popitem(last=False)
+
+    def retry_after(self, key: str, now: Optional[float] = None, cost: float = 1.0) -> float:
+        """Қанша секундтан кейін cost токен жиналады (0 — қазір рұқсат)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return 0.0
+            tokens = bucket[0] + (now - bucket[1]) * self.refill_per_sec
+            return 0.0 if tokens >= cost else (cost - tokens) / self.refill_per_sec
+
+    def acquire(self, key: str, now: Optional[float] = None, cost: float = 1.0) -> float:
+        """Токен алу: сәтті болса 0, әйтпесе қанша секунд күту керек"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            buckets = self._buckets
+            bucket = buckets.get(key)
+            if bucket is None:
+                self._evict(now)
+                tokens = self.capacity
+                bucket = buckets[key] = [tokens, now]
+            else:
+                tokens = bucket[0] + (now - bucket[1]) * self.refill_per_sec
+                if tokens > self.capacity:
+                    tokens = self.capacity
+                bucket[1] = now
+                buckets.move_to_end(key)
+            if tokens >= cost:
+                bucket[0] = tokens - cost
+                return 0.0
+            bucket[0] = tokens
+            return (cost - tokens) / self.refill_per_sec
+
+    def consume(self, key: str, now: Optional[float] = None, cost: float = 1.0) -> bool:
+        return self.acquire(key, now, cost) == 0.0
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+class LoginThrottle:
+    """
+    Екі деңгейлі шектеу: пайдаланушы аты бойынша (бір аккаунтқа құпиясөз теру)
+    және клиент бойынша (бір көзден көп аккаунтқа credential stuffing).
+    check() пайдаланушыны іздеуден бұрын шақырылады; сәтті кіру пайдаланушы атының bucket-ін тазалайды.
+    """
+    def __init__(self, per_user: TokenBucketLimiter, per_client: TokenBucketLimiter):
+        self.per_user = per_user
+        self.per_client = per_client
+        self.rejected = 0
+
+    def check(self, username: str, client: str, now: Optional[float] = None) -> Either:
+        now = time.monotonic() if now is None else now
+        user_key = username.strip().lower()
+        # Аккаунт бұғатталған болса, клиенттің токені жұмсалмайды
+        wait = self.per_user.retry_after(user_key, now) or self.per_client.acquire(client, now) \
+            or self.per_user.acquire(user_key, now)
+        if wait == 0.0:
+            return Either.right(username)
+        self.rejected += 1
+        return Either.left(f"Тым көп әрекет. {math.ceil(wait)} секундтан кейін қайталаңыз")
+
+    def login_succeeded(self, username: str) -> None:
+        self.per_user.reset(username.strip().lower())
+
+_throttle: Optional[LoginThrottle] = None
+_throttle_lock = threading.Lock()
+
+def get_login_throttle() -> LoginThrottle:
+    """
+    Процесс деңгейіндегі шектегіш. Әдепкі: аккаунтқа 5 әрекет (30 с сайын +1), клиентке 20 әрекет (3 с сайын +1).
+    Баптаулар: MARKSTORE_LOGIN_USER_BURST / _USER_REFILL_SEC / _CLIENT_BURST / _CLIENT_REFILL_SEC
+    """
+    global _throttle
+    with _throttle_lock:
+        if _throttle is None:
+            env = os.environ.get
+            _throttle = LoginThrottle(
+                per_user=TokenBucketLimiter(capacity=float(env("MARKSTORE_LOGIN_USER_BURST", "5")),
+                                            refill_per_sec=1 / float(env("MARKSTORE_LOGIN_USER_REFILL_SEC", "30"))),
+                per_client=TokenBucketLimiter(capacity=float(env("MARKSTORE_LOGIN_CLIENT_BURST", "20")),
+                                              refill_per_sec=1 / float(env("MARKSTORE_LOGIN_CLIENT_REFILL_SEC", "3"))),
+            )
+        return _throttle
@@ -0,0 +1,136 @@
+import streamlit as st
+
+from markstore.profiling import instrumented
+from markstore.store import get_store
+
+# ---------------- CSS STYLE ----------------
+APP_CSS = """
+<style>
+/* Негізгі стильдер */
+.main { background-color: #f8fafc; }
+.stApp { background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); }
+/* Барлық мәтіндерді қара түске өзгерту */
+* { color: #000000 !important; }
+h1, h2, h3, h4, h5, h6, p, div, span, label, input, textarea, select, button, a {
+  color: #000000 !important;
+}
+/* Сайдбар стильдері (ескерту: streamlit класс атаулары версияға тәуелді) */
+section[data-testid="stSidebar"] {
+  background: linear-gradient(180deg, #4b6cb7 0%, #182848 100%);
+}
+section[data-testid="stSidebar"] * { color: #000000 !important; }
+section[data-testid="stSidebar"] .stButton>button {
+  background: rgba(255,255,255,0.1);
+  border: 1px solid rgba(255,255,255,0.2);
+  color: #000000 !important;
+}
+section[data-testid="stSidebar"] .stButton>button:hover {
+  background: rgba(255,255,255,0.2);
+}
+/* Карточкалар */
+.product-card {
+  border: 1px solid #e2e8f0; border-radius: 16px; padding: 20px;
+  background: #ffffff; text-align: center; transition: all 0.3s ease;
+  box-shadow: 0 4px 6px rgba(0,0,0,0.04); margin-bottom: 25px;
+  height: 100%; display: flex; flex-direction: column; justify-content: space-between;
+}
+.product-card:hover { transform: translateY(-5px); box-shadow: 0 20px 25px rgba(0,0,0,0.1); }
+/* Баға */
+.price-badge {
+  display:inline-block; background: linear-gradient(135deg,#667eea 0%,#764ba2 100%);
+  color:white !important; padding:10px 20px; border-radius:25px; font-weight:bold; margin:12px 0;
+  font-size:18px; box-shadow:0 4px 6px rgba(0,0,0,0.1);
+}
+/* Батырмалар */
+.stButton > button {
+  border-radius: 12px !important; padding: 12px 28px !important;
+  font-weight: 600 !important; transition: all 0.3s ease !important; width: 100%;
+  box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+  color: #000000 !important;
+}
+.stButton > button:first-child { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border: none !important; }
+.stButton > button:first-child:hover { background: linear-gradient(135deg, #764ba2 0%, #667eea 100%); transform: scale(1.03); box-shadow: 0 6px 8px rgba(0,0,0,0.15); }
+/* Тақырыптар */
+h1, h2, h3 { color: #000000 !important; font-weight: 700; }
+/* Хедер */
+.header {
+  background: linear-gradient(90deg, #4b6cb7 0%, #182848 100%);
+  padding: 25px; border-radius: 16px; color: #000000 !important; margin-bottom: 35px;
+  box-shadow: 0 10px 15px rgba(0,0,0,0.1);
+}
+/* Админ карточкалары */
+.admin-stats {
+  background:#ffffff; border-radius:16px; padding:25px; margin-bottom:25px;
+  border-left:6px solid #4b6cb7; box-shadow:0 4px 6px rgba(0,0,0,0.05);
+}
+/* Хабарламалар, кестелер */
+.stAlert { border-radius: 12px; }
+.stDataFrame { border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.05); }
+/* Футер */
+.footer { text-align:center; margin-top:60px; padding:25px; color:#000000 !important; font-size:14px; }
+/* Сайдбардағы мәтіндерді қара түске өзгерту */
+section[data-testid="stSidebar"] h1,
+section[data-testid="stSidebar"] h2,
+section[data-testid="stSidebar"] h3,
+section[data-testid="stSidebar"] h4,
+section[data-testid="stSidebar"] p,
+section[data-testid="stSidebar"] div {
+  color: #000000 !important;
+}
+/* Хедердегі мәтіндерді қара түске өзгерту */
+.header h1,
+.header p {
+  color: #000000 !important;
+}
+/* Инпуттардағы мәтіндерді қара түске өзгерту */
+.stTextInput input,
+.stTextArea textarea,
+.stSelectbox select,
+.stNumberInput input {
+  color: #000000 !important;
+}
+</style>
+"""
+
+# ---------------------------
+# Көмекші функциялар
+# ---------------------------
+@instrumented("get_product_old")
+def get_product_old(pid):
+    return get_store().get_product(pid)
+
+def ensure_session_keys():
+    """Сессияда тек me (пайдаланушы көрінісі), cart және current_page сақталады"""
+    for key, default in [("cart", []), ("me", None), ("current_page", "🏪 Негізгі бет")]:
+        if key not in st.session_state:
+            st.session_state[key] = default
+
+# ---------------------------
+# Хедер және футер
+# ---------------------------
+def render_header():
+    st.markdown(f"""
+    <div class="header">
+        <div style="display:flex; justify-content:space-between; align-items:center;">
+            <div>
+                <h1 style="color:#000000; margin:0;">🛒 MarkStore</h1>
+                <p style="color:#000000; margin:0;">Қазақстандық жеңіл интернет-дүкен</p>
+            </div>
+            <div style="display:flex; gap:15px;">
+                <div style="background:rgba(255,255,255,0.2); padding:10px 15px; border-radius:10px;">
+                    <p style="margin:0; color:#000000;">📦 {len(st.session_state['cart'])} зат</p>
+                </div>
+                <div style="background:rgba(255,255,255,0.2); padding:10px 15px; border-radius:10px;">
+                    <p style="margin:0; color:#000000;">👥 {len(get_store().users())} пайдаланушы</p>
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_footer():
+    st.markdown("""
+    <div class="footer">
+      MarkStore © 2025 • Демонстрациялық нұсқа • Ортақ in-memory деректер (қосымшаны қайта іске қосқанда тазарады)
+    </div>
+    """, unsafe_allow_html=True)
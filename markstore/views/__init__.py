@@ -0,0 +1,23 @@
+import importlib
+
+from markstore.profiling import PROFILER
+
+# ---------------------------
+# Беттер: модульдер тек сол бет ашылғанда импортталады
+# ---------------------------
+ADMIN_PAGE = "⚙️ Админ панелі"
+
+PAGE_MODULES = {
+    "🏪 Негізгі бет": "catalog",
+    "🛒 Себет": "cart",
+    "📦 Тапсырыстарым": "my_orders",
+    "👤 Профиль": "profile",
+    ADMIN_PAGE: "admin",
+}
+
+def render_page(page: str, me) -> None:
+    """Белсенді беттің модулін жалқау (lazy) импорттап, оны көрсетеді"""
+    module_name = PAGE_MODULES.get(page, "catalog")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    with PROFILER.span(f"page.{module_name}"):
+        module.render(me)
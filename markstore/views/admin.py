@@ -0,0 +1,524 @@
+import streamlit as st
+from datetime import datetime, timedelta
+
+from markstore.archive import get_order_archive
+from markstore.inventory import get_inventory
+from markstore.notifications import get_notification_pipeline, notify_order_event
+from markstore.order_views import get_orders_view
+from markstore.profiling import PROFILER
+from markstore.promotions import get_promotions
+from markstore.rendering import format_price_column, price_text
+from markstore.services import aggregate_sales, order_row, ORDER_STATUS_LABELS
+from markstore.store import get_store
+from markstore.warehouses import get_stock_ledger
+
+# ---------------------------
+# 8) Админ панелі
+# ---------------------------
+_PRODUCT_FIELDS = {"Атауы": "name", "Бағасы": "price", "Қалдық": "stock", "Санат": "category",
+                   "Рейтинг": "rating", "Сипаттама": "description", "Сурет URL": "image"}
+
+def _product_diff(original, edited):
+    """
+    Өңделген бетті бастапқымен салыстыру: ({pid: {өріс: жаңа мән}}, [өшірілетін pid]).
+    Бос атау/санат өзгеріс саналмайды; сандар Python типтеріне келтіріледі.
+    """
+    changes, deletes = {}, []
+    for before, after in zip(original.to_dict("records"), edited.to_dict("records")):
+        pid = int(before["ID"])
+        if after["Өшіру"]:
+            deletes.append(pid)
+            continue
+        diff = {}
+        for column, field in _PRODUCT_FIELDS.items():
+            value = after[column]
+            if value is None or value != value:  # None / NaN — ұяшық тазаланған
+                continue
+            if field in ("price", "stock"):
+                value = int(value)
+            elif field == "rating":
+                value = round(float(value), 1)
+            else:
+                value = str(value).strip()
+                if not value and field in ("name", "category"):
+                    continue
+            if value != before[column]:
+                diff[field] = value
+        if diff:
+            changes[pid] = diff
+    return changes, deletes
+
+def render(me):
+    st.header("⚙️ Админ панелі")
+    if not me or not me.get("is_admin", False):
+        st.error("⛔ Бұл бөлімге тек админ кіре алады")
+    else:
+        import pandas as pd  # ауыр тәуелділік: тек кесте көрсетілгенде жүктеледі
+        store = get_store()
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["📊 Тапсырыстар", "📈 Сатылым статистикасы", "🎁 Өнімдерді басқару", "🏷️ Акциялар", "📉 Аз қалдық", "👥 Пайдаланушылар", "⏱️ Өнімділік"])
+
+        # -------- Тапсырыстар
+        with tab1, PROFILER.span("admin.orders"):
+            st.subheader("📊 Барлық тапсырыстар")
+            orders_view = get_orders_view()
+            archive = get_order_archive()
+            if not len(orders_view) and not len(archive):
+                st.info("😔 Тапсырыстар жоқ")
+            else:
+                # Сүзгі / сұрыптау / бет — көріністің индекстері арқылы, тек бір бет жолдары құрылады
+                fcol1, fcol2, fcol3, fcol4 = st.columns([1, 1, 2, 1])
+                with fcol1:
+                    status_options = ["Барлығы"] + list(ORDER_STATUS_LABELS)
+                    f_status = st.selectbox("Статус", status_options, key="adm_orders_status",
+                                            format_func=lambda s: ORDER_STATUS_LABELS.get(s, s))
+                with fcol2:
+                    f_user = st.text_input("Пайдаланушы (username)", key="adm_orders_user")
+                with fcol3:
+                    f_dates = st.date_input("Күн аралығы", value=(), key="adm_orders_dates")
+                with fcol4:
+                    sort_labels = {"date": "Күні", "total": "Сомасы", "user": "Пайдаланушы"}
+                    f_sort = st.selectbox("Сұрыптау", list(sort_labels), format_func=sort_labels.get, key="adm_orders_sort")
+                    f_desc = st.checkbox("Кему ретімен", value=True, key="adm_orders_desc")
+
+                user_id = None
+                if f_user.strip():
+                    found = store.find_user(f_user.strip())
+                    user_id = found["id"] if found else -1
+                date_from = f_dates[0] if len(f_dates) > 0 else None
+                date_to = f_dates[1] if len(f_dates) > 1 else date_from
+                query = dict(status=None if f_status == "Барлығы" else f_status, user_id=user_id,
+                             date_from=date_from, date_to=date_to, sort=f_sort, descending=f_desc)
+                # Сүзгі өзгерсе, бірінші бетке оралу
+                if st.session_state.get("adm_orders_query") != query:
+                    st.session_state["adm_orders_query"] = query
+                    st.session_state["adm_orders_page"] = 1
+                page = orders_view.query(**query, page=st.session_state.get("adm_orders_page", 1) - 1, page_size=50)
+                st.session_state["adm_orders_page"] = page.page + 1
+
+                if page.rows:
+                    st.dataframe(pd.DataFrame(page.rows), use_container_width=True)
+                else:
+                    st.info("Сүзгіге сәйкес тапсырыс жоқ")
+                pcol1, pcol2 = st.columns([1, 3])
+                with pcol1:
+                    st.number_input("Бет", min_value=1, max_value=page.pages, step=1, key="adm_orders_page")
+                with pcol2:
+                    st.caption(f"Табылды: {page.matched} · бет {page.page + 1} / {page.pages}")
+
+                # Мұрағат тек күн аралығы таңдалғанда және ол сегменттерге түссе ғана оқылады
+                if date_from and query["status"] in (None, "completed") and user_id != -1:
+                    if st.checkbox("🗄️ Мұрағаттан да іздеу", key="adm_orders_archive"):
+                        cold = archive.orders_between(date_from, date_to, user_id)
+                        if archive.damaged:
+                            st.warning(f"⚠️ Бүлінген мұрағат сегменттері өткізілді: {', '.join(sorted(archive.damaged))}")
+                        cold.sort(key=lambda o: (o["created_at"], o["id"]), reverse=f_desc)
+                        st.caption(f"Мұрағатта табылды: {len(cold)} (алғашқы 200 көрсетіледі)")
+                        if cold:
+                            st.dataframe(pd.DataFrame([order_row(o, store.get_user(o["user_id"])) for o in cold[:200]]),
+                                         use_container_width=True)
+
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.markdown(f'<div class="admin-stats"><h3>📦 Жалпы тапсырыстар</h3><h2>{len(orders_view) + len(archive)}</h2></div>', unsafe_allow_html=True)
+                with col2:
+                    st.markdown(f'<div class="admin-stats"><h3>💰 Жалпы табыс</h3><h2>{price_text(orders_view.revenue + archive.revenue)}</h2></div>', unsafe_allow_html=True)
+                with col3:
+                    pending_orders = orders_view.status_counts.get("pending", 0)
+                    st.markdown(f'<div class="admin-stats"><h3>⏳ Күтудегі тапсырыстар</h3><h2>{pending_orders}</h2></div>', unsafe_allow_html=True)
+                with col4:
+                    completed_orders = orders_view.status_counts.get("completed", 0) + len(archive)
+                    st.markdown(f'<div class="admin-stats"><h3>✅ Орындалған тапсырыстар</h3><h2>{completed_orders}</h2></div>', unsafe_allow_html=True)
+
+                st.subheader("🔄 Тапсырыс статусын өзгерту")
+                order_ids = page.order_ids
+                if order_ids:
+                    selected_order = st.selectbox("Тапсырыс таңдаңыз", order_ids, key="adm_sel_order")
+                    new_status = st.selectbox("Жаңа статус", ["pending", "shipped", "completed"], key="adm_new_status")
+                    if st.button("✅ Статусты жаңарту", use_container_width=True):
+                        order = store.set_order_status(selected_order, new_status)
+                        if order is not None:
+                            notify_order_event(new_status, order, store.get_user(order["user_id"]))
+                        st.success(f"✅ Тапсырыс №{selected_order} статусы жаңартылды!")
+                        st.rerun()
+
+                st.subheader("🗄️ Мұрағат")
+                st.caption(f"Ыстық жиында: {len(orders_view)} · мұрағатта: {len(archive)} тапсырыс, "
+                           f"{len(archive.segments)} сегмент · {archive.max_age_days} күннен ескі аяқталғандар көшіріледі")
+                if st.button("🗄️ Ескі тапсырыстарды мұрағаттау", use_container_width=True):
+                    moved = archive.archive(store)
+                    st.success(f"✅ Мұрағатқа көшірілді: {moved}")
+                    st.rerun()
+
+        # -------- Сатылым статистикасы
+        with tab2, PROFILER.span("admin.sales"):
+            st.subheader("📈 Сатылым статистикасы")
+            products = store.products()
+            archived = get_order_archive().product_sales({p["id"]: p["price"] for p in products})
+            sales = aggregate_sales(products, store.orders(), archived)
+
+            df_sales = pd.DataFrame(sales)
+            if not df_sales.empty:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("#### Сатылым кестесі")
+                    # Көрнекі баға
+                    df_view = df_sales.copy()
+                    df_view["Табыс"] = format_price_column(df_view["Табыс"])
+                    st.dataframe(df_view, use_container_width=True)
+                with col2:
+                    st.write("#### Табыс бойынша диаграмма")
+                    chart_data = pd.DataFrame({'Өнім': df_sales['Өнім'], 'Табыс': df_sales['Табыс']})
+                    st.bar_chart(chart_data.set_index('Өнім'))
+            else:
+                st.info("😔 Сатылым статистикасы жоқ")
+
+        # -------- Өнімдерді басқару
+        with tab3, PROFILER.span("admin.products"):
+            st.subheader("🎁 Өнімдерді басқару")
+
+            # Жаңа өнім қосу
+            with st.form("add_product_form"):
+                st.write("#### 🆕 Жаңа өнім қосу")
+                col1, col2 = st.columns(2)
+                with col1:
+                    new_name = st.text_input("Атауы")
+                    new_price = st.number_input("Бағасы (₸)", min_value=0, step=10, value=0)
+                    new_stock = st.number_input("Қалдық (дана)", min_value=0, step=1, value=0)
+                    new_category = st.text_input("Санат", value="Әр түрлі")
+                with col2:
+                    new_desc = st.text_area("Сипаттама", height=100, value="—")
+                    new_image = st.text_input("Сурет URL", value="https://via.placeholder.com/600x400/cccccc/000000?text=Product")
+                    new_rating = st.slider("Рейтинг", min_value=0.0, max_value=5.0, step=0.1, value=4.5)
+
+                if st.form_submit_button("➕ Қосу", use_container_width=True):
+                    if len(new_name.strip()) == 0:
+                        st.error("Атауы бос болмауы керек")
+                    else:
+                        store.add_product(
+                            name=new_name.strip(), price=int(new_price),
+                            stock=int(new_stock), description=new_desc.strip(),
+                            image=new_image.strip(), category=new_category.strip() or "Әр түрлі",
+                            rating=float(new_rating)
+                        )
+                        st.success(f"✅ «{new_name}» қосылды!")
+                        st.rerun()
+
+            st.write("----")
+            st.write("#### ✏️ Өңдеу / 🗑️ Өшіру")
+
+            all_products = store.products()
+            if not all_products:
+                st.info("Өнімдер жоқ")
+            else:
+                # Іздеу + сүзгі
+                pcol1, pcol2, pcol3 = st.columns([2,1,1])
+                with pcol1:
+                    p_search = st.text_input("Өнімді іздеу (атауы бойынша)", key="prod_search")
+                with pcol2:
+                    p_cats = ["Барлығы"] + sorted(list(set(p["category"] for p in all_products)))
+                    p_cat = st.selectbox("Санат", p_cats, key="prod_cat_filter")
+                with pcol3:
+                    p_sort = st.selectbox("Сұрыптау", ["Әдепкі", "Бағасы↑", "Бағасы↓", "Қалдық↑", "Қалдық↓"], key="prod_sort")
+
+                prods = list(all_products)
+                if p_search:
+                    prods = [p for p in prods if p_search.lower() in p["name"].lower()]
+                if p_cat != "Барлығы":
+                    prods = [p for p in prods if p["category"] == p_cat]
+
+                if p_sort == "Бағасы↑":
+                    prods.sort(key=lambda x: x["price"])
+                elif p_sort == "Бағасы↓":
+                    prods.sort(key=lambda x: x["price"], reverse=True)
+                elif p_sort == "Қалдық↑":
+                    prods.sort(key=lambda x: x["stock"])
+                elif p_sort == "Қалдық↓":
+                    prods.sort(key=lambda x: x["stock"], reverse=True)
+
+                # Бір кесте, бір бет: виджеттер саны каталог өлшеміне тәуелді емес
+                page_size = 50
+                pages = max(1, -(-len(prods) // page_size))
+                if st.session_state.get("prod_query") != (p_search, p_cat, p_sort):
+                    st.session_state["prod_query"] = (p_search, p_cat, p_sort)
+                    st.session_state["prod_page"] = 1
+                st.session_state["prod_page"] = min(max(st.session_state.get("prod_page", 1), 1), pages)
+                page = st.session_state["prod_page"] - 1
+                slice_ = prods[page * page_size:(page + 1) * page_size]
+
+                # Кесте кілті тек осы админ сақтағанда немесе бет/сүзгі ауысқанда өзгереді. Жолдардың реті бекітіледі
+                # (түзетулер жол нөмірімен сақталады), ал мәндер әр rerun-да store-дан жаңарады: түзетілмеген
+                # ұяшықтар ағымдағы қалдық пен бағаны көрсетеді, түзетулер сақталып қалады (num_rows="fixed").
+                saves = st.session_state.setdefault("prod_editor_saves", 0)
+                view_key = (saves, page, p_search, p_cat, p_sort)
+                editor_key = f"prod_editor_{saves}_{page}_{hash((p_search, p_cat, p_sort))}"
+                pinned = st.session_state.get("prod_editor_view")
+                if pinned is None or pinned[0] != view_key:
+                    pinned = st.session_state["prod_editor_view"] = (view_key, [p["id"] for p in slice_], {})
+                _, row_ids, stock_base = pinned
+                rows = [p for p in map(store.get_product, row_ids) if p is not None]
+                # Қалдық түзетуі өсім ретінде сақталады: негіз — админ ұяшықты өзгерткен сәтте көрген мән.
+                # Қалдығы түзетілмеген жолдардың негізі әр rerun-да жаңарады.
+                stock_edited = {i for i, cells in st.session_state.get(editor_key, {}).get("edited_rows", {}).items()
+                                if "Қалдық" in cells}
+                for i, p in enumerate(rows):
+                    if i not in stock_edited or p["id"] not in stock_base:
+                        stock_base[p["id"]] = int(p["stock"])
+                original = pd.DataFrame([{
+                    "ID": p["id"], "Атауы": p["name"], "Бағасы": int(p["price"]), "Қалдық": int(p["stock"]),
+                    "Санат": p["category"], "Рейтинг": float(p.get("rating", 4.5)),
+                    "Сипаттама": p["description"], "Сурет URL": p["image"], "Өшіру": False,
+                } for p in rows], columns=list(_PRODUCT_FIELDS) + ["ID", "Өшіру"])
+                edited = st.data_editor(
+                    original, key=editor_key,
+                    hide_index=True, use_container_width=True, num_rows="fixed", disabled=["ID"],
+                    column_order=["ID", "Атауы", "Бағасы", "Қалдық", "Санат", "Рейтинг", "Сипаттама", "Сурет URL", "Өшіру"],
+                    column_config={
+                        "Бағасы": st.column_config.NumberColumn("Бағасы (₸)", min_value=0, step=10),
+                        "Қалдық": st.column_config.NumberColumn("Қалдық (дана)", min_value=0, step=1),
+                        "Рейтинг": st.column_config.NumberColumn(min_value=0.0, max_value=5.0, step=0.1),
+                        "Өшіру": st.column_config.CheckboxColumn("🗑️ Өшіру"),
+                    },
+                )
+                ecol1, ecol2, ecol3 = st.columns([1, 2, 1])
+                with ecol1:
+                    st.number_input("Бет", min_value=1, max_value=pages, step=1, key="prod_page")
+                with ecol2:
+                    st.caption(f"Табылды: {len(prods)} · бет {page + 1} / {pages}")
+                with ecol3:
+                    if st.button("💾 Өзгерістерді сақтау", key="prod_bulk_save", use_container_width=True):
+                        changes, deletes = _product_diff(original, edited)
+                        # Басқа сессиялардың checkout-тары алған дана қайта жазылмайды: тек админ қосқан/алған айырма
+                        stock_deltas = {pid: fields.pop("stock") - stock_base[pid]
+                                        for pid, fields in changes.items() if "stock" in fields}
+                        changes = {pid: fields for pid, fields in changes.items() if fields}
+                        stock_deltas = {pid: delta for pid, delta in stock_deltas.items() if delta}
+                        if not changes and not deletes and not stock_deltas:
+                            st.info("Өзгеріс жоқ")
+                        else:
+                            store.update_products(changes, deletes, stock_deltas)
+                            st.session_state["prod_editor_saves"] += 1
+                            st.success(f"✅ Жаңартылды: {len(changes.keys() | stock_deltas.keys())}, өшірілді: {len(deletes)}")
+                            st.rerun()
+
+        # -------- Акциялар (ережелер индекстерге компиляцияланады, себет бағасы кэштеледі)
+        with tab4, PROFILER.span("admin.promotions"):
+            st.subheader("🏷️ Акциялар")
+            promotions = get_promotions()
+            kind_labels = {"category": "Санат жеңілдігі", "product": "Өнім жеңілдігі", "bundle": "Жиынтық (бірге алса)"}
+            all_products = {p["id"]: p["name"] for p in store.products()}
+            with st.form("add_promotion_form"):
+                pcol1, pcol2 = st.columns(2)
+                with pcol1:
+                    promo_name = st.text_input("Атауы", key="promo_name")
+                    promo_kind = st.selectbox("Түрі", list(kind_labels), format_func=kind_labels.get, key="promo_kind")
+                    promo_percent = st.slider("Жеңілдік (%)", min_value=1, max_value=90, value=10, key="promo_percent")
+                with pcol2:
+                    promo_category = st.selectbox("Санат", sorted({p["category"] for p in store.products()}), key="promo_category")
+                    promo_products = st.multiselect("Өнімдер", list(all_products), format_func=all_products.get, key="promo_products")
+                    promo_window = st.date_input("Мерзімі (бос — шектеусіз)", value=(), key="promo_window")
+                if st.form_submit_button("➕ Акция қосу", use_container_width=True):
+                    starts = datetime.combine(promo_window[0], datetime.min.time()) if len(promo_window) > 0 else None
+                    ends = datetime.combine(promo_window[-1], datetime.min.time()) + timedelta(days=1) if len(promo_window) > 0 else None
+                    result = promotions.add(promo_name, promo_kind, int(promo_percent), category=promo_category,
+                                            product_ids=promo_products, starts=starts, ends=ends)
+                    if result.is_right:
+                        st.success(f"✅ «{result.value.name}» қосылды")
+                    else:
+                        st.error(f"❌ {result.error}")
+
+            now = datetime.now()
+            rules = promotions.promotions()
+            if not rules:
+                st.info("Акциялар жоқ")
+            else:
+                st.dataframe(pd.DataFrame([{
+                    "ID": r.id,
+                    "Атауы": r.name,
+                    "Түрі": kind_labels[r.kind],
+                    "Жеңілдік": f"{r.percent}%",
+                    "Қолданылады": r.category if r.kind == "category" else ", ".join(all_products.get(i, str(i)) for i in r.product_ids),
+                    "Мерзімі": f"{r.starts:%Y-%m-%d} — {r.ends - timedelta(days=1):%Y-%m-%d}" if r.starts and r.ends else "Шектеусіз",
+                    "Белсенді": "✅" if r.active_at(now) else "⏸️",
+                } for r in rules]), use_container_width=True)
+                rcol1, rcol2 = st.columns([2, 1])
+                with rcol1:
+                    remove_id = st.selectbox("Акцияны өшіру", [r.id for r in rules], key="promo_remove",
+                                             format_func=lambda i: next(r.name for r in rules if r.id == i))
+                with rcol2:
+                    if st.button("🗑️ Өшіру", key="promo_remove_btn", use_container_width=True):
+                        promotions.remove(remove_id)
+                        st.rerun()
+            info = promotions.cache_info()
+            st.caption(f"Себет бағалары кэші: {info.hits} hit / {info.misses} miss, {info.currsize} жазба")
+
+        # -------- Аз қалдық (heap индексі, каталогты сканерлемейді)
+        with tab5, PROFILER.span("admin.low_stock"):
+            st.subheader("📉 Аз қалдық")
+            inventory = get_inventory()
+            lcol1, lcol2 = st.columns(2)
+            with lcol1:
+                st.metric("Қайта тапсырыс нүктесінен төмен", inventory.low_stock_count())
+            with lcol2:
+                top_n = st.number_input("Көрсетілетін өнімдер саны", min_value=1, max_value=500, value=20, step=5, key="low_stock_n")
+            st.caption(f"Жылдамдық соңғы {inventory.window_days} күн бойынша; қайта тапсырыс нүктесі = "
+                       f"жылдамдық × ({inventory.lead_time_days} күн жеткізу + {inventory.safety_days} күн қор), кемінде {inventory.min_stock}")
+
+            at_risk = inventory.top_at_risk(int(top_n))
+            if not at_risk:
+                st.info("Өнімдер жоқ")
+            else:
+                ledger = get_stock_ledger()
+                by_warehouse = ledger.availability([s.product_id for s in at_risk])
+                rows = []
+                for s, per_warehouse in zip(at_risk, by_warehouse):
+                    product = store.get_product(s.product_id)
+                    rows.append({
+                        "ID": s.product_id,
+                        "Өнім": product["name"] if product else "—",
+                        "Қалдық": s.stock,
+                        "Сатылым (дана/күн)": round(s.velocity, 2),
+                        "Қайта тапсырыс нүктесі": s.reorder_point,
+                        "Жетеді (күн)": "∞" if s.days_of_cover == float("inf") else f"{s.days_of_cover:.1f}",
+                        "Статус": "⚠️ Толықтыру керек" if s.is_low else "✅ Жеткілікті",
+                        **{w.name: q for w, q in zip(ledger.warehouses, per_warehouse)},
+                    })
+                st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+            if inventory.alerts:
+                st.write("#### 🔔 Соңғы ескертулер")
+                for when, s in list(inventory.alerts)[::-1][:10]:
+                    product = store.get_product(s.product_id)
+                    st.write(f"{when.strftime('%H:%M:%S')} — «{product['name'] if product else s.product_id}» қалдығы {s.stock} (нүкте {s.reorder_point})")
+
+        # -------- Пайдаланушылар
+        with tab6, PROFILER.span("admin.users"):
+            st.subheader("👥 Пайдаланушылар")
+            if not store.users():
+                st.info("Пайдаланушылар жоқ")
+            else:
+                ucol1, ucol2, ucol3 = st.columns([2,1,1])
+                with ucol1:
+                    u_search = st.text_input("Іздеу (аты/username/email)")
+                with ucol2:
+                    role_filter = st.selectbox("Рөл сүзгісі", ["Барлығы", "Админ", "Қарапайым"])
+                with ucol3:
+                    sort_user = st.selectbox("Сұрыптау", ["Әдепкі", "Аты-жөні", "Username"])
+
+                users = list(store.users())
+                if u_search:
+                    q = u_search.lower()
+                    users = [u for u in users if q in (u.get("full_name","").lower() + " " + u["username"].lower() + " " + u.get("email","").lower())]
+                if role_filter == "Админ":
+                    users = [u for u in users if u.get("is_admin")]
+                elif role_filter == "Қарапайым":
+                    users = [u for u in users if not u.get("is_admin")]
+
+                if sort_user == "Аты-жөні":
+                    users.sort(key=lambda x: x.get("full_name","").lower())
+                elif sort_user == "Username":
+                    users.sort(key=lambda x: x["username"].lower())
+
+                data = []
+                for u in users:
+                    data.append({
+                        "ID": u["id"],
+                        "Аты-жөні": u.get("full_name",""),
+                        "Username": u["username"],
+                        "Email": u.get("email",""),
+                        "Телефон": u.get("phone",""),
+                        "Рөл": "Админ" if u.get("is_admin") else "Пайдаланушы"
+                    })
+                st.dataframe(pd.DataFrame(data), use_container_width=True)
+
+                st.write("----")
+                st.write("#### Рөл тағайындау / Құпиясөзді ауыстыру / Өшіру")
+
+                if users:
+                    uid_list = [u["id"] for u in users]
+                    sel_uid = st.selectbox("Пайдаланушыны таңдаңыз (ID)", uid_list, key="user_manage_sel")
+                    target = store.get_user(sel_uid)
+                    if target:
+                        c1, c2, c3 = st.columns(3)
+                        with c1:
+                            make_admin = st.checkbox("Админ ету", value=bool(target.get("is_admin")), key="chk_admin")
+                            if st.button("💼 Рөлді сақтау", use_container_width=True):
+                                if target["id"] == me["id"] and not make_admin:
+                                    st.error("Өзіңіздің админ құқығын шектеуге болмайды.")
+                                else:
+                                    store.update_user(target["id"], is_admin=make_admin)
+                                    st.success("✅ Рөл жаңартылды")
+                                    st.rerun()
+                        with c2:
+                            new_pass = st.text_input("Жаңа құпиясөз", type="password", key="new_pass_admin")
+                            if st.button("🔑 Құпиясөзді ауыстыру", use_container_width=True):
+                                if len(new_pass) < 4:
+                                    st.error("Құпиясөз тым қысқа")
+                                else:
+                                    store.update_user(target["id"], password=new_pass)
+                                    st.success("✅ Құпиясөз ауыстырылды")
+                        with c3:
+                            if st.button("🗑️ Пайдаланушыны өшіру", use_container_width=True):
+                                if target["id"] == me["id"]:
+                                    st.error("Өзіңізді өшіре алмайсыз.")
+                                else:
+                                    # Байланысты тапсырыстарды қалдыруға болады (тарих үшін)
+                                    store.delete_user(target["id"])
+                                    st.warning("🗑️ Пайдаланушы өшірілді")
+                                    st.rerun()
+
+        # -------- Өнімділік (профильдеу)
+        with tab7:
+            st.subheader("⏱️ Өнімділік")
+            records = list(PROFILER.history)
+            if not records:
+                st.info("Әзірге профильденген rerun жоқ")
+            else:
+                walls = [r.wall for r in records]
+                cpus = [r.cpu for r in records]
+                sampled = [r.alloc_peak for r in records if r.alloc_peak is not None]
+                col1, col2, col3, col4 = st.columns(4)
+                with col1: st.metric("🔁 Rerun саны", PROFILER.reruns_total)
+                with col2: st.metric("⏱️ Орташа wall", f"{1000 * sum(walls) / len(walls):.1f} ms")
+                with col3: st.metric("🧮 Орташа CPU", f"{1000 * sum(cpus) / len(cpus):.1f} ms")
+                with col4: st.metric("🧠 Жады шыңы (соңғы)", f"{sampled[-1] / 1024:.0f} KB" if sampled else "—")
+
+                st.write(f"#### Соңғы {len(records)} rerun")
+                st.dataframe(pd.DataFrame([{
+                    "Уақыты": r.started_at.strftime("%H:%M:%S"),
+                    "Бет": r.label,
+                    "Wall (ms)": round(1000 * r.wall, 2),
+                    "CPU (ms)": round(1000 * r.cpu, 2),
+                    "Жады шыңы (KB)": round(r.alloc_peak / 1024, 1) if r.alloc_peak is not None else None,
+                    "Үзілген": "иә" if r.interrupted else "",
+                    "Санауыштар": ", ".join(f"{k}={v}" for k, v in sorted(r.counters.items())),
+                } for r in reversed(records)]), use_container_width=True)
+
+                st.write("#### Flame graph (соңғы rerun-дар бойынша)")
+                bars = []
+                for path, depth, wall, share in PROFILER.flame_breakdown():
+                    name = path.rsplit(";", 1)[-1]
+                    bars.append(
+                        f'<div style="margin-left:{depth * 24}px; width:{max(share * 100, 1):.1f}%; '
+                        f'background:#fdba74; border:1px solid #fb923c; border-radius:4px; padding:2px 6px; '
+                        f'margin-bottom:2px; white-space:nowrap; font-size:13px;">'
+                        f'{name} — {1000 * wall:.1f} ms ({100 * share:.1f}%)</div>'
+                    )
+                st.markdown("".join(bars) or "—", unsafe_allow_html=True)
+
+                st.write("#### Кэш тиімділігі")
+                cache_rows = [{"Кэш": name, "Hits": hits, "Misses": misses, "Hit rate": f"{100 * rate:.1f}%"}
+                              for name, (hits, misses, rate) in PROFILER.cache_hit_rates().items()]
+                st.dataframe(pd.DataFrame(cache_rows), use_container_width=True)
+
+            st.write("#### 📧 Хабарламалар конвейері")
+            pipeline = get_notification_pipeline()
+            ncols = st.columns(5)
+            for col, (label, value) in zip(ncols, [("Кезекте", pipeline.pending()), ("Жіберілді", pipeline.stats["sent"]),
+                                                   ("Қайталау", pipeline.stats["retries"]), ("Сәтсіз", pipeline.stats["failed"]),
+                                                   ("Тасталды", pipeline.stats["dropped"])]):
+                with col: st.metric(label, value)
+
+            st.write("#### Prometheus метрикалары")
+            metrics_text = PROFILER.prometheus_text()
+            st.code(metrics_text, language="text")
+            st.download_button("⬇️ metrics.txt", metrics_text, file_name="metrics.txt", mime="text/plain")
@@ -0,0 +1,108 @@
+import streamlit as st
+from datetime import date
+
+from markstore.inventory import get_inventory
+from markstore.notifications import notify_order_event
+from markstore.profiling import PROFILER
+from markstore.promotions import get_promotions
+from markstore.recommendations import get_recommender
+from markstore.rendering import price_text
+from markstore.store import get_store
+from markstore.ui import get_product_old
+from markstore.warehouses import get_stock_ledger
+
+# ---------------------------
+# 5) Себет
+# ---------------------------
+def render(me):
+    st.header("🛒 Себет")
+    if not me:
+        st.info("📝 Себетті көру үшін жүйеге кіріңіз")
+        if st.button("👤 Жүйеге кіру", use_container_width=True):
+            st.session_state.current_page = "🏪 Негізгі бет"
+            st.rerun()
+    else:
+        if not st.session_state["cart"]:
+            st.info("😔 Сіздің себетіңіз бос")
+            if st.button("🏪 Сатылымға өту", use_container_width=True):
+                st.session_state.current_page = "🏪 Негізгі бет"
+                st.rerun()
+        else:
+            cart_data = []
+            with PROFILER.span("cart.lines"):
+                # Бүкіл себет акциялармен бір өтуде бағаланады (нәтиже себет + ережелер ревизиясы бойынша кэште)
+                items = [i for i in st.session_state["cart"] if get_product_old(i["product_id"])]
+                cart_pricing = get_promotions().price_cart(items)
+                if not cart_pricing.is_right:
+                    # Өнімді басқа сессия дәл осы сәтте өшірсе
+                    st.error(f"❌ {cart_pricing.error}")
+                    return
+                pricing = cart_pricing.value
+                for line in pricing.lines:
+                    prod = get_product_old(line.product_id)
+                    cart_data.append({
+                        "Өнім": prod["name"],
+                        "Бірлік бағасы": price_text(line.unit_price),
+                        "Саны": line.quantity,
+                        "Жеңілдік": f"−{price_text(line.discount)}" if line.discount else "—",
+                        "Жалпы": price_text(line.total)
+                    })
+                total_cart = pricing.total
+
+            import pandas as pd  # ауыр тәуелділік: тек кесте көрсетілгенде жүктеледі
+            st.dataframe(pd.DataFrame(cart_data), use_container_width=True)
+            if pricing.discount:
+                names = ", ".join(dict.fromkeys(n for line in pricing.lines for n in line.promotions))
+                st.caption(f"🏷️ Акциялар ({names}): −{price_text(pricing.discount)} · бағасы жеңілдіксіз {price_text(pricing.subtotal)}")
+            st.markdown(f"### 💰 Жалпы сома: **{price_text(total_cart)}**")
+
+            ledger = get_stock_ledger()
+            plan = ledger.plan(st.session_state["cart"])
+            if plan.shipments:
+                names = {w.id: w.name for w in ledger.warehouses}
+                st.caption(f"🏬 Жөнелтімдер: {len(plan.shipments)} — " + ", ".join(
+                    f"{names[s.warehouse_id]} ({s.units} дана)" for s in plan.shipments))
+
+            recommender = get_recommender()
+            suggestions = [get_product_old(pid) for pid in recommender.suggestions_for(i["product_id"] for i in st.session_state["cart"])]
+            suggestions = [p for p in suggestions if p and p["stock"] > 0]
+            if suggestions:
+                st.write("#### 🤝 Бұлармен жиі бірге алынады")
+                for col, p in zip(st.columns(len(suggestions)), suggestions):
+                    with col:
+                        st.markdown(f"**{p['name']}**  \n{price_text(p['price'])}")
+
+            with st.expander("🚚 Жеткізу мәліметтері"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    delivery_address = st.text_input("Жеткізу мекенжайы", value="Алматы, Абай көшесі 1")
+                with col2:
+                    min_d = date.today()
+                    delivery_date = st.date_input("Жеткізу күні", min_value=min_d, value=min_d)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("🧹 Себетті тазалау", use_container_width=True):
+                    st.session_state["cart"] = []
+                    st.success("✅ Себет тазаланды!")
+                    st.rerun()
+            with col2:
+                if st.button("✅ Тапсырыс беру", type="primary", use_container_width=True):
+                    # Қалдықты тексеру, азайту және тапсырысты тіркеу ортақ қоймада бір қадаммен орындалады
+                    get_inventory()  # аз қалдық мониторы осы тапсырыстың оқиғаларын да көруі үшін
+                    # Жол сомалары жеңілдікпен бірге сақталады: сатылым есебі тапсырыс сомасымен сәйкес келеді
+                    line_totals = {line.product_id: line.total for line in pricing.lines}
+                    priced = [dict(i, line_total=line_totals[i["product_id"]]) if i["product_id"] in line_totals else i
+                              for i in st.session_state["cart"]]
+                    result = get_store().place_order(me["id"], priced, total_cart,
+                                                     delivery_address, delivery_date, allocate=ledger.reserve)
+                    if not result.is_right:
+                        st.error(f"❌ {result.error}")
+                    else:
+                        order = result.value
+                        notify_order_event("placed", order, me)
+                        st.session_state["cart"] = []
+                        st.success(f"🎉 Тапсырыс №{order['id']} сәтті қабылданды!")
+                        st.balloons()
+                        st.info(f"📦 Тапсырыс №{order['id']}. Жеткізу күні: {delivery_date}")
+                        st.rerun()
@@ -0,0 +1,114 @@
+import streamlit as st
+
+from markstore.models import Product
+from markstore.profiling import PROFILER
+from markstore.recommendations import get_recommender
+from markstore.rendering import product_card_html
+from markstore.search import get_search_index
+from markstore.store import get_store
+from markstore.services import format_price, recursive_category_tree, recursive_total_value, expensive_product_analysis
+
+# ---------------------------
+# 4) Негізгі бет (каталог)
+# ---------------------------
+def render(me):
+    st.header("🎁 Өнімдер каталогы")
+    
+    # Лабораториялық жұмыс #2: Функционалдық талдау бөлімі
+    st.subheader("📊 Функционалдық талдау")
+    col1, col2 = st.columns(2)
+    
+    with col1, PROFILER.span("catalog.category_tree"):
+        st.write("**Категория ағашы (рекурсивті):**")
+        # Өнімдерді Product нысандарына түрлендіру
+        store = get_store()
+        search_revision, products_data = store.search_snapshot()
+        products = [Product(p["id"], p["name"], p["price"], p["stock"], 
+                           p["description"], p["image"], p["category"], p["rating"]) 
+                   for p in products_data]
+        category_tree = recursive_category_tree(products)
+        for line in category_tree:
+            st.text(line)
+    
+    with col2:
+        st.write("**Инвентарлық құн (рекурсивті):**")
+        total_value = recursive_total_value(products)
+        st.metric("Жалпы инвентарлық құн", format_price(total_value))
+        
+        # Лабораториялық жұмыс #3: Мемоизацияны көрсету
+        st.write("**Қымбат талдау (мемоизациямен):**")
+        if st.button("🔄 Талдауды орындау"):
+            with st.spinner("Талдау орындалуда..."):
+                # Өнімдерді tuple түріне түрлендіру (lru_cache үшін hashable болуы керек)
+                products_tuple = tuple((p.id, p.name, p.price, p.stock, p.description, 
+                                      p.image, p.category, p.rating) for p in products)
+                analysis = expensive_product_analysis(products_tuple)
+                st.metric("Өнімдер саны", analysis["total_products"])
+                st.metric("Инвентарлық құн", format_price(analysis["total_inventory_value"]))
+                st.metric("Орташа баға", format_price(analysis["average_price"]))
+                st.metric("Категориялар", analysis["unique_categories"])
+    
+    st.header("🎁 Өнімдер каталогы")
+    filter_col1, filter_col2, filter_col3 = st.columns([2, 1, 1])
+    with filter_col1:
+        search_query = st.text_input("🔍 Өнімді іздеу", placeholder="Өнім атын енгізіңіз...")
+    with filter_col2:
+        categories = ["Барлығы"] + sorted(list(set(p["category"] for p in products_data)))
+        selected_category = st.selectbox("📂 Санат", categories)
+    with filter_col3:
+        sort_option = st.selectbox("📊 Сұрыптау", ["Әдетті", "Бағасы артуы", "Бағасы кемуі", "Жоғары рейтинг"])
+
+    filtered_products = list(products_data)
+    if selected_category != "Барлығы":
+        filtered_products = [p for p in filtered_products if p["category"] == selected_category]
+    if search_query:
+        with PROFILER.span("catalog.search"):
+            # Санат сүзгісі іздеудің limit-інен бұрын қолданылады
+            by_id = {p["id"]: p for p in filtered_products}
+            ranked_ids = get_search_index(products_data, revision=search_revision).search(search_query, allowed=by_id)
+            filtered_products = [by_id[pid] for pid in ranked_ids if pid in by_id]
+
+    if sort_option == "Бағасы артуы":
+        filtered_products.sort(key=lambda x: x["price"])
+    elif sort_option == "Бағасы кемуі":
+        filtered_products.sort(key=lambda x: x["price"], reverse=True)
+    elif sort_option == "Жоғары рейтинг":
+        filtered_products.sort(key=lambda x: x.get("rating", 0), reverse=True)
+
+    if not filtered_products:
+        st.warning("Өнімдер табылмады")
+    else:
+        with PROFILER.span("catalog.cards"):
+            PROFILER.count("catalog.cards_rendered", len(filtered_products))
+            recommender = get_recommender()
+            cols = st.columns(3)
+            for idx, p in enumerate(filtered_products):
+                with cols[idx % 3]:
+                    # Өнім өзгермесе, карточка HTML-і кэштен алынады
+                    st.markdown(product_card_html(p, store.product_revision_of(p["id"])), unsafe_allow_html=True)
+
+                    related = [other["name"] for other in map(store.get_product, recommender.neighbors(p["id"])) if other]
+                    if related:
+                        st.caption("🤝 Жиі бірге алынады: " + ", ".join(related))
+
+                    if me and not me["is_admin"]:
+                        col1, col2 = st.columns([1, 2])
+                        with col1:
+                            qty = st.number_input(f"Саны {p['id']}", min_value=1, max_value=max(1,p["stock"]),
+                                                  value=1, key=f"qty_{p['id']}", label_visibility="collapsed")
+                        with col2:
+                            disabled = p["stock"] <= 0
+                            if st.button("🛒 Себетке қосу", key=f"add_{p['id']}", use_container_width=True, disabled=disabled):
+                                existing_item = next((item for item in st.session_state["cart"] if item["product_id"] == p["id"]), None)
+                                if existing_item:
+                                    if existing_item["quantity"] + qty <= p["stock"]:
+                                        existing_item["quantity"] += qty
+                                        st.success(f"✅ {p['name']} себетке қосылды! (Барлығы: {existing_item['quantity']})")
+                                    else:
+                                        st.error(f"❌ Қалдық жеткіліксіз! Қолжетімді: {p['stock']}")
+                                else:
+                                    st.session_state["cart"].append({"product_id": p["id"], "quantity": qty})
+                                    st.success(f"✅ {p['name']} себетке қосылды!")
+                                st.rerun()
+                    elif not me:
+                        st.info("📝 Себетке қосу үшін жүйеге кіріңіз")
@@ -0,0 +1,87 @@
+import streamlit as st
+from datetime import timedelta
+
+from markstore.archive import get_order_archive
+from markstore.rendering import price_text
+from markstore.store import get_store
+from markstore.ui import get_product_old
+from markstore.warehouses import get_stock_ledger
+
+# ---------------------------
+# 6) Тапсырыстарым
+# ---------------------------
+def _render_order(o):
+    status_text = o["status"]
+    if status_text == "pending":
+        status_display = "🟡 Күтуде"
+    elif status_text == "completed":
+        status_display = "🟢 Аяқталды"
+    elif status_text == "shipped":
+        status_display = "🚚 Жолға шықты"
+    else:
+        status_display = f"🔵 {status_text}"
+
+    with st.expander(f"📝 Тапсырыс №{o['id']} - {status_display} - {o['created_at'].strftime('%Y-%m-%d %H:%M')}"):
+        items = []
+        for it in o["items"]:
+            p = get_product_old(it["product_id"])
+            if not p:
+                continue
+            # Тапсырыста сақталған (жеңілдікпен) сома; ағымдағы баға бойынша қайта есептелмейді.
+            # Жоқ болса (1-нұсқадағы ескі мұрағат) — белгісіз
+            line_total = it.get("line_total")
+            items.append({
+                "Өнім": p["name"],
+                "Саны": it["quantity"],
+                "Бағасы": price_text(p['price']),
+                "Жалпы": price_text(line_total) if line_total is not None else "—"
+            })
+        import pandas as pd  # ауыр тәуелділік: тек кесте көрсетілгенде жүктеледі
+        st.table(pd.DataFrame(items))
+        st.markdown(f"**💰 Тапсырыс сомасы: {price_text(o['total'])}**")
+        if "address" in o:
+            st.markdown(f"**🏠 Жеткізу мекенжайы: {o['address']}**")
+        if "delivery_date" in o:
+            st.markdown(f"**📅 Жеткізу күні: {o['delivery_date']}**")
+        if o.get("shipments"):
+            names = {w.id: w.name for w in get_stock_ledger().warehouses}
+            st.markdown("**🏬 Жөнелтімдер: " + ", ".join(
+                f"{names.get(s.warehouse_id, s.warehouse_id)} ({s.units} дана)" for s in o["shipments"]) + "**")
+
+def render(me):
+    st.header("📦 Менің тапсырыстарым")
+    if not me:
+        st.info("📝 Тапсырыстарды көру үшін жүйеге кіріңіз")
+        if st.button("👤 Жүйеге кіру", use_container_width=True):
+            st.session_state.current_page = "🏪 Негізгі бет"
+            st.rerun()
+    else:
+        my_orders = get_store().orders_for_user(me["id"])
+        archive = get_order_archive()
+        archived_count, _ = archive.user_summary(me["id"])
+        if not my_orders and not archived_count:
+            st.info("😔 Сізде әлі тапсырыс жоқ")
+            if st.button("🏪 Сатылымға өту", use_container_width=True):
+                st.session_state.current_page = "🏪 Негізгі бет"
+                st.rerun()
+        else:
+            my_orders.sort(key=lambda x: x["created_at"], reverse=True)
+            for o in my_orders:
+                _render_order(o)
+
+            if archived_count:
+                # Суық сегменттер тек пайдаланушы сұрағанда және тек таңдалған аралық үшін оқылады
+                st.subheader("🗄️ Ескі тапсырыстар")
+                if st.checkbox(f"Мұрағаттағы тапсырыстарды көрсету ({archived_count})", key="my_orders_archive"):
+                    cutoff = archive.cutoff().date()
+                    period = st.date_input("Кезең", value=(cutoff - timedelta(days=365), cutoff), key="my_orders_archive_period")
+                    date_from = period[0] if len(period) > 0 else None
+                    date_to = period[1] if len(period) > 1 else date_from
+                    old_orders = archive.orders_for_user(me["id"], date_from, date_to)
+                    if archive.damaged:
+                        st.warning("⚠️ Мұрағаттың кейбір бөліктері оқылмады, тізім толық болмауы мүмкін")
+                    if not old_orders:
+                        st.info("Бұл кезеңде мұрағатталған тапсырыс жоқ")
+                    old_orders.sort(key=lambda x: x["created_at"], reverse=True)
+                    for o in old_orders:
+                        _render_order(o)
@@ -0,0 +1,52 @@
+import streamlit as st
+
+from markstore.archive import get_order_archive
+from markstore.rendering import price_text
+from markstore.store import get_store
+
+# ---------------------------
+# 7) Профиль
+# ---------------------------
+def render(me):
+    st.header("👤 Профиль")
+    if not me:
+        st.info("📝 Профильді көру үшін жүйеге кіріңіз")
+        if st.button("👤 Жүйеге кіру", use_container_width=True):
+            st.session_state.current_page = "🏪 Негізгі бет"
+            st.rerun()
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("👤 Сіз туралы ақпарат")
+            with st.form("profile_form"):
+                full_name = st.text_input("Аты-жөні", value=me["full_name"])
+                email = st.text_input("Email", value=me.get("email", ""))
+                phone = st.text_input("Телефон", value=me.get("phone", ""))
+                if st.form_submit_button("✅ Профильді жаңарту", use_container_width=True):
+                    get_store().update_user(me["id"], full_name=full_name.strip() or me["full_name"],
+                                            email=email, phone=phone)
+                    st.success("✅ Профиль сәтті жаңартылды!")
+        with col2:
+            st.subheader("📊 Статистика")
+            my_orders = get_store().orders_for_user(me["id"])
+            # Мұрағаттағы тапсырыстар манифест қорытындыларынан қосылады (сегменттер ашылмайды)
+            archived_count, archived_spent = get_order_archive().user_summary(me["id"])
+            total_orders = len(my_orders) + archived_count
+            total_spent = sum(o['total'] for o in my_orders) + archived_spent
+            colm1, colm2 = st.columns(2)
+            with colm1: st.metric("📦 Жалпы тапсырыстар", total_orders)
+            with colm2: st.metric("💰 Жалпы жұмсалған", price_text(total_spent))
+            if my_orders:
+                st.subheader("📋 Соңғы тапсырыстар")
+                recent_orders = sorted(my_orders, key=lambda x: x["created_at"], reverse=True)[:3]
+                for o in recent_orders:
+                    status_text = o["status"]
+                    if status_text == "pending":
+                        status_display = "🟡 Күтуде"
+                    elif status_text == "completed":
+                        status_display = "🟢 Аяқталды"
+                    elif status_text == "shipped":
+                        status_display = "🚚 Жолға шықты"
+                    else:
+                        status_display = f"🔵 {status_text}"
+                    st.write(f"📦 Тапсырыс №{o['id']} - {status_display} - {price_text(o['total'])}")
@@ -0,0 +1,117 @@
+import streamlit as st
+
+from markstore.profiling import PROFILER
+from markstore.store import get_store
+from markstore.throttle import get_login_throttle
+from markstore.views import PAGE_MODULES, ADMIN_PAGE
+
+def _client_key() -> str:
+    """Клиентті анықтау: IP мекенжайы (X-Forwarded-For әдейі қолданылмайды — оны клиент өзі жасай алады)"""
+    return st.context.ip_address or "local"
+
+def render_sidebar():
+    """Бүйірлік панель: кіру/тіркелу және навигация. Ағымдағы пайдаланушыны қайтарады"""
+    st.sidebar.markdown("""
+    <div style="text-align:center; margin-bottom:30px;">
+        <h1 style="color:#000000; margin-bottom:5px;">🛒 MarkStore</h1>
+        <p style="color:#000000;">Электрондық дүкен</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.sidebar.markdown("---")
+
+    store = get_store()
+    me = st.session_state["me"]
+    if me is not None:
+        # Сессияда тек ортақ жазбаның көрінісі бар; пайдаланушы өшірілген болса, сессия жабылады
+        me = store.get_user(me["id"])
+        st.session_state["me"] = me
+
+    if me is None:
+        auth_tab = st.sidebar.radio("Аутентификация", ["Кіру", "Тіркелу", "Функционалдық талдау"], label_visibility="collapsed")
+        if auth_tab == "Кіру":
+            with st.sidebar.form("login_form"):
+                st.subheader("👤 Жүйеге кіру")
+                username = st.text_input("Пайдаланушы аты", key="login_user")
+                password = st.text_input("Құпия сөз", type="password", key="login_pass")
+                login_btn = st.form_submit_button("✅ Кіру", use_container_width=True)
+                if login_btn:
+                    throttle = get_login_throttle()
+                    allowed = throttle.check(username, _client_key())
+                    if not allowed.is_right:
+                        # Шектелген әрекет пайдаланушыны іздеуге дейін тоқтатылады
+                        PROFILER.count("auth.throttled")
+                        st.sidebar.error(f"⏳ {allowed.error}")
+                    else:
+                        with PROFILER.span("auth.login_lookup"):
+                            user = store.find_user(username)
+                            if user and user["password"] != password:
+                                user = None
+                        if user:
+                            throttle.login_succeeded(username)
+                            st.session_state["me"] = user
+                            st.sidebar.success(f"Қош келдіңіз, {user['full_name']}!")
+                            st.rerun()
+                        else:
+                            st.sidebar.error("Қате логин немесе пароль")
+        elif auth_tab == "Тіркелу":
+            with st.sidebar.form("register_form"):
+                st.subheader("😊 Жаңа аккаунт жасау")
+                new_user = st.text_input("Пайдаланушы аты")
+                new_pass = st.text_input("Құпия сөз", type="password")
+                confirm_pass = st.text_input("Құпия сөзді растау", type="password")
+                full_name = st.text_input("Аты-жөні")
+                email = st.text_input("Email")
+                phone = st.text_input("Телефон")
+                register_btn = st.form_submit_button("✅ Тіркелу", use_container_width=True)
+                if register_btn:
+                    if len(new_user.strip()) < 3:
+                        st.sidebar.error("Пайдаланушы аты тым қысқа")
+                    elif new_pass != confirm_pass:
+                        st.sidebar.error("Құпия сөздер сәйкес емес!")
+                    else:
+                        result = store.add_user(new_user, new_pass, full_name or new_user, email, phone)
+                        if result.is_right:
+                            st.session_state["me"] = result.value
+                            st.sidebar.success("Сіз сәтті тіркелдіңіз! 🎉")
+                            st.rerun()
+                        else:
+                            st.sidebar.error(result.error)
+        else:
+            st.sidebar.subheader("🔬 Функционалдық талдау")
+            st.sidebar.info("Бұл бөлімде функционалдық бағдарламау принциптері қолданылған:")
+            st.sidebar.write("• ✅ Таза функциялар")
+            st.sidebar.write("• ✅ Өзгермейтін деректер")
+            st.sidebar.write("• ✅ Жоғары ретті функциялар")
+            st.sidebar.write("• ✅ Рекурсия және мемоизация")
+            st.sidebar.write("• ✅ Option/Either монадтары")
+    else:
+        st.sidebar.markdown(f"""
+        <div style="background:rgba(255,255,255,0.1); padding:15px; border-radius:12px; margin-bottom:20px;">
+            <h4 style="color:#000000; margin:0;">👋 Қош келдіңіз!</h4>
+            <p style="color:#000000; margin:5px 0 0 0;"><b>{me['full_name']}</b></p>
+            <p style="color:#000000; margin:0;">{me.get('email','')}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        if st.sidebar.button("🚪 Жүйеден шығу", use_container_width=True):
+            del st.session_state["me"]
+            st.rerun()
+
+    st.sidebar.markdown("---")
+
+    # Навигация
+    st.sidebar.subheader("🧭 Негізгі бөлімдер")
+    nav_options = [page for page in PAGE_MODULES if page != ADMIN_PAGE]
+    if me and me.get("is_admin", False):
+        nav_options.append(ADMIN_PAGE)
+
+    # Навигация батырмалары
+    for i, option in enumerate(nav_options):
+        if st.sidebar.button(option, key=f"nav_{i}", use_container_width=True):
+            st.session_state.current_page = option
+
+    # Әдепкі бет
+    if "current_page" not in st.session_state:
+        st.session_state.current_page = "🏪 Негізгі бет"
+
+    return me
@@ -0,0 +1,202 @@
+import threading
+from dataclasses import dataclass
+from typing import List, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from markstore.models import Shipment
+from markstore.monads import Either
+from markstore.store import get_store
+
+# ---------------------------
+# Көп қоймалы қалдық: қойма бойынша дана және жөнелтімдерді жоспарлау
+# ---------------------------
+@dataclass(frozen=True)
+class Warehouse:
+    id: int
+    name: str
+    city: str
+
+# Реті — басымдық: жоспар тең жағдайда алдыңғы қойманы таңдайды
+DEFAULT_WAREHOUSES = (
+    Warehouse(1, "Алматы-1", "Алматы"),
+    Warehouse(2, "Астана-1", "Астана"),
+    Warehouse(3, "Шымкент-1", "Шымкент"),
+    Warehouse(4, "Қарағанды-1", "Қарағанды"),
+)
+
+@dataclass(frozen=True)
+class AllocationPlan:
+    shipments: Tuple[Shipment, ...]
+    shortages: Mapping[int, int]         # product_id -> жетпейтін дана
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.shortages
+
+def split_stock(stock: int, warehouses: int, offset: int, spread: int = 2) -> List[int]:
+    """Таза функция: қалдықты offset-тен басталатын spread қоймаға тең бөлу (бастапқы толтыру үшін)"""
+    row = [0] * warehouses
+    spread = min(spread, warehouses)
+    base, extra = divmod(stock, spread)
+    for k in range(spread):
+        row[(offset + k) % warehouses] = base + (1 if k < extra else 0)
+    return row
+
+def plan_allocation(lines: Sequence[Tuple[int, int]], available: Sequence[Sequence[int]],
+                    warehouse_ids: Sequence[int]) -> AllocationPlan:
+    """
+    Себет жолдарын қоймаларға бөлу, жөнелтімдер санын азайту үшін ашкөз set cover:
+    әр қадамда қалған сұраныстың ең көп данасын жаба алатын қойма таңдалады.
+    Бір қойма бәрін жаба алса, ол бірінші қадамда-ақ таңдалады (бір жөнелтім).
+    available[i][w] — i-жолдың өнімінің w-қоймадағы қалдығы (StockLedger.availability).
+    numpy бар болса әр қадам векторланған, жоқ болса таза Python; нәтижелері бірдей.
+    """
+    try:
+        import numpy  # noqa: F401  (pandas арқылы әдетте орнатылған)
+    except ImportError:
+        picks, remaining = _greedy_python([q for _, q in lines], available, len(warehouse_ids))
+    else:
+        picks, remaining = _greedy_numpy([q for _, q in lines], available, len(warehouse_ids))
+    shipments = tuple(Shipment(warehouse_ids[w], tuple((lines[i][0], q) for i, q in taken)) for w, taken in picks)
+    shortages = {lines[i][0]: q for i, q in enumerate(remaining) if q > 0}
+    return AllocationPlan(shipments, shortages)
+
+def _greedy_python(need: List[int], available: Sequence[Sequence[int]], n_warehouses: int):
+    avail = [list(row) for row in available]
+    picks = []
+    while True:
+        best_w, best = -1, 0
+        for w in range(n_warehouses):
+            covered = sum(min(row[w], q) for row, q in zip(avail, need) if q)
+            if covered > best:
+                best_w, best = w, covered
+        if best_w < 0:
+            return picks, need
+        taken = []
+        for i, (row, q) in enumerate(zip(avail, need)):
+            t = min(row[best_w], q)
+            if t:
+                taken.append((i, t))
+                need[i] -= t
+                row[best_w] -= t
+        picks.append((best_w, taken))
+
+def _greedy_numpy(need: List[int], available: Sequence[Sequence[int]], n_warehouses: int):
+    import numpy as np
+
+    avail = np.array(available, dtype=np.int64).reshape(len(need), n_warehouses)
+    remaining = np.array(need, dtype=np.int64)
+    picks = []
+    while remaining.any():
+        covered = np.minimum(avail, remaining[:, None]).sum(axis=0)
+        w = int(covered.argmax())  # тең болса — бірінші (басымдығы жоғары) қойма
+        if covered[w] == 0:
+            break
+        take = np.minimum(avail[:, w], remaining)
+        remaining -= take
+        avail[:, w] -= take
+        idx = np.flatnonzero(take)
+        picks.append((w, list(zip(idx.tolist(), take[idx].tolist()))))
+    return picks, remaining.tolist()
+
+class StockLedger:
+    """
+    Қойма бойынша қалдық: {product_id: [дана әр қоймада]} (бағандар warehouses ретімен).
+    Product.stock барлық қоймалардың қосындысы болып қала береді; store оқиғалары келгенде
+    қосынды салыстырылады және айырма қоймаларға түзетіледі (checkout кезінде айырма нөл).
+    Себеттің барлық жолдарының қолжетімділігі бір lock астында бір топтамамен оқылады.
+    """
+    def __init__(self, warehouses: Iterable[Warehouse] = DEFAULT_WAREHOUSES, spread: int = 2):
+        self.warehouses = tuple(warehouses)
+        self.spread = spread
+        self._rows: Dict[int, List[int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def warehouse_ids(self) -> Tuple[int, ...]:
+        return tuple(w.id for w in self.warehouses)
+
+    def load(self, products: Iterable[Mapping]) -> None:
+        with self._lock:
+            self._rows = {p["id"]: split_stock(p["stock"], len(self.warehouses), p["id"], self.spread) for p in products}
+
+    # ---- оқу
+    def quantities(self, product_id: int) -> Dict[int, int]:
+        with self._lock:
+            row = self._rows.get(product_id, [0] * len(self.warehouses))
+            return dict(zip(self.warehouse_ids, row))
+
+    def availability(self, product_ids: Sequence[int]) -> List[List[int]]:
+        """Батчтық сұраныс: әр өнімнің қойма бойынша қалдық жолы (белгісіз өнім — нөлдер)"""
+        zero = [0] * len(self.warehouses)
+        with self._lock:
+            rows = self._rows
+            return [list(rows.get(pid, zero)) for pid in product_ids]
+
+    @staticmethod
+    def _lines(items: Iterable[Mapping]) -> List[Tuple[int, int]]:
+        """Бір өнім бірнеше жолда келсе, біріктіріледі"""
+        merged: Dict[int, int] = {}
+        for item in items:
+            merged[item["product_id"]] = merged.get(item["product_id"], 0) + item["quantity"]
+        return list(merged.items())
+
+    def plan(self, items: Iterable[Mapping]) -> AllocationPlan:
+        """Жоспар ғана (қалдық өзгермейді) — себетте жөнелтімдерді алдын ала көрсету үшін"""
+        lines = self._lines(items)
+        return plan_allocation(lines, self.availability([pid for pid, _ in lines]), self.warehouse_ids)
+
+    # ---- жазу
+    def reserve(self, items: Iterable[Mapping]) -> Either:
+        """
+        Жоспарлап, қоймалардан бір атомдық қадаммен шегеру. SharedStore.place_order(allocate=...)
+        үшін: сәтті болса Either.right(жөнелтімдер), әйтпесе Either.left(хабар).
+        """
+        lines = self._lines(items)
+        column = {wid: w for w, wid in enumerate(self.warehouse_ids)}
+        with self._lock:
+            zero = [0] * len(self.warehouses)
+            plan = plan_allocation(lines, [self._rows.get(pid, zero) for pid, _ in lines], self.warehouse_ids)
+            if not plan.is_complete:
+                pid, missing = next(iter(plan.shortages.items()))
+                return Either.left(f"Өнім {pid} қоймаларда жеткіліксіз ({missing} дана жетпейді)")
+            for shipment in plan.shipments:
+                w = column[shipment.warehouse_id]
+                for pid, quantity in shipment.items:
+                    self._rows[pid][w] -= quantity
+        return Either.right(plan.shipments)
+
+    def _reconcile(self, product_id: int, stock: int) -> None:
+        """Қосынды store-дағы stock-пен сәйкес келмесе: қосу — бірінші қоймаға, азайту — соңғыларынан"""
+        row = self._rows.get(product_id)
+        if row is None:
+            self._rows[product_id] = split_stock(stock, len(self.warehouses), product_id, self.spread)
+            return
+        delta = stock - sum(row)
+        if delta > 0:
+            row[0] += delta
+        for w in range(len(row) - 1, -1, -1):
+            if delta >= 0:
+                break
+            take = min(row[w], -delta)
+            row[w] -= take
+            delta += take
+
+    def on_store_event(self, event: str, record: Mapping) -> None:
+        with self._lock:
+            if event in ("product_added", "product_updated", "product_stock"):
+                self._reconcile(record["id"], record["stock"])
+            elif event == "product_deleted":
+                self._rows.pop(record["id"], None)
+
+_ledger: Optional[StockLedger] = None
+_ledger_lock = threading.Lock()
+
+def get_stock_ledger() -> StockLedger:
+    """Процесс деңгейіндегі қойма кітабы: бір рет толтырылады, кейін store оқиғаларымен түзетіледі"""
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None:
+            store = get_store()
+            _ledger = StockLedger()
+            store.subscribe(_ledger.on_store_event, snapshot=lambda s: _ledger.load(s.products()))
+        return _ledger